@@ -0,0 +1,73 @@
+# Copyright 2022 Expedia, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+r"""Compares the memory held by decoded responses, as pydantic models and as compact models.
+
+The compact model below is `OrderPurchaseScreenResponse` as the generator emits it with `--compact-responses`.
+Responses are decoded the way `ApiClient` does, and kept alive to measure what a batch holding them would use.
+Run from the repository root with `python -m benchmark.compact_responses`.
+"""
+
+import gc
+import time
+import tracemalloc
+from typing import Optional
+
+from pydantic import ConfigDict, Field, constr
+from pydantic.dataclasses import dataclass
+
+from expediagroup.sdk.core.model.api import _type_adapter
+from release.fraudPreventionV2.src import model
+
+RESPONSES: int = 100_000
+
+
+@dataclass(frozen=True, slots=True, kw_only=True, config=ConfigDict(extra="forbid"))
+class CompactOrderPurchaseScreenResponse:
+    r"""compact model OrderPurchaseScreenResponse"""
+
+    risk_id: Optional[constr(max_length=200)] = Field(None, example="1234567")
+    decision: Optional[model.FraudDecision] = None
+
+
+def _payloads(count: int) -> list[bytes]:
+    decisions = [decision.value for decision in model.FraudDecision]
+    return [f'{{"risk_id": "{index:09d}", "decision": "{decisions[index % len(decisions)]}"}}'.encode() for index in range(count)]
+
+
+def _measure(response_model: type, payloads: list[bytes]) -> tuple[float, float]:
+    adapter = _type_adapter(response_model)
+    adapter.validate_json(payloads[0])
+
+    gc.collect()
+    tracemalloc.start()
+    start: float = time.perf_counter()
+    responses = [adapter.validate_json(payload) for payload in payloads]
+    duration: float = time.perf_counter() - start
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert len(responses) == len(payloads)
+    return held / len(payloads), duration / len(payloads)
+
+
+def main():
+    payloads = _payloads(RESPONSES)
+    print(f"responses={RESPONSES} (memory extrapolated per million responses, decoding time traced)")
+    for name, response_model in (("pydantic", model.OrderPurchaseScreenResponse), ("compact", CompactOrderPurchaseScreenResponse)):
+        per_response, per_call = _measure(response_model, payloads)
+        print(f"  {name:>8}: {per_response:7.1f} B/response, {per_response * 1e6 / 2**20:8.1f} MiB/million, {per_call * 1e6:6.2f} us/decode")
+
+
+if __name__ == "__main__":
+    main()
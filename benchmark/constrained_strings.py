@@ -0,0 +1,71 @@
+# Copyright 2022 Expedia, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+r"""Measures the validation of request models, whose strings are checked by shared constrained types.
+
+Reports the time to import the models module, which builds every model validator, the request validation throughput
+per fixture size, and the cost of the pattern-constrained types under each of pydantic's regex engines.
+Run from the repository root with `python -m benchmark.constrained_strings`.
+"""
+
+import subprocess
+import sys
+import timeit
+
+from pydantic import ConfigDict, TypeAdapter
+
+from benchmark.fixtures import SIZES, order_purchase_screen_request
+from release.fraudPreventionV2.src import model
+
+REPEAT: int = 5
+
+IMPORT_STATEMENT: str = "import release.fraudPreventionV2.src.model"
+
+# A value matching each pattern-constrained type of the models module.
+PATTERN_SAMPLES: dict[str, str] = {
+    "StrPattern1": "USA",
+    "StrPattern2": "192.168.32.48",
+    "StrMax16Pattern4": "A1b2C3d4",
+    "StrMax20Pattern7": "12345678901234567890",
+    "StrPattern9": "en-US",
+}
+
+
+def _import_time() -> float:
+    # Each import runs in a fresh interpreter, so that the module is not cached yet.
+    timer = f"import time; start = time.perf_counter(); {IMPORT_STATEMENT}; print(time.perf_counter() - start)"
+    durations = [float(subprocess.run([sys.executable, "-c", timer], check=True, capture_output=True, text=True).stdout) for _ in range(REPEAT)]
+    return min(durations)
+
+
+def _per_call(function, number: int) -> float:
+    function()
+    return min(timeit.repeat(function, repeat=REPEAT, number=number)) / number * 1e6
+
+
+def main():
+    print(f"import models module: {_import_time() * 1e3:8.1f} ms")
+
+    for size in SIZES.keys():
+        payload = order_purchase_screen_request(size)
+        per_call = _per_call(lambda: model.OrderPurchaseScreenRequest.model_validate(payload), 200)  # noqa: B023
+        print(f"validate {size:>6} request: {per_call:8.1f} us/call, {1e6 / per_call:8.0f} requests/s")
+
+    for engine in ("rust-regex", "python-re"):
+        adapters = [(TypeAdapter(getattr(model, name), config=ConfigDict(regex_engine=engine)), value) for name, value in PATTERN_SAMPLES.items()]
+        per_call = _per_call(lambda: [adapter.validate_python(value) for adapter, value in adapters], 20_000) / len(adapters)  # noqa: B023
+        print(f"pattern check, {engine:>10}: {per_call * 1e3:8.1f} ns/value")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+# Copyright 2022 Expedia, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+r"""Measures the documentation generator on synthetic packages of hundreds of classes.
+
+Each class has attributes typed with other classes and nested type aliases of the package, which is what type aliases
+and cross-references are resolved in. Reports the time to load the package, to generate its whole documentation, and the part of it spent
+resolving cross-references, then the time to generate it again over unchanged files, with pages rendered in process and by
+one worker process per CPU. The package is then split into more and more modules, to measure the time and memory it
+takes to load it and index its module tree. Finally, packages are loaded with a module cache, then reloaded from it.
+Requires the documentation generator dependencies, run from the repository root with
+`python -m benchmark.docs_generation`.
+"""
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+import warnings
+from pathlib import Path
+
+DOCSGEN_DIR: Path = Path(__file__).parents[1] / "expediagroup" / "sdk" / "docsgen"
+
+# The documentation generator runs as a script, its modules import each other by their flat names.
+sys.path.insert(0, str(DOCSGEN_DIR))
+
+from generator import ExpediaGroupDocumentationGenerator  # noqa: E402
+from pydoc_markdown.contrib.loaders.python import PythonLoader  # noqa: E402
+from pydoc_markdown.interfaces import Context  # noqa: E402
+from resolver import CrossReferenceResolver  # noqa: E402
+
+# Number of classes of each generated package.
+CLASSES: tuple[int, ...] = (100, 400, 1_000)
+
+# One type alias is defined every `ALIAS_EVERY` classes.
+ALIAS_EVERY: int = 10
+
+# Number of loads from a warm module cache, the fastest is reported.
+REPEAT: int = 3
+
+# Number of modules the classes of the largest package are split into.
+MODULES: tuple[int, ...] = (10, 100, 1_000)
+
+
+def synthetic_package(directory: Path, classes: int, modules: int = 1) -> Path:
+    r"""Writes a package of `modules` modules defining `classes` pydantic models referencing each other.
+
+    Args:
+        directory (Path): Where the package is written.
+        classes (int): Number of classes.
+        modules (int): Number of modules the classes are split into, half of them in a subpackage.
+
+    Returns:
+        Path: The package directory.
+    """
+    package: Path = directory / "synthetic"
+    (package / "nested").mkdir(parents=True)
+    (package / "__init__.py").write_text("")
+    (package / "nested" / "__init__.py").write_text("")
+
+    per_module: int = -(-classes // modules)
+    for module in range(modules):
+        path: Path = package / ("nested" if module % 2 else "") / f"models{module}.py"
+        path.write_text(_synthetic_module(range(module * per_module, min(classes, (module + 1) * per_module)), classes))
+
+    return package
+
+
+def _synthetic_module(indices: range, classes: int) -> str:
+    lines: list[str] = ["from __future__ import annotations", "", "from typing import Optional, Union", "", "from pydantic import BaseModel", ""]
+    for index in indices:
+        if index % ALIAS_EVERY:
+            continue
+        # Aliases nest, each one refers to the alias defined for half its index, down to the first one.
+        nested: str = f", Alias{(index // 2 // ALIAS_EVERY) * ALIAS_EVERY}" if index else ""
+        lines.append(f"Alias{index} = Union[Model{index}, Model{(index + 1) % classes}{nested}]")
+    for index in indices:
+        lines.extend(
+            [
+                "",
+                "",
+                f"class Model{index}(BaseModel):",
+                f'    r"""pydantic model Model{index}: Refers to Model{(index + 1) % classes} and Model{(index * 7) % classes}."""',
+                "",
+                "    id: Optional[str] = None",
+                f"    parent: Optional[Model{(index + 1) % classes}] = None",
+                f"    children: list[Model{(index * 7) % classes}] = []",
+                f"    either: Union[Model{(index * 13) % classes}, Model{(index * 17) % classes}, None] = None",
+                f"    alias: Optional[Alias{(index // ALIAS_EVERY) * ALIAS_EVERY}] = None",
+            ]
+        )
+
+    return "\n".join(lines) + "\n"
+
+
+def documentation_generator(package: Path, **options) -> ExpediaGroupDocumentationGenerator:
+    r"""Loads a package the way the documentation generator command does, with the given generator options."""
+    return ExpediaGroupDocumentationGenerator(
+        context=Context(directory=str(package.parent)),
+        loader=PythonLoader(search_path=[str(package.parent)]),
+        templates_path=DOCSGEN_DIR / "templates",
+        package_name=package.name,
+        **options,
+    )
+
+
+def cached_load(package: Path, cache_dir: Path) -> tuple[float, float]:
+    r"""Loads a package with a module cache, returning the duration of the first load and the best of the next ones."""
+    durations: list[float] = []
+    for _ in range(REPEAT + 1):
+        start: float = time.perf_counter()
+        documentation_generator(package, cache_dir=cache_dir)
+        durations.append(time.perf_counter() - start)
+
+    return durations[0], min(durations[1:])
+
+
+def load(package: Path) -> tuple[float, int]:
+    r"""Loads a package the way the documentation generator does, returning the duration and the peak memory traced."""
+    start: float = time.perf_counter()
+    documentation_generator(package)
+    duration: float = time.perf_counter() - start
+
+    # Memory is traced in another run, tracing slows the load down.
+    tracemalloc.start()
+    documentation_generator(package)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return duration, peak
+
+
+def generate(package: Path, output: Path, workers: int = 1) -> dict[str, float]:
+    r"""Generates the documentation of a package twice, returning the duration of each step in seconds."""
+    durations: dict[str, float] = dict()
+
+    start: float = time.perf_counter()
+    generator = documentation_generator(package, workers=workers)
+    durations["load"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    generator.generate(output_path=output)
+    durations["generate"] = time.perf_counter() - start
+
+    # Every page is rendered again, none is written.
+    start = time.perf_counter()
+    written = generator.generate(output_path=output)
+    durations["regenerate"] = time.perf_counter() - start
+    assert not any(written.values())
+
+    # Cross-references are resolved again by a fresh resolver, over the texts the class template resolves.
+    texts: list[str] = [
+        text
+        for module in generator.modules
+        for class_ in module.classes
+        for text in [attribute.datatype for attribute in class_.attributes] + [" > ".join(class_.bases)]
+    ]
+    start = time.perf_counter()
+    resolver = CrossReferenceResolver(modules=generator.modules)
+    for text in texts:
+        resolver.resolve(text)
+    durations["resolve"] = time.perf_counter() - start
+
+    return durations
+
+
+def main():
+    warnings.filterwarnings("ignore")
+    for classes in CLASSES:
+        for workers in sorted({1, os.cpu_count() or 1}):
+            with tempfile.TemporaryDirectory() as directory:
+                package = synthetic_package(Path(directory), classes)
+                durations = generate(package, Path(directory) / "docs", workers=workers)
+            steps = ", ".join(f"{name} {duration:7.3f}s" for name, duration in durations.items())
+            print(f"classes={classes:>5}, workers={workers:>2}: {steps}")
+
+    for modules in MODULES:
+        with tempfile.TemporaryDirectory() as directory:
+            duration, peak = load(synthetic_package(Path(directory), CLASSES[-1], modules))
+        print(f"classes={CLASSES[-1]:>5}, modules={modules:>5}: load {duration:7.3f}s, peak {peak / 2**20:7.1f} MiB")
+
+    for classes in CLASSES:
+        with tempfile.TemporaryDirectory() as directory:
+            cold, warm = cached_load(synthetic_package(Path(directory), classes), Path(directory) / "cache")
+        print(f"classes={classes:>5}, cached: load {cold:7.3f}s, reload {warm:7.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# Copyright 2022 Expedia, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+r"""Compares the markdown tables of the documentation generator with the `PrettyTable` they replace.
+
+Tables are the attribute tables of large models: one row per attribute, with a name, a resolved type, whether it is
+required and a description, in which types, flags and descriptions repeat the way they do across a generated package.
+Run from the repository root with `python -m benchmark.docs_tables`.
+"""
+
+import sys
+import timeit
+import warnings
+from pathlib import Path
+
+DOCSGEN_DIR: Path = Path(__file__).parents[1] / "expediagroup" / "sdk" / "docsgen"
+
+# The documentation generator runs as a script, its modules import each other by their flat names.
+sys.path.insert(0, str(DOCSGEN_DIR))
+
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore", SyntaxWarning)
+    from markdown_prettytable import PrettyTable  # noqa: E402
+
+from table import render_table  # noqa: E402
+
+REPEAT: int = 5
+
+FIELD_NAMES: list[str] = ["Name", "Type", "Required", "Description"]
+
+# Number of attributes of each model.
+ATTRIBUTES: tuple[int, ...] = (10, 100, 1_000)
+
+TYPES: tuple[str, ...] = (
+    "Optional[Annotated[str, StringConstraints(max_length=200)]]",
+    "Optional[[Address](Address.md)]",
+    "list[[TravelProduct](TravelProduct.md)]",
+    "Optional[datetime]",
+)
+
+
+def attribute_rows(attributes: int) -> list[list]:
+    r"""Builds the rows of the attribute table of a model of `attributes` attributes."""
+    return [
+        [f"attribute_{index}", TYPES[index % len(TYPES)], bool(index % 3), f"Attribute {index % 20} of the model, see the specification."]
+        for index in range(attributes)
+    ]
+
+
+def prettytable(field_names: list[str], rows: list[list]) -> str:
+    r"""Renders a table the way the documentation generator used to."""
+    table = PrettyTable(field_names=field_names)
+    for row in rows:
+        table.add_row(row)
+    return str(table)
+
+
+def main():
+    for attributes in ATTRIBUTES:
+        rows = attribute_rows(attributes)
+        assert render_table(FIELD_NAMES, rows) == prettytable(FIELD_NAMES, rows)
+
+        number: int = max(1, 10_000 // attributes)
+        durations: dict[str, float] = {
+            name: min(timeit.repeat(lambda: function(FIELD_NAMES, rows), repeat=REPEAT, number=number)) / number * 1e6  # noqa: B023
+            for name, function in (("prettytable", prettytable), ("render_table", render_table))
+        }
+        timings = ", ".join(f"{name} {duration:10.1f} us" for name, duration in durations.items())
+        print(f"attributes={attributes:>5}: {timings}, {durations['prettytable'] / durations['render_table']:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+# Copyright 2022 Expedia, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+r"""Fraud Prevention V2 payloads shared by the benchmarks."""
+
+from typing import Any
+
+SIZES: dict[str, int] = {"small": 1, "medium": 5, "large": 30}
+r"""Number of payments, travelers and hotels of an order, by fixture size."""
+
+_TELEPHONE: dict[str, Any] = {"type": "HOME", "country_access_code": "1", "area_code": "234", "phone_number": "5678900"}
+
+_ADDRESS: dict[str, Any] = {"address_line1": "1111 Expedia Group Way West", "city": "Seattle", "state": "WA", "zip_code": "98119", "country_code": "USA"}
+
+_NAME: dict[str, Any] = {"first_name": "John", "last_name": "Smith"}
+
+
+def _payment(index: int) -> dict[str, Any]:
+    common: dict[str, Any] = {
+        "brand": "VISA",
+        "billing_name": _NAME,
+        "billing_address": _ADDRESS,
+        "billing_email_address": "john.smith@example.com",
+        "authorized_amount": {"value": 100.0 + index, "currency_code": "USD"},
+    }
+    kind: int = index % 3
+    if kind == 0:
+        return {
+            **common,
+            "method": "CREDIT_CARD",
+            "card_type": "VISA",
+            "card_number": f"41111111111{index:05d}",
+            "expiry_date": "2030-01-01T00:00:00Z",
+            "card_avs_response": "Y",
+            "card_cvv_response": "M",
+            "telephones": [_TELEPHONE],
+        }
+    if kind == 1:
+        return {**common, "method": "GIFT_CARD", "card_number": f"GIFT{index:08d}", "pin": "123456"}
+
+    return {**common, "method": "DIRECT_DEBIT", "brand": "SEPA_ELV", "account_number": f"DE89370400440532{index:06d}", "telephones": [_TELEPHONE]}
+
+
+def _hotel(index: int) -> dict[str, Any]:
+    return {
+        "type": "HOTEL",
+        "price": {"value": 250.0, "currency_code": "USD"},
+        "inventory_type": "Merchant",
+        "inventory_source": "MERCHANT",
+        "travelers_references": [f"traveler-{index}"],
+        "hotel_id": f"hotel-{index}",
+        "hotel_name": "Expedia Group Hotel",
+        "room_count": 1,
+        "address": _ADDRESS,
+        "checkin_time": "2030-01-01T15:00:00Z",
+        "checkout_time": "2030-01-03T11:00:00Z",
+    }
+
+
+def _traveler(index: int) -> dict[str, Any]:
+    return {
+        "traveler_name": _NAME,
+        "email_address": "john.smith@example.com",
+        "telephones": [_TELEPHONE],
+        "primary": index == 0,
+        "traveler_id": f"traveler-{index}",
+    }
+
+
+def order_purchase_screen_request(size: str) -> dict[str, Any]:
+    r"""Builds the JSON-compatible payload of an `OrderPurchaseScreenRequest`.
+
+    Args:
+        size (str): One of `SIZES`.
+
+    Returns:
+        dict[str, Any]: The payload, with snake cased field names.
+    """
+    count: int = SIZES[size]
+    return {
+        "transaction": {
+            "site_info": {"country_code": "USA", "agent_assisted": False},
+            "device_details": {"device_box": "device-box", "ip_address": "192.168.0.1"},
+            "customer_account": {
+                "account_type": "STANDARD",
+                "name": _NAME,
+                "email_address": "john.smith@example.com",
+                "telephones": [_TELEPHONE],
+                "address": _ADDRESS,
+            },
+            "transaction_details": {
+                "order_id": "order-1",
+                "current_order_status": "IN_PROGRESS",
+                "order_type": "CREATE",
+                "travel_products": [_hotel(index) for index in range(count)],
+                "travelers": [_traveler(index) for index in range(count)],
+                "payments": [_payment(index) for index in range(count)],
+            },
+        }
+    }
+
+
+def order_purchase_update_request() -> dict[str, Any]:
+    r"""Builds the JSON-compatible payload of an `OrderPurchaseUpdateRequest`, an order status update."""
+    return {"type": "ORDER_UPDATE", "risk_id": "1234567", "order_status": "COMPLETED"}
+
+
+def account_screen_request() -> dict[str, Any]:
+    r"""Builds the JSON-compatible payload of an `AccountScreenRequest`, a successful login."""
+    return {
+        "transaction": {
+            "site_info": {"locale": "en-US", "name": "expedia.com", "brand_name": "Expedia", "placement_name": "LOGIN"},
+            "device_details": {"device_box": "device-box", "ip_address": "192.168.0.1", "user_agent": "Mozilla/5.0", "type": "WEBSITE"},
+            "customer_account": {
+                "user_id": "1234567",
+                "account_type": "INDIVIDUAL",
+                "account_role": "USER",
+                "name": _NAME,
+                "username": "jsmith",
+                "email_address": "john.smith@example.com",
+                "registered_time": "2024-01-01T00:00:00Z",
+                "active_flag": True,
+            },
+            "transaction_details": {
+                "type": "LOGIN",
+                "transaction_date_time": "2024-01-01T00:00:00Z",
+                "transaction_id": "transaction-1",
+                "current_user_session": {"session_id": "session-1", "start_date_time": "2024-01-01T00:00:00Z"},
+                "authentication_type": "CREDENTIALS",
+                "authentication_sub_type": "EMAIL",
+                "successful_login_flag": True,
+            },
+        }
+    }
+
+
+def account_update_request() -> dict[str, Any]:
+    r"""Builds the JSON-compatible payload of an `AccountUpdateRequest`, a multi-factor authentication update."""
+    return {
+        "type": "MULTI_FACTOR_AUTHENTICATION_UPDATE",
+        "risk_id": "1234567",
+        "multi_factor_authentication_attempts": [
+            {"delivery_method": "EMAIL", "status": "SUCCESS", "reference_id": "reference-1", "provider_name": "Telesign", "attempt_count": 1}
+        ],
+    }
@@ -0,0 +1,130 @@
+# Copyright 2022 Expedia, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+r"""Measures the generator visitors on synthetic specs with thousands of schemas.
+
+Schemas come in discriminated hierarchies, a parent with a `type` discriminator and several children inheriting it
+through `allOf`, which is the shape the `models` visitor does the most work for. Only parsing and visiting are
+measured, rendering and formatting do not depend on the visitors. Requires the generator dependencies, run from the
+repository root with `python -m benchmark.generator_models`.
+"""
+
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+GENERATOR_DIR: Path = Path(__file__).parents[1] / "expediagroup" / "sdk" / "generator" / "client"
+
+# The generator runs as a script, its modules import each other by their flat names.
+sys.path.insert(0, str(GENERATOR_DIR))
+
+from parser import OpenApiParser  # noqa: E402
+
+from fastapi_code_generator.__main__ import dynamic_load_module  # noqa: E402
+
+CHILDREN_PER_PARENT: int = 4
+
+# Number of schemas of each generated spec.
+SCHEMAS: tuple[int, ...] = (250, 1_000, 4_000)
+
+
+def synthetic_spec(schemas: int, inline_models: int = 0) -> str:
+    r"""Builds an OpenAPI spec of about `schemas` schemas, in discriminated hierarchies.
+
+    Args:
+        schemas (int): Number of schemas.
+        inline_models (int): Number of operations with an inline query parameter model, those are parsed as models
+            defined under `#/paths/` rather than in `components`.
+
+    Returns:
+        str: The spec, as YAML.
+    """
+    components: dict[str, Any] = dict()
+    parents: int = max(1, schemas // (CHILDREN_PER_PARENT + 1))
+    for parent in range(parents):
+        components[f"Parent{parent}"] = {
+            "type": "object",
+            "required": ["type"],
+            "properties": {"type": {"type": "string"}, "id": {"type": "string"}},
+            "discriminator": {"propertyName": "type"},
+        }
+        for child in range(CHILDREN_PER_PARENT):
+            components[f"Parent{parent}Child{child}"] = {
+                "allOf": [
+                    {"$ref": f"#/components/schemas/Parent{parent}"},
+                    {"type": "object", "properties": {f"value{child}": {"type": "integer"}}},
+                ]
+            }
+    components["Container"] = {
+        "type": "object",
+        "properties": {f"items{parent}": {"type": "array", "items": {"$ref": f"#/components/schemas/Parent{parent}"}} for parent in range(parents)},
+    }
+
+    paths: dict[str, Any] = {
+        "/containers": {
+            "post": {
+                "operationId": "createContainer",
+                "requestBody": {"content": {"application/json": {"schema": {"$ref": "#/components/schemas/Container"}}}},
+                "responses": {"200": {"description": "OK", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Container"}}}}},
+            }
+        }
+    }
+    for index in range(inline_models):
+        paths[f"/items{index}"] = {
+            "get": {
+                "operationId": f"getItems{index}",
+                "parameters": [
+                    {
+                        "name": "filter",
+                        "in": "query",
+                        "schema": {"type": "object", "properties": {"name": {"type": "string"}, f"rank{index}": {"type": "integer"}}},
+                    }
+                ],
+                "responses": {"200": {"description": "OK", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Container"}}}}},
+            }
+        }
+
+    return yaml.safe_dump({"openapi": "3.0.1", "info": {"title": "Synthetic", "version": "1.0.0"}, "paths": paths, "components": {"schemas": components}})
+
+
+def visit(spec: str) -> dict[str, float]:
+    r"""Parses a spec and runs the builtin visitors in order, returning the duration of each step in seconds."""
+    durations: dict[str, float] = dict()
+
+    start: float = time.perf_counter()
+    parser = OpenApiParser(spec)
+    parser.collapse_root_models = True
+    parser.parse()
+    durations["parse"] = time.perf_counter() - start
+
+    modules = [dynamic_load_module(path) for path in (GENERATOR_DIR / "visitors").glob("*.py")]
+    for module in sorted(modules, key=lambda module_: getattr(module_, "order", int(1e18))):
+        start = time.perf_counter()
+        module.visit(parser, Path("model.py"))
+        durations[Path(module.__file__).stem] = time.perf_counter() - start
+
+    return durations
+
+
+def main():
+    for schemas in SCHEMAS:
+        durations = visit(synthetic_spec(schemas))
+        steps = ", ".join(f"{name} {duration:7.3f}s" for name, duration in durations.items() if name in ("parse", "operations", "models"))
+        print(f"schemas={schemas:>5}: {steps}")
+
+
+if __name__ == "__main__":
+    main()
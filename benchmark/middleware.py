@@ -0,0 +1,89 @@
+# Copyright 2022 Expedia, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+r"""Measures the per-call overhead of the `ApiClient` middleware chain.
+
+The transport is replaced with a function returning a canned response, so the numbers only reflect the client's own
+work. Run from the repository root with `python -m benchmark.middleware`.
+"""
+
+import logging
+import timeit
+from http import HTTPStatus
+from unittest import mock
+
+import requests
+from pydantic import BaseModel
+
+from expediagroup.sdk.core.client.api import ApiClient
+from expediagroup.sdk.core.client.auth_client import AuthClient
+from expediagroup.sdk.core.client.middleware import Middleware
+from expediagroup.sdk.core.configuration.client_config import ClientConfig
+
+ITERATIONS: int = 20_000
+REPEAT: int = 5
+
+
+class Message(BaseModel):
+    message: str
+
+
+class _StubAuthClient(AuthClient):
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def refresh_token(self):
+        pass
+
+    access_token = None
+    auth_header = None
+    is_token_expired = False
+    is_token_about_expired = False
+
+
+class _PassThroughMiddleware(Middleware):
+    def __call__(self, request, call_next):
+        return call_next(request)
+
+
+def _canned_response() -> requests.Response:
+    response = requests.Response()
+    response.status_code = HTTPStatus.OK
+    response.headers = dict()
+    response._content = Message(message="Hello, World!").model_dump_json().encode()
+    return response
+
+
+def _client(middlewares_count: int) -> ApiClient:
+    config = ClientConfig(key="key", secret="secret", middlewares=[_PassThroughMiddleware() for _ in range(middlewares_count)])
+    return ApiClient(config, _StubAuthClient)
+
+
+def main():
+    logging.getLogger("expediagroup.sdk.core.client.api").setLevel(logging.WARNING)
+    response = _canned_response()
+    body = Message(message="ping")
+
+    with mock.patch("expediagroup.sdk.core.client.api.requests.request", lambda **kwargs: response):
+        baseline = None
+        for middlewares_count in (0, 1, 5):
+            client = _client(middlewares_count)
+            timer = timeit.Timer(lambda: client.call(method="post", url="https://localhost/", body=body, response_models=[Message]))  # noqa: B023
+            timer.timeit(number=ITERATIONS // 10)
+            per_call = min(timer.repeat(repeat=REPEAT, number=ITERATIONS)) / ITERATIONS * 1e6
+            baseline = baseline if baseline is not None else per_call
+            print(f"middlewares={middlewares_count}: {per_call:8.2f} us/call ({per_call - baseline:+.2f} us)")
+
+
+if __name__ == "__main__":
+    main()
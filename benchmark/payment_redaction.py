@@ -0,0 +1,92 @@
+# Copyright 2022 Expedia, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+r"""Compares validate-and-dump of payments with and without the former `SecretStr` field validators.
+
+Payments used to wrap their sensitive fields in `SecretStr` through Python field validators, and to unwrap them on
+every dump through `json_encoders`. The legacy models below restore that behaviour on top of the generated ones.
+Run from the repository root with `python -m benchmark.payment_redaction`.
+"""
+
+import timeit
+import warnings
+from typing import Any, Union
+
+from pydantic import ConfigDict, SecretStr, TypeAdapter, field_validator
+
+from benchmark.fixtures import SIZES, order_purchase_screen_request
+from expediagroup.sdk.core.util import log as log_util
+from release.fraudPreventionV2.src import model
+
+REPEAT: int = 5
+
+_LEGACY_CONFIG = ConfigDict(extra="forbid", json_encoders={SecretStr: lambda v: v.get_secret_value() if v else None})
+
+
+class _LegacyCreditCard(model.CreditCard):
+    model_config = _LEGACY_CONFIG
+
+    @field_validator("card_number", "card_cvv_response", "card_avs_response")
+    def __secret_validator(cls, value):
+        return SecretStr(str(value))
+
+
+class _LegacyGiftCard(model.GiftCard):
+    model_config = _LEGACY_CONFIG
+
+    @field_validator("pin")
+    def __secret_validator(cls, value):
+        return SecretStr(str(value))
+
+
+class _LegacyDirectDebit(model.DirectDebit):
+    model_config = _LEGACY_CONFIG
+
+    @field_validator("account_number")
+    def __secret_validator(cls, value):
+        return SecretStr(str(value))
+
+
+_ADAPTERS: dict[str, TypeAdapter] = {
+    "legacy": TypeAdapter(list[Union[_LegacyCreditCard, _LegacyGiftCard, _LegacyDirectDebit]]),
+    "current": TypeAdapter(list[Union[model.CreditCard, model.GiftCard, model.DirectDebit]]),
+}
+
+
+def _payments(size: str) -> list[dict[str, Any]]:
+    return order_purchase_screen_request(size)["transaction"]["transaction_details"]["payments"]
+
+
+def _per_call(function, number: int) -> float:
+    function()
+    return min(timeit.repeat(function, repeat=REPEAT, number=number)) / number * 1e6
+
+
+def main():
+    # The legacy models make pydantic warn on every dump, printing those would dominate the measure.
+    warnings.simplefilter("ignore")
+    for size in SIZES.keys():
+        payments = _payments(size)
+        number = max(50, 2_000 // len(payments))
+        print(f"payments={len(payments)}")
+        for name, adapter in _ADAPTERS.items():
+            per_call = _per_call(lambda: adapter.dump_json(adapter.validate_python(payments), exclude_none=True), number)  # noqa: B023
+            print(f"  {name:>8} validate and dump: {per_call:9.1f} us/call")
+
+        request = model.OrderPurchaseScreenRequest.model_validate(order_purchase_screen_request(size))
+        per_call = _per_call(lambda: str(log_util.redacted_dump(request)), number)  # noqa: B023
+        print(f"  {'current':>8} redacted log dump: {per_call:9.1f} us/call")
+
+
+if __name__ == "__main__":
+    main()
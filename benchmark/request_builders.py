@@ -0,0 +1,59 @@
+# Copyright 2022 Expedia, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+r"""Compares the ways of building a request body from plain data: as a model, and as a `PreparedBody`.
+
+A model validates every nested object before being serialized, a prepared body serializes the data as is, or after
+validating it when asked to, and a passed through body is JSON already serialized upstream, parsed into a model only
+to be serialized back on the model path. Bodies are built from the `OrderPurchaseScreenRequest` fixtures.
+Run from the repository root with `python -m benchmark.request_builders`.
+"""
+
+import json
+import timeit
+
+from benchmark.fixtures import SIZES, order_purchase_screen_request
+from release.fraudPreventionV2.src import model
+
+REPEAT: int = 5
+
+
+def _per_call(function, number: int) -> float:
+    function()
+    return min(timeit.repeat(function, repeat=REPEAT, number=number)) / number * 1e6
+
+
+def main():
+    request_model = model.OrderPurchaseScreenRequest
+    for size in SIZES.keys():
+        payload = order_purchase_screen_request(size)
+        expected = json.loads(request_model.model_validate(payload).model_dump_json(exclude_none=True))
+        assert json.loads(request_model.prepare(payload).content) == expected
+        content: bytes = json.dumps(expected).encode()
+
+        builders = {
+            "model": lambda: request_model.model_validate(payload).model_dump_json(exclude_none=True),  # noqa: B023
+            "prepared, validated": lambda: request_model.prepare(payload, validate=True),  # noqa: B023
+            "prepared": lambda: request_model.prepare(payload),  # noqa: B023
+            "model from JSON": lambda: request_model.model_validate_json(content).model_dump_json(exclude_none=True),  # noqa: B023
+            "passed through": lambda: request_model.prepare(content),  # noqa: B023
+        }
+        baseline: float = 0.0
+        for name, builder in builders.items():
+            per_call = _per_call(builder, 100)
+            baseline = baseline or per_call
+            print(f"{size:>6} request, {name:>19}: {per_call:9.1f} us/call, {baseline / per_call:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+# Copyright 2022 Expedia, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+r"""Measures the request path of the SDK, from the generated client method to the decoded response.
+
+Calls go to the local stand-in of `expediagroup.sdk.bench.stand_in`, over loopback HTTP, with `OrderPurchaseScreenRequest`
+bodies of each fixture size, as models and as prepared bodies. The client's own work is also measured with the
+transport replaced by a canned response, and token refresh with tokens expiring before every call. Each case reports
+its throughput, its p50 and p99 latencies, and the peak memory traced during a call, and the import time of the client
+module is reported last.
+
+Results are saved as JSON with `--save`, and compared to saved results with `--compare`, which exits with an error
+when a case got slower than `--threshold`. Run from the repository root with `python -m benchmark.request_path`.
+"""
+
+import argparse
+import json
+import logging
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any, Optional
+from unittest import mock
+
+import requests
+
+from benchmark.fixtures import SIZES, order_purchase_screen_request
+from expediagroup.sdk.bench.stand_in import StandInServer
+from expediagroup.sdk.core.configuration.client_config import ClientConfig
+from release.fraudPreventionV2.src import model
+from release.fraudPreventionV2.src.client import FraudPreventionV2Client
+
+IMPORT_STATEMENT: str = "import release.fraudPreventionV2.src.client"
+
+# Calls made before measuring a case, to warm up caches and connections.
+WARMUP: int = 20
+
+# Calls traced to measure the memory of a case, tracing slows calls down.
+TRACED_CALLS: int = 20
+
+# Canned transport calls are this many times more numerous than HTTP calls, being that much faster.
+CANNED_FACTOR: int = 10
+
+# The fastest of these import times is reported.
+IMPORT_REPEAT: int = 5
+
+
+@dataclass
+class Result:
+    r"""Measurements of a benchmark case."""
+
+    requests_per_second: float
+    p50_us: float
+    p99_us: float
+    peak_kib_per_call: float
+
+
+def measure(function: Callable[[], Any], iterations: int) -> Result:
+    r"""Calls a function repeatedly, timing each call, then traces the memory of a few more calls."""
+    for _ in range(WARMUP):
+        function()
+
+    latencies: list[int] = []
+    start: float = time.perf_counter()
+    for _ in range(iterations):
+        call_start: int = time.perf_counter_ns()
+        function()
+        latencies.append(time.perf_counter_ns() - call_start)
+    duration: float = time.perf_counter() - start
+
+    # The peak is taken relative to the memory traced when the call starts, it is what a call allocates at most.
+    peaks: list[int] = []
+    tracemalloc.start()
+    for _ in range(TRACED_CALLS):
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        function()
+        peaks.append(tracemalloc.get_traced_memory()[1] - before)
+    tracemalloc.stop()
+
+    percentiles: list[float] = statistics.quantiles(latencies, n=100, method="inclusive")
+    return Result(
+        requests_per_second=iterations / duration,
+        p50_us=percentiles[49] / 1e3,
+        p99_us=percentiles[98] / 1e3,
+        peak_kib_per_call=statistics.median(peaks) / 1024,
+    )
+
+
+def import_time() -> float:
+    r"""Returns the time to import the client module in a fresh interpreter, in milliseconds."""
+    timer = f"import time; start = time.perf_counter(); {IMPORT_STATEMENT}; print(time.perf_counter() - start)"
+    durations = [float(subprocess.run([sys.executable, "-c", timer], check=True, capture_output=True, text=True).stdout) for _ in range(IMPORT_REPEAT)]
+    return min(durations) * 1e3
+
+
+def _client(server: StandInServer) -> FraudPreventionV2Client:
+    return FraudPreventionV2Client(ClientConfig(key="key", secret="secret", endpoint=server.endpoint, auth_endpoint=server.auth_endpoint))
+
+
+def _canned_response() -> requests.Response:
+    response = requests.Response()
+    response.status_code = HTTPStatus.OK
+    response.headers = {"Content-Type": "application/json"}
+    response._content = model.OrderPurchaseScreenResponse(risk_id="1234567", decision=model.FraudDecision.ACCEPT).model_dump_json().encode()
+    return response
+
+
+def run(iterations: int) -> dict[str, Result]:
+    r"""Runs every case, returning their results by name."""
+    results: dict[str, Result] = dict()
+    payloads: dict[str, dict[str, Any]] = {size: order_purchase_screen_request(size) for size in SIZES.keys()}
+
+    with StandInServer() as server:
+        client = _client(server)
+        for size, payload in payloads.items():
+            body = model.OrderPurchaseScreenRequest.model_validate(payload)
+            results[f"http, {size} model"] = measure(lambda: client.screen_order(body), iterations)  # noqa: B023
+            prepare = model.OrderPurchaseScreenRequest.prepare
+            results[f"http, {size} prepared"] = measure(lambda: client.screen_order(prepare(payload)), iterations)  # noqa: B023
+
+        # The transport is replaced once the client got its token, only the client's own work is left.
+        response: requests.Response = _canned_response()
+        with mock.patch("expediagroup.sdk.core.client.api.requests.request", lambda **kwargs: response):
+            for size, payload in payloads.items():
+                body = model.OrderPurchaseScreenRequest.model_validate(payload)
+                results[f"canned, {size} model"] = measure(lambda: client.screen_order(body), iterations * CANNED_FACTOR)  # noqa: B023
+
+    # Tokens expiring within the refresh time gap are refreshed before every call.
+    with StandInServer(token_expires_in=0) as server:
+        client = _client(server)
+        body = model.OrderPurchaseScreenRequest.model_validate(payloads["small"])
+        results["http, small model, token refresh"] = measure(lambda: client.screen_order(body), iterations)
+
+    return results
+
+
+def compare(results: dict[str, Any], baseline: dict[str, Any], threshold: float) -> list[str]:
+    r"""Prints how results changed from a baseline, returning the cases which got slower than the threshold."""
+    regressions: list[str] = []
+    for name, result in results["cases"].items():
+        base: Optional[dict[str, float]] = baseline["cases"].get(name)
+        if not base:
+            continue
+
+        changes: dict[str, float] = {key: result[key] / base[key] - 1 for key in ("requests_per_second", "p50_us", "p99_us")}
+        regressed: bool = changes["requests_per_second"] < -threshold or changes["p50_us"] > threshold
+        if regressed:
+            regressions.append(name)
+        print(
+            f"{name:>34}: {changes['requests_per_second']:+7.1%} req/s, {changes['p50_us']:+7.1%} p50, {changes['p99_us']:+7.1%} p99"
+            + ("  REGRESSION" if regressed else "")
+        )
+
+    change: float = results["import_ms"] / baseline["import_ms"] - 1
+    print(f"{'import client':>34}: {change:+7.1%}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=500, help="Calls measured per HTTP case.")
+    parser.add_argument("--save", type=Path, help="Where to save the results, as JSON.")
+    parser.add_argument("--compare", type=Path, help="Results saved by a previous run, to compare with.")
+    parser.add_argument("--threshold", type=float, default=0.1, help="Relative slowdown reported as a regression.")
+    arguments = parser.parse_args()
+
+    # The SDK logs every exchange at INFO level, which would be measured as well.
+    logging.getLogger("expediagroup").setLevel(logging.WARNING)
+
+    cases: dict[str, Result] = run(arguments.iterations)
+    for name, result in cases.items():
+        print(
+            f"{name:>34}: {result.requests_per_second:9.1f} req/s, p50 {result.p50_us:9.1f} us, p99 {result.p99_us:9.1f} us, "
+            f"{result.peak_kib_per_call:7.1f} KiB/call"
+        )
+    results: dict[str, Any] = {
+        "python": platform.python_version(),
+        "import_ms": import_time(),
+        "cases": {name: asdict(result) for name, result in cases.items()},
+    }
+    print(f"{'import client':>34}: {results['import_ms']:9.1f} ms")
+
+    if arguments.save:
+        arguments.save.write_text(json.dumps(results, indent=2))
+
+    if arguments.compare:
+        regressions = compare(results, json.loads(arguments.compare.read_text()), arguments.threshold)
+        if regressions:
+            sys.exit(f"{len(regressions)} cases regressed by more than {arguments.threshold:.0%}: {', '.join(regressions)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+# Copyright 2022 Expedia, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+r"""Compares response decoding before and after streaming the body to bytes.
+
+The previous path decoded the whole body to text for logging, parsed it to Python objects with `response.json()` and
+validated those with a freshly built `TypeAdapter`. The current path reads the body in chunks, logs a bounded prefix
+and validates the raw bytes directly. Run from the repository root with `python -m benchmark.response_decoding`.
+"""
+
+import io
+import timeit
+import tracemalloc
+from http import HTTPStatus
+from typing import Optional
+
+import requests
+from pydantic import BaseModel, TypeAdapter
+
+from expediagroup.sdk.core.client.api import ApiClient
+from expediagroup.sdk.core.model.api import _type_adapter
+from expediagroup.sdk.core.util import log as log_util
+
+REPEAT: int = 5
+
+
+class Item(BaseModel):
+    id: str
+    name: str
+    price: float
+    tags: list[str]
+    description: Optional[str] = None
+
+
+class Response(BaseModel):
+    items: list[Item]
+
+
+def _payload(items_count: int) -> bytes:
+    items = [Item(id=str(index), name=f"item-{index}", price=index * 1.5, tags=["a", "b", "c"], description="x" * 64) for index in range(items_count)]
+    return Response(items=items).model_dump_json().encode()
+
+
+def _streamed_response(payload: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = HTTPStatus.OK
+    response.headers = dict()
+    response.raw = io.BytesIO(payload)
+    return response
+
+
+def _previous(payload: bytes):
+    response = _streamed_response(payload)
+    logged = response.text
+    return TypeAdapter(Response).validate_python(response.json()), logged
+
+
+def _current(payload: bytes):
+    response = _streamed_response(payload)
+    content = ApiClient._ApiClient__read_content(response)
+    logged = log_util.body_log(content, response.encoding)
+    return _type_adapter(Response).validate_json(content), logged
+
+
+def _peak_memory(function, payload: bytes) -> int:
+    tracemalloc.start()
+    function(payload)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    for items_count in (10, 1_000, 20_000):
+        payload = _payload(items_count)
+        number = max(1, 2_000 // items_count)
+        print(f"payload={len(payload) / 1024:10.1f} KiB")
+        for name, function in (("previous", _previous), ("current", _current)):
+            function(payload)
+            per_call = min(timeit.repeat(lambda: function(payload), repeat=REPEAT, number=number)) / number * 1e3  # noqa: B023
+            peak = _peak_memory(function, payload) / 1024
+            print(f"  {name:>8}: {per_call:9.3f} ms/call, peak {peak:10.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
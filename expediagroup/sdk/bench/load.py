@@ -0,0 +1,428 @@
+# Copyright 2022 Expedia, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+r"""Drives `FraudPreventionV2Client` under load, to measure what a client process sustains.
+
+Calls are issued from a single thread, from a pool of threads, or from asyncio tasks handing the calls to a thread
+pool, either as fast as they complete or at a target rate. The run reports throughput, latency percentiles, errors, the
+CPU time spent per call and the memory of the process over time, from which the number of processes needed for a given
+rate is estimated. Run `python -m expediagroup.sdk.bench --help` from the repository root for the options.
+"""
+
+import argparse
+import asyncio
+import collections
+import contextlib
+import json
+import logging
+import math
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+
+from pydantic import TypeAdapter
+
+from benchmark.fixtures import (
+    SIZES,
+    account_screen_request,
+    account_update_request,
+    order_purchase_screen_request,
+    order_purchase_update_request,
+)
+from expediagroup.sdk.bench.stand_in import AUTH_PATH
+from expediagroup.sdk.core.configuration.client_config import ClientConfig
+from release.fraudPreventionV2.src import model
+from release.fraudPreventionV2.src.client import FraudPreventionV2Client
+
+MODES: tuple[str, ...] = ("sync", "threads", "asyncio")
+
+# Request model and payload, by fixture size, of each client operation.
+OPERATIONS: dict[str, tuple[Any, Callable[[str], dict[str, Any]]]] = {
+    "screen_order": (model.OrderPurchaseScreenRequest, order_purchase_screen_request),
+    "notify_with_order_update": (model.OrderPurchaseUpdateRequest, lambda size: order_purchase_update_request()),
+    "screen_account": (model.AccountScreenRequest, lambda size: account_screen_request()),
+    "notify_with_account_update": (model.AccountUpdateRequest, lambda size: account_update_request()),
+}
+
+# Share of a CPU a process is planned to use at most, leaving headroom for bursts.
+DEFAULT_UTILIZATION: float = 0.7
+
+STAND_IN_START_TIMEOUT_SECONDS: float = 30.0
+
+# Environment variables the client credentials are read from when they are not given as options.
+KEY_VARIABLE: str = "EXPEDIAGROUP_BENCH_KEY"
+SECRET_VARIABLE: str = "EXPEDIAGROUP_BENCH_SECRET"
+
+
+@dataclass
+class Sample:
+    r"""Measurements over an interval of a run.
+
+    Attributes:
+        elapsed_s (float): Time since the run started, at the end of the interval.
+        requests_per_second (float): Calls completed per second over the interval.
+        p99_ms (float): 99th percentile of the latencies of the calls completed over the interval.
+        cpu_percent (float): CPU time used by the process over the interval, as a percentage of one CPU.
+        rss_mib (float): Resident memory of the process at the end of the interval.
+    """
+
+    elapsed_s: float
+    requests_per_second: float
+    p99_ms: float
+    cpu_percent: float
+    rss_mib: float
+
+
+@dataclass
+class LoadResult:
+    r"""Measurements of a whole run.
+
+    Latencies of paced runs are measured from the time calls were scheduled at, not from the time they were sent, so
+    that a client falling behind its rate shows in its latencies.
+
+    Attributes:
+        mode (str): One of `MODES`.
+        concurrency (int): Number of calls in flight at most.
+        target_rate (Optional[float]): Calls scheduled per second, `None` when calls are issued as fast as they complete.
+        duration_s (float): Duration of the run.
+        requests (int): Number of calls completed, successfully or not.
+        errors (dict[str, int]): Number of failed calls, by exception class name.
+        requests_per_second (float): Throughput.
+        p50_ms (float): Median latency.
+        p90_ms (float): 90th percentile of the latency.
+        p99_ms (float): 99th percentile of the latency.
+        max_ms (float): Longest latency.
+        cpu_ms_per_request (float): CPU time of the process per call, all threads included.
+        rss_start_mib (float): Resident memory of the process when the run started.
+        rss_end_mib (float): Resident memory of the process when the run ended.
+        samples (list[Sample]): Measurements over each interval of the run.
+    """
+
+    mode: str
+    concurrency: int
+    target_rate: Optional[float]
+    duration_s: float
+    requests: int
+    errors: dict[str, int]
+    requests_per_second: float
+    p50_ms: float
+    p90_ms: float
+    p99_ms: float
+    max_ms: float
+    cpu_ms_per_request: float
+    rss_start_mib: float
+    rss_end_mib: float
+    samples: list[Sample] = field(default_factory=list)
+
+    @property
+    def error_rate(self) -> float:
+        return sum(self.errors.values()) / self.requests if self.requests else 0.0
+
+    @property
+    def rss_growth_mib(self) -> float:
+        return self.rss_end_mib - self.rss_start_mib
+
+    def processes_for(self, rate: float, utilization: float = DEFAULT_UTILIZATION) -> int:
+        r"""Estimates the number of client processes needed to sustain a rate, from the CPU time spent per call.
+
+        :param rate: Calls per second to sustain.
+        :param utilization: Share of a CPU each process is planned to use at most.
+        """
+        return max(1, math.ceil(rate * self.cpu_ms_per_request / 1e3 / utilization))
+
+
+def rss_bytes() -> int:
+    r"""Returns the resident memory of the process, its peak where the current one cannot be read, `0` if neither can."""
+    with contextlib.suppress(OSError, ValueError):
+        with open("/proc/self/statm", "rt") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+    try:
+        import resource
+    except ImportError:
+        return 0
+
+    # Linux reports the peak in KiB, macOS in bytes.
+    peak: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _percentile(latencies: list[float], percentile: int) -> float:
+    if len(latencies) < 2:
+        return latencies[0] * 1e3 if latencies else 0.0
+
+    return statistics.quantiles(latencies, n=100, method="inclusive")[percentile - 1] * 1e3
+
+
+class LoadGenerator:
+    def __init__(self, call: Callable[[], Any], concurrency: int = 1, rate: Optional[float] = None, sample_interval: float = 1.0):
+        r"""Calls a function concurrently for a duration, measuring each call and the process as a whole.
+
+        :param call: The function to call, e.g. a client operation with its body.
+        :param concurrency: Number of calls in flight at most, ignored by the `sync` mode which makes one at a time.
+        :param rate: Calls scheduled per second, `None` calls again as soon as a call completes.
+        :param sample_interval: Interval of the measurements taken over the run, in seconds.
+        """
+        self.call: Callable[[], Any] = call
+        self.concurrency: int = concurrency
+        self.rate: Optional[float] = rate
+        self.sample_interval: float = sample_interval
+
+        self.__lock = threading.Lock()
+        self.__latencies: list[float] = []
+        self.__errors: collections.Counter = collections.Counter()
+        self.__issued: int = 0
+        self.__start: float = 0.0
+        self.__end: float = 0.0
+
+    def run(self, mode: str, duration: float) -> LoadResult:
+        r"""Calls the function for a duration.
+
+        :param mode: `sync` calls from the calling thread, `threads` from `concurrency` threads, and `asyncio` from
+            `concurrency` tasks of an event loop, which hand the calls to a pool of as many threads.
+        :param duration: Duration of the run, in seconds.
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unknown mode {mode}, expected one of {', '.join(MODES)}")
+
+        concurrency: int = 1 if mode == "sync" else self.concurrency
+        self.__latencies = []
+        self.__errors = collections.Counter()
+        self.__issued = 0
+
+        samples: list[Sample] = []
+        stopped = threading.Event()
+        sampler = threading.Thread(target=self.__sample, args=(samples, stopped), daemon=True)
+
+        rss_start: int = rss_bytes()
+        cpu_start: float = time.process_time()
+        self.__start = time.perf_counter()
+        self.__end = self.__start + duration
+        sampler.start()
+
+        if mode == "sync":
+            self.__worker()
+        elif mode == "threads":
+            workers = [threading.Thread(target=self.__worker, daemon=True) for _ in range(concurrency)]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+        else:
+            asyncio.run(self.__async_workers(concurrency))
+
+        elapsed: float = time.perf_counter() - self.__start
+        cpu: float = time.process_time() - cpu_start
+        stopped.set()
+        sampler.join()
+
+        latencies: list[float] = self.__latencies
+        return LoadResult(
+            mode=mode,
+            concurrency=concurrency,
+            target_rate=self.rate,
+            duration_s=elapsed,
+            requests=len(latencies),
+            errors=dict(self.__errors),
+            requests_per_second=len(latencies) / elapsed,
+            p50_ms=_percentile(latencies, 50),
+            p90_ms=_percentile(latencies, 90),
+            p99_ms=_percentile(latencies, 99),
+            max_ms=max(latencies, default=0.0) * 1e3,
+            cpu_ms_per_request=cpu * 1e3 / len(latencies) if latencies else 0.0,
+            rss_start_mib=rss_start / 2**20,
+            rss_end_mib=rss_bytes() / 2**20,
+            samples=samples,
+        )
+
+    def __next_start(self) -> Optional[float]:
+        r"""Returns the time the next call is scheduled at, `None` once the run is over."""
+        if not self.rate:
+            now: float = time.perf_counter()
+            return now if now < self.__end else None
+
+        with self.__lock:
+            index: int = self.__issued
+            self.__issued += 1
+
+        scheduled: float = self.__start + index / self.rate
+        return scheduled if scheduled < self.__end else None
+
+    def __measured_call(self, scheduled: float) -> None:
+        try:
+            self.call()
+        except Exception as exception:
+            with self.__lock:
+                self.__errors[type(exception).__name__] += 1
+
+        # Appending to a list is atomic, latencies need no lock.
+        self.__latencies.append(time.perf_counter() - scheduled)
+
+    def __worker(self) -> None:
+        while (scheduled := self.__next_start()) is not None:
+            delay: float = scheduled - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            self.__measured_call(scheduled)
+
+    async def __async_workers(self, concurrency: int) -> None:
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+
+            async def worker():
+                while (scheduled := self.__next_start()) is not None:
+                    delay: float = scheduled - time.perf_counter()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                    await loop.run_in_executor(executor, self.__measured_call, scheduled)
+
+            await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+    def __sample(self, samples: list[Sample], stopped: threading.Event) -> None:
+        completed: int = 0
+        cpu: float = time.process_time()
+        last: float = self.__start
+        while not stopped.wait(self.sample_interval):
+            now: float = time.perf_counter()
+            latencies: list[float] = self.__latencies[completed:]
+            cpu_now: float = time.process_time()
+            samples.append(
+                Sample(
+                    elapsed_s=now - self.__start,
+                    requests_per_second=len(latencies) / (now - last),
+                    p99_ms=_percentile(latencies, 99),
+                    cpu_percent=(cpu_now - cpu) / (now - last) * 100,
+                    rss_mib=rss_bytes() / 2**20,
+                )
+            )
+            completed += len(latencies)
+            cpu, last = cpu_now, now
+
+
+def request_body(operation: str, size: str, raw: bool) -> Any:
+    r"""Builds the body of a call.
+
+    :param operation: One of `OPERATIONS`.
+    :param size: One of `SIZES`, only the size of `screen_order` bodies varies.
+    :param raw: Whether to pass the body through as JSON bytes, rather than as a validated request model.
+    """
+    request_model, payload = OPERATIONS[operation]
+    body: dict[str, Any] = payload(size)
+    if raw:
+        return json.dumps(body).encode()
+
+    return TypeAdapter(request_model).validate_python(body)
+
+
+def _free_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+@contextlib.contextmanager
+def stand_in(options: list[str]) -> Iterator[str]:
+    r"""Runs the API stand-in in a process of its own, so that it does not compete with the load for the GIL.
+
+    :param options: Command line options of the stand-in, besides its port.
+
+    :return: the endpoint of the stand-in.
+    """
+    port: int = _free_port()
+    process = subprocess.Popen([sys.executable, "-m", "expediagroup.sdk.bench.stand_in", "--port", str(port), *options], stdout=subprocess.DEVNULL)
+    try:
+        deadline: float = time.monotonic() + STAND_IN_START_TIMEOUT_SECONDS
+        while True:
+            with contextlib.suppress(OSError), socket.create_connection(("127.0.0.1", port), timeout=1):
+                break
+            if process.poll() is not None or time.monotonic() > deadline:
+                raise RuntimeError(f"The API stand-in did not start on port {port}")
+            time.sleep(0.1)
+
+        yield f"http://127.0.0.1:{port}/"
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def report(result: LoadResult, plan_rate: Optional[float] = None) -> str:
+    r"""Formats the measurements of a run.
+
+    :param result: The measurements.
+    :param plan_rate: Rate to estimate the number of client processes for, if any.
+    """
+    lines: list[str] = [
+        f"{'elapsed':>8} {'req/s':>9} {'p99 ms':>9} {'cpu %':>7} {'rss MiB':>8}",
+        *(f"{s.elapsed_s:8.1f} {s.requests_per_second:9.1f} {s.p99_ms:9.2f} {s.cpu_percent:7.1f} {s.rss_mib:8.1f}" for s in result.samples),
+        "",
+        f"mode {result.mode}, concurrency {result.concurrency}, target rate {result.target_rate or 'none'}",
+        f"requests     {result.requests} in {result.duration_s:.1f}s, {result.requests_per_second:.1f} req/s",
+        f"latency      p50 {result.p50_ms:.2f} ms, p90 {result.p90_ms:.2f} ms, p99 {result.p99_ms:.2f} ms, max {result.max_ms:.2f} ms",
+        f"errors       {result.error_rate:.2%}" + "".join(f", {name} {count}" for name, count in sorted(result.errors.items())),
+        f"cpu          {result.cpu_ms_per_request:.3f} ms/request, {1e3 / result.cpu_ms_per_request if result.cpu_ms_per_request else 0:.0f} req/s per CPU",
+        f"memory       {result.rss_start_mib:.1f} MiB -> {result.rss_end_mib:.1f} MiB ({result.rss_growth_mib:+.1f} MiB)",
+    ]
+    if plan_rate:
+        lines.append(f"capacity     {result.processes_for(plan_rate)} processes for {plan_rate:.0f} req/s at {DEFAULT_UTILIZATION:.0%} CPU each")
+
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mode", choices=MODES, default="threads", help="How calls are issued.")
+    parser.add_argument("--concurrency", type=int, default=8, help="Number of calls in flight at most.")
+    parser.add_argument("--rate", type=float, help="Calls scheduled per second, calls are issued as fast as they complete by default.")
+    parser.add_argument("--duration", type=float, default=10.0, help="Duration of the measured run, in seconds.")
+    parser.add_argument("--warmup", type=float, default=2.0, help="Duration of an unmeasured run first, in seconds.")
+    parser.add_argument("--interval", type=float, default=1.0, help="Interval of the measurements over the run, in seconds.")
+    parser.add_argument("--operation", choices=OPERATIONS.keys(), default="screen_order", help="Client operation to call.")
+    parser.add_argument("--size", choices=SIZES.keys(), default="small", help="Size of the screen_order bodies.")
+    parser.add_argument("--raw", action="store_true", help="Pass bodies through as JSON bytes, rather than as request models.")
+    parser.add_argument("--endpoint", help="Base URL of the API, an API stand-in is started if not given.")
+    parser.add_argument("--auth-endpoint", help="URL of the authentication endpoint, defaults to the one of the stand-in.")
+    parser.add_argument("--key", default=os.environ.get(KEY_VARIABLE, "key"), help=f"Client key, defaults to ${KEY_VARIABLE}.")
+    parser.add_argument("--secret", default=os.environ.get(SECRET_VARIABLE, "secret"), help=f"Client secret, defaults to ${SECRET_VARIABLE}.")
+    parser.add_argument("--stand-in-option", action="append", default=[], help="Option of the started stand-in, e.g. --stand-in-option=--latency=fixed:5.")
+    parser.add_argument("--plan-rate", type=float, help="Rate to estimate the number of client processes for.")
+    parser.add_argument("--save", type=Path, help="Where to save the measurements, as JSON.")
+    arguments = parser.parse_args()
+
+    # The SDK logs every exchange at INFO level, which would be measured as well.
+    logging.getLogger("expediagroup").setLevel(logging.WARNING)
+
+    with contextlib.ExitStack() as stack:
+        endpoint: str = arguments.endpoint or stack.enter_context(stand_in(arguments.stand_in_option))
+        auth_endpoint: str = arguments.auth_endpoint or endpoint.rstrip("/") + AUTH_PATH
+
+        client = FraudPreventionV2Client(ClientConfig(key=arguments.key, secret=arguments.secret, endpoint=endpoint, auth_endpoint=auth_endpoint))
+        operation: Callable[[Any], Any] = getattr(client, arguments.operation)
+        body: Any = request_body(arguments.operation, arguments.size, arguments.raw)
+
+        generator = LoadGenerator(lambda: operation(body), concurrency=arguments.concurrency, rate=arguments.rate, sample_interval=arguments.interval)
+        if arguments.warmup > 0:
+            generator.run(arguments.mode, arguments.warmup)
+        result: LoadResult = generator.run(arguments.mode, arguments.duration)
+
+    print(report(result, arguments.plan_rate))
+    if arguments.save:
+        arguments.save.write_text(json.dumps(asdict(result), indent=2))
@@ -0,0 +1,626 @@
+# Copyright 2022 Expedia, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+r"""A local stand-in for the Fraud Prevention V2 API and its authentication endpoint, to load-test clients offline.
+
+Operations and their responses are read from the OpenAPI spec, successful and error bodies are built from the
+examples and the schemas it declares, so that they follow the spec as it changes. Responses can be delayed following
+a latency distribution, replaced by errors at given rates, and replayed from exchanges recorded against a real
+upstream. Run `python -m expediagroup.sdk.bench.stand_in --help` for the command line options.
+"""
+
+import argparse
+import asyncio
+import collections
+import contextlib
+import itertools
+import json
+import math
+import multiprocessing
+import random
+import signal
+import socket
+import sys
+import threading
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+from enum import Enum
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any, Optional
+
+import requests
+import yaml
+
+SPEC_PATH: Path = Path(__file__).parents[3] / "release" / "fraudPreventionV2" / "src" / "specs.yaml"
+
+AUTH_PATH: str = "/identity/oauth2/v3/token/"
+
+TOKEN_SCOPE: str = "fraud"
+
+# Nesting depth after which generated bodies stop, recursive schemas would never end otherwise.
+MAX_SCHEMA_DEPTH: int = 16
+
+_HEADER_END: bytes = b"\r\n\r\n"
+
+# Headers of a single connection, which a recording stand-in does not forward, along with `Host` and `Content-Length`.
+_UNFORWARDED_HEADERS: frozenset[str] = frozenset(
+    ("connection", "keep-alive", "proxy-authenticate", "proxy-authorization", "te", "trailer", "transfer-encoding", "upgrade", "host", "content-length")
+)
+
+_JSON_TYPES: dict[str, tuple[type, ...]] = {
+    "object": (dict,),
+    "array": (list,),
+    "string": (str,),
+    "integer": (int,),
+    "number": (int, float),
+    "boolean": (bool,),
+}
+
+_FORMAT_EXAMPLES: dict[str, str] = {
+    "date-time": "2024-01-01T00:00:00.000Z",
+    "date": "2024-01-01",
+    "email": "user@example.com",
+    "ipv4": "192.168.32.48",
+    "uri": "https://example.com/",
+    "uuid": "00000000-0000-0000-0000-000000000000",
+}
+
+
+class Mode(Enum):
+    r"""Where the responses of the stand-in come from."""
+
+    SPEC = "spec"
+    RECORD = "record"
+    REPLAY = "replay"
+
+
+@dataclass(frozen=True)
+class Latency:
+    r"""A distribution of response delays, in milliseconds.
+
+    Attributes:
+        distribution (str): One of `fixed` (delay), `uniform` (low, high), `normal` (mean, standard deviation),
+            `lognormal` (median, sigma) and `exponential` (mean).
+        parameters (tuple[float, ...]): Parameters of the distribution, in the order above.
+    """
+
+    distribution: str = "fixed"
+    parameters: tuple[float, ...] = (0.0,)
+
+    def __post_init__(self):
+        arity: Optional[int] = {"fixed": 1, "uniform": 2, "normal": 2, "lognormal": 2, "exponential": 1}.get(self.distribution)
+        if arity is None:
+            raise ValueError(f"Unknown latency distribution: {self.distribution}")
+        if len(self.parameters) != arity:
+            raise ValueError(f"Latency distribution {self.distribution} takes {arity} parameters, got {len(self.parameters)}")
+
+    @staticmethod
+    def parse(value: str) -> "Latency":
+        r"""Parses a distribution written as `<distribution>:<parameter>[:<parameter>]`, e.g. `lognormal:20:0.5`."""
+        distribution, *parameters = value.split(":")
+        return Latency(distribution, tuple(float(parameter) for parameter in parameters))
+
+    def sample(self, generator: random.Random) -> float:
+        r"""Draws a delay, in seconds, never negative."""
+        first: float = self.parameters[0]
+        if self.distribution == "fixed":
+            milliseconds = first
+        elif self.distribution == "uniform":
+            milliseconds = generator.uniform(first, self.parameters[1])
+        elif self.distribution == "normal":
+            milliseconds = generator.gauss(first, self.parameters[1])
+        elif self.distribution == "lognormal":
+            milliseconds = first * math.exp(generator.gauss(0.0, self.parameters[1]))
+        else:
+            milliseconds = generator.expovariate(1 / first) if first > 0 else 0.0
+
+        return max(0.0, milliseconds) / 1e3
+
+
+@dataclass(frozen=True)
+class Operation:
+    r"""An operation of the spec, and the bodies of its responses.
+
+    Attributes:
+        operation_id (str): Operation identifier, e.g. `screenOrder`.
+        method (str): Upper-cased HTTP method.
+        path (str): Path of the operation.
+        responses (dict[int, bytes]): JSON bodies of the responses the operation declares, by status code.
+    """
+
+    operation_id: str
+    method: str
+    path: str
+    responses: dict[int, bytes]
+
+    @property
+    def success_status(self) -> int:
+        return min(status for status in self.responses.keys() if 200 <= status < 300)
+
+
+def example(schema: Mapping[str, Any], schemas: Mapping[str, Any], depth: int = 0) -> Any:
+    r"""Builds a value conforming to a schema, from the examples it declares or from its constraints.
+
+    Objects get all of their properties, so that responses exercise every field the client decodes.
+
+    :param schema: The schema, `$ref` are resolved against `schemas`.
+    :param schemas: The component schemas of the spec, by name.
+    :param depth: Current nesting depth.
+    """
+    if "$ref" in schema:
+        return example(schemas[schema["$ref"].rsplit("/", 1)[-1]], schemas, depth)
+    if depth > MAX_SCHEMA_DEPTH:
+        return None
+
+    parts: list[Mapping[str, Any]] = [schema, *schema.get("allOf", ())]
+    declared: Any = schema.get("example")
+    schema_type: Optional[str] = schema.get("type") or ("object" if "properties" in schema or "allOf" in schema else None)
+
+    if schema_type == "object":
+        value: dict[str, Any] = dict()
+        for part in schema.get("allOf", ()):
+            value.update(example(part, schemas, depth + 1) or dict())
+        for name, property_schema in schema.get("properties", dict()).items():
+            value[name] = example(property_schema, schemas, depth + 1)
+
+        # A declared example overrides the values it gives, where they have the type of their property.
+        if isinstance(declared, dict):
+            properties: dict[str, Any] = _properties(schema, schemas)
+            for name, declared_value in declared.items():
+                if name in value and _conforms(declared_value, properties.get(name, dict()), schemas):
+                    value[name] = declared_value
+        return value
+
+    if declared is not None:
+        return declared
+
+    for part in parts:
+        if part.get("enum"):
+            return part["enum"][0]
+        if "oneOf" in part or "anyOf" in part:
+            return example((part.get("oneOf") or part.get("anyOf"))[0], schemas, depth + 1)
+
+    if schema_type == "array":
+        return [example(schema.get("items", dict()), schemas, depth + 1) for _ in range(max(1, schema.get("minItems", 1)))]
+    if schema_type == "integer":
+        return int(schema.get("minimum", 0))
+    if schema_type == "number":
+        return float(schema.get("minimum", 0))
+    if schema_type == "boolean":
+        return False
+    if schema_type == "string":
+        return _FORMAT_EXAMPLES.get(schema.get("format"), "a" * max(1, schema.get("minLength", 1)))
+
+    return None
+
+
+def _properties(schema: Mapping[str, Any], schemas: Mapping[str, Any]) -> dict[str, Any]:
+    if "$ref" in schema:
+        return _properties(schemas[schema["$ref"].rsplit("/", 1)[-1]], schemas)
+
+    properties: dict[str, Any] = dict()
+    for part in schema.get("allOf", ()):
+        properties.update(_properties(part, schemas))
+    properties.update(schema.get("properties", dict()))
+    return properties
+
+
+def _conforms(value: Any, schema: Mapping[str, Any], schemas: Mapping[str, Any]) -> bool:
+    if "$ref" in schema:
+        return _conforms(value, schemas[schema["$ref"].rsplit("/", 1)[-1]], schemas)
+
+    types: Optional[tuple[type, ...]] = _JSON_TYPES.get(schema.get("type"))
+    if types is None:
+        return True
+    if "enum" in schema and value not in schema["enum"]:
+        return False
+    return isinstance(value, types) and not (isinstance(value, bool) and bool not in types)
+
+
+def load_operations(spec_path: Path = SPEC_PATH) -> dict[str, Operation]:
+    r"""Reads the operations of an OpenAPI spec, with a JSON body for each response they declare.
+
+    :param spec_path: Path of the OpenAPI spec, as YAML or JSON.
+
+    :return: operations by path.
+    :rtype: dict[str, Operation]
+    """
+    spec: dict[str, Any] = yaml.safe_load(spec_path.read_text(encoding="utf8"))
+    schemas: dict[str, Any] = spec.get("components", dict()).get("schemas", dict())
+
+    operations: dict[str, Operation] = dict()
+    for path, methods in spec.get("paths", dict()).items():
+        for method, definition in methods.items():
+            responses: dict[int, bytes] = dict()
+            for status, response in definition.get("responses", dict()).items():
+                schema = response.get("content", dict()).get("application/json", dict()).get("schema")
+                body: Any = example(schema, schemas) if schema else None
+                responses[int(status)] = json.dumps(body).encode() if body is not None else b""
+
+            operations[path] = Operation(operation_id=definition["operationId"], method=method.upper(), path=path, responses=responses)
+
+    return operations
+
+
+def _error_body(status: int, message: Optional[str] = None) -> bytes:
+    return json.dumps({"code": HTTPStatus(status).name, "message": message or HTTPStatus(status).phrase}).encode()
+
+
+def _http_response(status: int, content: bytes, keep_alive: bool = True) -> bytes:
+    # Responses are written whole, headers and body in a single buffer.
+    try:
+        reason: str = HTTPStatus(status).phrase
+    except ValueError:
+        reason = ""
+    head: str = (
+        f"HTTP/1.1 {status} {reason}\r\n"
+        f"Content-Type: application/json\r\n"
+        f"Content-Length: {len(content)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    return head.encode("latin-1") + content
+
+
+class _Recording:
+    r"""Exchanges recorded against an upstream, stored as JSON lines of method, path, status and body."""
+
+    def __init__(self, path: Path):
+        self.path: Path = path
+        self.__lock = threading.Lock()
+
+    def append(self, method: str, path: str, status: int, content: bytes) -> None:
+        line: str = json.dumps({"method": method, "path": path, "status": status, "body": content.decode("utf8", errors="replace")})
+        with self.__lock, self.path.open("at", encoding="utf8") as file:
+            file.write(line + "\n")
+
+    def load(self) -> dict[tuple[str, str], Iterator[tuple[int, bytes]]]:
+        r"""Returns the recorded responses by method and path, cycled through in the order they were recorded."""
+        exchanges: dict[tuple[str, str], list[tuple[int, bytes]]] = dict()
+        with self.path.open("rt", encoding="utf8") as file:
+            for line in file:
+                if line.strip():
+                    exchange = json.loads(line)
+                    exchanges.setdefault((exchange["method"], exchange["path"]), []).append((exchange["status"], exchange["body"].encode("utf8")))
+
+        return {key: itertools.cycle(responses) for key, responses in exchanges.items()}
+
+
+class _HttpProtocol(asyncio.Protocol):
+    r"""A minimal HTTP/1.1 server connection: keep-alive, `Content-Length` bodies, one request answered at a time."""
+
+    def __init__(self, server: "StandInServer"):
+        self.server: StandInServer = server
+        self.transport: Optional[asyncio.Transport] = None
+        self.buffer = bytearray()
+        self.busy: bool = False
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.transport = transport
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        self.transport = None
+
+    def data_received(self, data: bytes) -> None:
+        self.buffer += data
+        self.process()
+
+    def process(self) -> None:
+        # Pipelined requests wait in the buffer until the response to the current one is written, to keep them ordered.
+        while not self.busy and self.transport:
+            header_end: int = self.buffer.find(_HEADER_END)
+            if header_end < 0:
+                return
+
+            lines: list[str] = self.buffer[:header_end].decode("latin-1").split("\r\n")
+            method, target, version = lines[0].split(" ", 2)
+            headers: dict[str, str] = dict()
+            for line in lines[1:]:
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+            body_start: int = header_end + len(_HEADER_END)
+            body_end: int = body_start + int(headers.get("content-length") or 0)
+            if len(self.buffer) < body_end:
+                return
+
+            body: bytes = bytes(self.buffer[body_start:body_end])
+            del self.buffer[:body_end]
+
+            keep_alive: bool = headers.get("connection", "").lower() != "close" and version != "HTTP/1.0"
+            self.busy = True
+            self.server._handle(self, method, target.split("?", 1)[0], headers, body, keep_alive)
+
+    def respond(self, status: int, content: bytes, keep_alive: bool) -> None:
+        if not self.transport:
+            return
+
+        self.transport.write(_http_response(status, content, keep_alive))
+        if not keep_alive:
+            self.transport.close()
+            return
+
+        self.busy = False
+        self.process()
+
+
+class StandInServer:
+    def __init__(
+        self,
+        spec_path: Path = SPEC_PATH,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        token_expires_in: float = 3600,
+        latency: Optional[Latency] = None,
+        operation_latencies: Optional[Mapping[str, Latency]] = None,
+        error_rates: Optional[Mapping[int, float]] = None,
+        mode: Mode = Mode.SPEC,
+        recording: Optional[Path] = None,
+        upstream: Optional[str] = None,
+        processes: int = 1,
+        seed: Optional[int] = None,
+    ):
+        r"""A stand-in for the API, serving the operations of an OpenAPI spec once started.
+
+        The server runs an asyncio loop, in a background thread when started with `start` or as a context manager,
+        and in as many forked processes sharing its socket as `processes` asks for. Latency is waited for without
+        blocking the loop, so that slow responses do not limit throughput.
+
+        :param spec_path: Path of the OpenAPI spec the operations are read from.
+        :param host: Interface to listen on.
+        :param port: Port to listen on, `0` picks an ephemeral one.
+        :param token_expires_in: Lifetime of the tokens handed out, in seconds. Tokens expiring within
+            `REFRESH_TOKEN_TIME_GAP_IN_SECONDS` are refreshed by clients before every call.
+        :param latency: Delay of every response, none by default.
+        :param operation_latencies: Delay of the responses of given operations, by operation identifier.
+        :param error_rates: Share of the calls to answer with an error, by status code, e.g. `{429: 0.01}`. Error bodies
+            are the ones the operation declares for the status code, a generic error otherwise.
+        :param mode: `SPEC` answers from the spec, `RECORD` forwards calls to `upstream` and appends the exchanges to
+            `recording`, `REPLAY` answers with the responses of `recording`, from the spec where none was recorded.
+        :param recording: Path of the recorded exchanges, as JSON lines.
+        :param upstream: Base URL calls are forwarded to when recording.
+        :param processes: Number of processes serving the socket.
+        :param seed: Seed of the latency and error draws, for reproducible runs.
+        """
+        if mode is not Mode.SPEC and not recording:
+            raise ValueError(f"A recording path is needed in {mode.value} mode")
+        if mode is Mode.RECORD and not upstream:
+            raise ValueError("An upstream URL is needed in record mode")
+
+        self.token_expires_in: float = token_expires_in
+        self.latency: Optional[Latency] = latency
+        self.error_rates: dict[int, float] = {HTTPStatus(status).value: rate for status, rate in (error_rates or dict()).items()}
+        self.mode: Mode = mode
+        self.upstream: Optional[str] = upstream.rstrip("/") if upstream else None
+        self.processes: int = processes
+        # Recorded calls are answered from executor threads, the counts and the upstream session are shared among them.
+        self.requests: collections.Counter[str] = collections.Counter()
+        self.__requests_lock = threading.Lock()
+
+        self.__operations: dict[str, Operation] = load_operations(spec_path)
+        self.__latencies: dict[str, Optional[Latency]] = {
+            path: (operation_latencies or dict()).get(operation.operation_id, latency) for path, operation in self.__operations.items()
+        }
+        self.__recording: Optional[_Recording] = _Recording(recording) if recording else None
+        self.__replays: dict[tuple[str, str], Iterator[tuple[int, bytes]]] = self.__recording.load() if mode is Mode.REPLAY else dict()
+        self.__random = random.Random(seed)
+        self.__session: Optional[requests.Session] = requests.Session() if mode is Mode.RECORD else None
+
+        self.__address: tuple[str, int] = (host, port)
+        self.__socket: Optional[socket.socket] = None
+        self.__loop: Optional[asyncio.AbstractEventLoop] = None
+        self.__thread: Optional[threading.Thread] = None
+        self.__children: list[multiprocessing.Process] = []
+
+    @property
+    def operations(self) -> dict[str, Operation]:
+        return self.__operations
+
+    @property
+    def endpoint(self) -> str:
+        r"""The base URL of the API."""
+        host, port = self.__socket.getsockname()[:2] if self.__socket else self.__address
+        return f"http://{host}:{port}/"
+
+    @property
+    def auth_endpoint(self) -> str:
+        r"""The URL of the authentication endpoint."""
+        return self.endpoint.rstrip("/") + AUTH_PATH
+
+    def start(self) -> "StandInServer":
+        r"""Binds the socket and serves it from a background thread, and from the other processes if any."""
+        self.__bind()
+        self.__fork()
+
+        ready = threading.Event()
+        self.__thread = threading.Thread(target=self.__run, args=(ready,), daemon=True)
+        self.__thread.start()
+        ready.wait()
+        return self
+
+    def stop(self) -> None:
+        for child in self.__children:
+            child.terminate()
+            child.join()
+        self.__children.clear()
+
+        if self.__loop and self.__thread:
+            self.__loop.call_soon_threadsafe(self.__loop.stop)
+            self.__thread.join()
+            self.__thread = None
+
+        if self.__socket:
+            self.__socket.close()
+            self.__socket = None
+
+        if self.__session:
+            self.__session.close()
+
+    def serve_forever(self) -> None:
+        r"""Binds the socket and serves it from the calling thread, and from the other processes if any."""
+        self.__bind()
+        self.__fork()
+        try:
+            self.__run(threading.Event())
+        finally:
+            self.stop()
+
+    def __enter__(self) -> "StandInServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def respond(self, method: str, path: str, body: bytes = b"", headers: Optional[Mapping[str, str]] = None) -> tuple[int, bytes]:
+        r"""Returns the status code and the body answering a request, without latency, and counts the request.
+
+        Recording forwards the request to the upstream with its headers, and blocks until it answers.
+
+        :param method: Upper-cased HTTP method.
+        :param path: Path of the request, without query.
+        :param body: Body of the request.
+        :param headers: Headers of the request, by lower-cased name.
+        """
+        with self.__requests_lock:
+            self.requests[path] += 1
+
+        if path == AUTH_PATH:
+            if self.mode is Mode.RECORD:
+                # Tokens are never recorded, replays hand out tokens of their own.
+                return self.__forward(method, path, body, headers, record=False)
+            token = {"access_token": "token", "expires_in": self.token_expires_in, "scope": TOKEN_SCOPE, "token_type": "bearer"}
+            return HTTPStatus.OK, json.dumps(token).encode()
+
+        if self.mode is Mode.RECORD:
+            return self.__forward(method, path, body, headers, record=True)
+
+        operation: Optional[Operation] = self.__operations.get(path)
+        if not operation or operation.method != method:
+            return HTTPStatus.NOT_FOUND, _error_body(HTTPStatus.NOT_FOUND, f"No operation for {method} {path}")
+
+        # Each error is drawn independently, the first one drawn wins.
+        for status, rate in self.error_rates.items():
+            if rate and self.__random.random() < rate:
+                return status, operation.responses.get(status) or _error_body(status)
+
+        replay: Optional[Iterator[tuple[int, bytes]]] = self.__replays.get((method, path))
+        if replay:
+            return next(replay)
+
+        status: int = operation.success_status
+        return status, operation.responses[status]
+
+    def _handle(self, connection: _HttpProtocol, method: str, path: str, headers: dict[str, str], body: bytes, keep_alive: bool) -> None:
+        # Forwarded calls block on the upstream, they wait in the default executor rather than in the loop.
+        if self.mode is Mode.RECORD:
+            future = asyncio.get_running_loop().run_in_executor(None, self.respond, method, path, body, headers)
+            future.add_done_callback(lambda done: connection.respond(*done.result(), keep_alive))
+            return
+
+        status, content = self.respond(method, path, body, headers)
+        latency: Optional[Latency] = self.__latencies.get(path)
+        delay: float = latency.sample(self.__random) if latency else 0.0
+        if delay > 0:
+            asyncio.get_running_loop().call_later(delay, connection.respond, status, content, keep_alive)
+        else:
+            connection.respond(status, content, keep_alive)
+
+    def __forward(self, method: str, path: str, body: bytes, headers: Optional[Mapping[str, str]], record: bool) -> tuple[int, bytes]:
+        forwarded: dict[str, str] = {name: value for name, value in (headers or dict()).items() if name not in _UNFORWARDED_HEADERS}
+        try:
+            response = self.__session.request(method, self.upstream + path, data=body, headers=forwarded)
+        except requests.RequestException as exception:
+            return HTTPStatus.BAD_GATEWAY, _error_body(HTTPStatus.BAD_GATEWAY, f"Upstream call failed: {exception}")
+
+        if record:
+            self.__recording.append(method, path, response.status_code, response.content)
+        return response.status_code, response.content
+
+    def __bind(self) -> None:
+        self.__socket = socket.create_server(self.__address, backlog=1024)
+
+    def __fork(self) -> None:
+        # Children serve the socket bound by the parent, the kernel spreads connections among the processes.
+        context = multiprocessing.get_context("fork")
+        for _ in range(self.processes - 1):
+            child = context.Process(target=self.__run, args=(None,), daemon=True)
+            child.start()
+            self.__children.append(child)
+
+    def __run(self, ready: Optional[threading.Event]) -> None:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        server = loop.run_until_complete(loop.create_server(lambda: _HttpProtocol(self), sock=self.__socket))
+        self.__loop = loop
+        if ready:
+            ready.set()
+
+        try:
+            with contextlib.suppress(KeyboardInterrupt):
+                loop.run_forever()
+        finally:
+            self.__loop = None
+            server.close()
+            loop.run_until_complete(server.wait_closed())
+            loop.close()
+
+
+def _error_rate(value: str) -> tuple[int, float]:
+    status, _, rate = value.partition("=")
+    return int(status), float(rate)
+
+
+def _operation_latency(value: str) -> tuple[str, Latency]:
+    operation_id, _, latency = value.partition("=")
+    return operation_id, Latency.parse(latency)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--spec", type=Path, default=SPEC_PATH, help="OpenAPI spec the operations are read from.")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on.")
+    parser.add_argument("--port", type=int, default=8080, help="Port to listen on.")
+    parser.add_argument("--processes", type=int, default=1, help="Number of processes serving the port.")
+    parser.add_argument("--token-expires-in", type=float, default=3600, help="Lifetime of the tokens handed out, in seconds.")
+    parser.add_argument("--latency", type=Latency.parse, help="Delay of every response, e.g. fixed:5 or lognormal:20:0.5, in milliseconds.")
+    parser.add_argument("--operation-latency", type=_operation_latency, action="append", default=[], help="Delay of an operation, e.g. screenOrder=fixed:50.")
+    parser.add_argument("--error", type=_error_rate, action="append", default=[], help="Share of calls answered with a status code, e.g. 429=0.01.")
+    parser.add_argument("--record", type=Path, help="Forward calls to --upstream, appending the exchanges to this file.")
+    parser.add_argument("--upstream", help="Base URL calls are forwarded to when recording.")
+    parser.add_argument("--replay", type=Path, help="Answer with the responses recorded in this file.")
+    parser.add_argument("--seed", type=int, help="Seed of the latency and error draws.")
+    arguments = parser.parse_args()
+
+    mode: Mode = Mode.RECORD if arguments.record else Mode.REPLAY if arguments.replay else Mode.SPEC
+    server = StandInServer(
+        spec_path=arguments.spec,
+        host=arguments.host,
+        port=arguments.port,
+        token_expires_in=arguments.token_expires_in,
+        latency=arguments.latency,
+        operation_latencies=dict(arguments.operation_latency),
+        error_rates=dict(arguments.error),
+        mode=mode,
+        recording=arguments.record or arguments.replay,
+        upstream=arguments.upstream,
+        processes=arguments.processes,
+        seed=arguments.seed,
+    )
+    # Stopping on SIGTERM as on Ctrl+C, so that the processes forked to serve the port are stopped as well.
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    print(f"Serving {len(server.operations)} operations in {mode.value} mode on {server.endpoint}, auth endpoint {server.auth_endpoint}")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -12,19 +12,30 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import logging
-from copy import deepcopy
+import time
+from collections.abc import Mapping
 from http import HTTPStatus
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
 import requests
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel
 
+from expediagroup.sdk.core.client import profiler
 from expediagroup.sdk.core.client.auth_client import AuthClient
+from expediagroup.sdk.core.client.middleware import Handler, build_handler
+from expediagroup.sdk.core.client.profiler import CallProfile, CallProfiler
 from expediagroup.sdk.core.configuration.client_config import ClientConfig
 from expediagroup.sdk.core.constant import header as header_constant
 from expediagroup.sdk.core.constant import log as log_constant
 from expediagroup.sdk.core.constant.constant import OK_STATUS_CODES_RANGE
-from expediagroup.sdk.core.model.api import RequestHeaders
+from expediagroup.sdk.core.model.api import (
+    ApiRequest,
+    PreparedBody,
+    RawBody,
+    RawResponse,
+    RequestHeaders,
+    _validate_response,
+)
 from expediagroup.sdk.core.model.error import Error
 from expediagroup.sdk.core.model.exception import service as service_exception
 from expediagroup.sdk.core.util import log as log_util
@@ -45,110 +56,210 @@ class ApiClient:
 
         self.endpoint = config.endpoint
         self.request_timeout = config.request_timeout
+        self.__profiler: Optional[CallProfiler] = config.profiler
+
+        # The chain is composed once here, with no middlewares installed it is the bare `__send` stage.
+        self.__handler: Handler = build_handler(config.middlewares, self.__send)
 
     @staticmethod
     def __build_response(
         response: requests.Response,
         response_models: list[type],
         error_responses: dict[int, Any],
+        raw_response: bool = False,
     ):
+        # Responses are validated from the raw JSON bytes, without decoding them to text or to Python objects first.
+        content: Union[bytes, bytearray] = response.content
+
         if response.status_code not in OK_STATUS_CODES_RANGE:
             exception: service_exception.ExpediaGroupApiException
 
             if response.status_code in error_responses.keys():
-                error_object = error_responses[response.status_code].model.model_validate(response.json())
+                error_object = error_responses[response.status_code].model.model_validate_json(content)
                 exception = error_responses[response.status_code].exception.of(error=error_object, error_code=HTTPStatus(response.status_code))
             else:
                 exception = service_exception.ExpediaGroupApiException.of(
-                    error=Error.model_validate(response.json()),
+                    error=Error.model_validate_json(content),
                     error_code=HTTPStatus(response.status_code),
                 )
 
             raise exception
 
-        response_object = None
-        for model in response_models:
-            if not model:
-                continue
-            try:
-                response_object = TypeAdapter(model).validate_python(response.json())
-                return response_object
-            except Exception:
-                continue
+        if raw_response:
+            return RawResponse(status_code=response.status_code, headers=response.headers, content=content, response_models=response_models)
+
+        return _validate_response(content, response_models)
+
+    @staticmethod
+    def __read_content(response: requests.Response) -> bytes:
+        r"""Reads the whole body of a streamed response into a single bytes buffer, and releases the connection.
+
+        `requests` reads the body chunk by chunk and joins the chunks once, the buffer is then kept by the response for
+        the later stages. The body is validated only after it has been fully read.
 
-        return response_object
+        :param response: A response sent with `stream=True`.
+
+        :return: the raw response body.
+        :rtype: bytes
+        """
+        try:
+            return response.content
+        finally:
+            response.close()
 
     def call(
         self,
         method: str,
         url: str,
-        body: BaseModel,
+        body: Union[BaseModel, PreparedBody, RawBody, None],
         headers: RequestHeaders = RequestHeaders(),  # noqa
         response_models: Optional[list[Any]] = list(),  # noqa
         error_responses: dict[int, Any] = dict(),  # noqa
+        operation: Optional[str] = None,
+        safe_to_duplicate: bool = False,
+        body_model: Any = None,
+        raw_response: bool = False,
     ) -> Any:
         r"""Sends HTTP request to API.
 
         :param method: Http request method.
-        :param body: Object that holds request data.
+        :param body: Object that holds request data, a `PreparedBody` already serialized from plain data, or a raw
+            body passed through without validation: JSON bytes sent unchanged, or a mapping serialized as is.
         :param response_models: Model to fetch the response data into.
         :param url: URL used to send the request.
         :param headers: Request headers.
+        :param operation: Name of the client operation issuing the request.
+        :param safe_to_duplicate: Whether the request may be sent more than once, e.g. by hedging.
+        :param body_model: The request model a raw body conforms to, used to mask sensitive fields in logs.
+        :param raw_response: Whether to return successful responses as a `RawResponse`, decoded on demand only.
 
         :return: response as object
         :rtype: Any
         """
-        self.__auth_client.refresh_token()
-        request_headers = ApiClient.__prepare_request_headers(headers)
+        # Without a profiler, phases are skipped by the `if profile` checks alone.
+        profile: Optional[CallProfile] = self.__profiler.begin(operation) if self.__profiler else None
+        try:
+            if isinstance(body, (bytes, bytearray, Mapping)):
+                body = PreparedBody.of(body_model, body)
+            data = ApiClient.__serialize(body)
+            if profile:
+                since: int = profile.add(profiler.SERIALIZE, profile.start_ns)
 
-        if not body:
-            response = requests.request(
+            request_headers: dict = ApiClient.__prepare_request_headers(headers)
+            if profile:
+                since = profile.add(profiler.HEADERS, since)
+
+            request = ApiRequest(
                 method=method.upper(),
                 url=str(url),
                 headers=request_headers,
-                auth=self.__auth_client.auth_header,
-                timeout=self.request_timeout,
+                body=body,
+                data=data,
+                response_models=response_models,
+                error_responses=error_responses,
+                operation=operation,
+                safe_to_duplicate=safe_to_duplicate,
+                profile=profile,
             )
-        else:
-            request_body = body.model_dump_json(exclude_none=True)
-            response = requests.request(
-                method=method.upper(),
-                url=url,
-                headers=request_headers,
-                data=request_body,
-                auth=self.__auth_client.auth_header,
-                timeout=self.request_timeout,
+
+            response = self.__handler(request)
+            if profile:
+                profile.status_code = response.status_code
+                since = profile.add_middlewares(since)
+
+            result = ApiClient.__build_response(
+                response=response,
+                response_models=request.response_models,
+                error_responses=request.error_responses,
+                raw_response=raw_response,
             )
+            if profile:
+                profile.add(profiler.DECODE, since)
 
-        logged_body: dict[str, Any] = dict() if not body else body.model_dump()
+            return result
+        except BaseException as exception:
+            if profile:
+                profile.error = type(exception).__name__
+            raise
+        finally:
+            if profile:
+                self.__profiler.end(profile)
 
-        request_log_message = log_util.request_log(
-            headers=request_headers,
-            body=str(logged_body),
-            endpoint=url,
-            method=method,
-            response=response,
-        )
+    @staticmethod
+    def __serialize(body: Union[BaseModel, PreparedBody, None]) -> Union[str, bytes, None]:
+        if not body:
+            return None
+        if isinstance(body, PreparedBody):
+            return body.content
+
+        return body.model_dump_json(exclude_none=True)
+
+    def __send(self, request: ApiRequest) -> requests.Response:
+        r"""Terminal stage of the middleware chain, refreshes the token, sends the request and logs the exchange.
+
+        The response body is read into a single bytes buffer, never decoded as a whole to text.
+
+        :param request: The prepared request.
+
+        :return: the raw response.
+        :rtype: requests.Response
+        """
+        profile: Optional[CallProfile] = request.profile
+        since: int = time.perf_counter_ns() if profile else 0
 
-        LOG.info(log_constant.EXPEDIAGROUP_LOG_MESSAGE_TEMPLATE.format(request_log_message))
+        self.__auth_client.refresh_token()
+        if profile:
+            since = profile.add(profiler.TOKEN_REFRESH, since)
 
-        result = ApiClient.__build_response(
-            response=response,
-            response_models=response_models,
-            error_responses=error_responses,
+        response = requests.request(
+            method=request.method,
+            url=request.url,
+            headers=request.headers,
+            data=request.data,
+            auth=self.__auth_client.auth_header,
+            timeout=self.request_timeout,
+            stream=True,
         )
+        if profile:
+            since = profile.add(profiler.NETWORK, since)
+
+        ApiClient.__read_content(response)
+        if profile:
+            since = profile.add(profiler.READ, since)
+
+        if LOG.isEnabledFor(logging.INFO):
+            logged_body: str = str(dict())
+            if isinstance(request.body, PreparedBody):
+                # Passed through bodies are not validated unless asked to, the request has been sent already either way.
+                try:
+                    logged_body = str(log_util.redacted_data(request.body.model, request.body.content))
+                except ValueError:
+                    logged_body = log_util.body_log(request.body.content)
+            elif request.body:
+                logged_body = str(log_util.redacted_dump(request.body))
+
+            request_log_message = log_util.request_log(
+                headers=request.headers,
+                body=logged_body,
+                endpoint=request.url,
+                method=request.method,
+                response=response,
+            )
+
+            LOG.info(log_constant.EXPEDIAGROUP_LOG_MESSAGE_TEMPLATE.format(request_log_message))
 
-        return result
+        if profile:
+            profile.add(profiler.LOG_EXCHANGE, since)
+
+        return response
 
     @staticmethod
     def __fill_request_headers(request_headers: dict):
+        # Always hand out a copy, middlewares are free to mutate the headers of a request.
         if not request_headers:
-            return header_constant.API_REQUEST
-
-        headers: dict = deepcopy(header_constant.API_REQUEST)
-        headers.update(request_headers)
+            return dict(header_constant.API_REQUEST)
 
-        return headers
+        return {**header_constant.API_REQUEST, **request_headers}
 
     @staticmethod
     def __prepare_request_headers(headers: RequestHeaders) -> dict:
@@ -0,0 +1,140 @@
+# Copyright 2022 Expedia, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import collections
+import dataclasses
+import hashlib
+import threading
+import time
+from collections.abc import Iterable
+from concurrent.futures import Future
+from dataclasses import dataclass
+
+import requests
+
+from expediagroup.sdk.core.client.middleware import Handler, Middleware
+from expediagroup.sdk.core.constant.constant import OK_STATUS_CODES_RANGE, UTF8
+from expediagroup.sdk.core.model.api import ApiRequest
+
+
+@dataclass
+class CoalescingMetrics:
+    r"""Coalescing counters of a single operation.
+
+    Attributes:
+        requests (int): Number of calls that went through coalescing.
+        coalesced (int): Number of calls that shared the network call of an identical in-flight request.
+        cache_hits (int): Number of calls answered from the cache of recent successful responses.
+    """
+
+    requests: int = 0
+    coalesced: int = 0
+    cache_hits: int = 0
+
+    @property
+    def sent(self) -> int:
+        return self.requests - self.coalesced - self.cache_hits
+
+
+class CoalescingMiddleware(Middleware):
+    def __init__(self, operations: Iterable[str], ttl_seconds: float = 0.0, max_cached_responses: int = 1_024):
+        r"""Makes identical concurrent requests share a single network call and a single response.
+
+        Requests are identical when they are issued by the same operation, to the same URL, with the same body. The key
+        is a hash of the serialized body, which the client dumps deterministically in model field order. Successful
+        responses can also be kept for `ttl_seconds`, so that an update replayed shortly after answers from memory.
+
+        :param operations: Client operation names to coalesce (e.g. `notify_with_order_update`).
+        :param ttl_seconds: How long successful responses are reused, `0` only coalesces in-flight requests.
+        :param max_cached_responses: Maximum number of responses kept, the least recently used ones are evicted first.
+        """
+        self.__operations: frozenset[str] = frozenset(operations)
+        self.__ttl_seconds: float = ttl_seconds
+        self.__max_cached_responses: int = max_cached_responses
+
+        self.__in_flight: dict[tuple[str, str], Future] = dict()
+        self.__cache: collections.OrderedDict[tuple[str, str], tuple[float, requests.Response]] = collections.OrderedDict()
+        self.__metrics: dict[str, CoalescingMetrics] = {operation: CoalescingMetrics() for operation in self.__operations}
+        self.__lock = threading.Lock()
+
+    def metrics(self, operation: str) -> CoalescingMetrics:
+        r"""Returns a snapshot of the coalescing counters of an operation.
+
+        :param operation: Client operation name.
+        """
+        with self.__lock:
+            return dataclasses.replace(self.__metrics.get(operation, CoalescingMetrics()))
+
+    def __call__(self, request: ApiRequest, call_next: Handler) -> requests.Response:
+        if request.operation not in self.__operations:
+            return call_next(request)
+
+        key: tuple[str, str] = (request.operation, CoalescingMiddleware.request_key(request))
+
+        with self.__lock:
+            metrics = self.__metrics[request.operation]
+            metrics.requests += 1
+
+            cached = self.__cache.get(key)
+            if cached and cached[0] > time.monotonic():
+                self.__cache.move_to_end(key)
+                metrics.cache_hits += 1
+                return cached[1]
+
+            future = self.__in_flight.get(key)
+            leader: bool = future is None
+            if leader:
+                future = self.__in_flight[key] = Future()
+            else:
+                metrics.coalesced += 1
+
+        if not leader:
+            return future.result()
+
+        try:
+            response = call_next(request)
+        except BaseException as exception:
+            with self.__lock:
+                del self.__in_flight[key]
+            future.set_exception(exception)
+            raise
+
+        with self.__lock:
+            del self.__in_flight[key]
+            if self.__ttl_seconds > 0 and response.status_code in OK_STATUS_CODES_RANGE:
+                self.__store(key, response)
+        future.set_result(response)
+
+        return response
+
+    @staticmethod
+    def request_key(request: ApiRequest) -> str:
+        r"""Hashes what makes two requests identical: method, URL and serialized body.
+
+        :param request: The prepared request.
+        """
+        digest = hashlib.sha256()
+        for part in (request.method, request.url, request.data or ""):
+            digest.update(part.encode(UTF8) if isinstance(part, str) else part)
+            digest.update(b"\0")
+
+        return digest.hexdigest()
+
+    def __store(self, key: tuple[str, str], response: requests.Response) -> None:
+        self.__cache[key] = (time.monotonic() + self.__ttl_seconds, response)
+        self.__cache.move_to_end(key)
+
+        now = time.monotonic()
+        while self.__cache and (len(self.__cache) > self.__max_cached_responses or next(iter(self.__cache.values()))[0] <= now):
+            self.__cache.popitem(last=False)
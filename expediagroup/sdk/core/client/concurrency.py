@@ -0,0 +1,264 @@
+# Copyright 2022 Expedia, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import collections
+import contextlib
+import threading
+import time
+from collections.abc import AsyncIterator, Callable, Iterator
+from typing import Optional
+
+import requests
+
+from expediagroup.sdk.core.client.middleware import Handler, Middleware
+from expediagroup.sdk.core.constant import message
+from expediagroup.sdk.core.constant.constant import OVERLOAD_STATUS_CODES
+from expediagroup.sdk.core.model.api import ApiRequest
+from expediagroup.sdk.core.model.exception import client as client_exception
+
+
+class _Waiter:
+    r"""A caller queued for a concurrency slot, `notify` wakes it up once a slot has been granted to it."""
+
+    def __init__(self, notify: Callable[[], None]):
+        self.notify: Callable[[], None] = notify
+        self.granted: bool = False
+
+
+class Slot:
+    r"""A concurrency slot held by a single request.
+
+    Attributes:
+        overloaded (bool): Set when the request was rejected by the API as overloaded (HTTP 429/503).
+    """
+
+    def __init__(self):
+        self.overloaded: bool = False
+        self.start: float = time.monotonic()
+
+
+class AdaptiveConcurrencyLimiter:
+    def __init__(
+        self,
+        initial_limit: int = 20,
+        min_limit: int = 1,
+        max_limit: int = 200,
+        backoff_ratio: float = 0.9,
+        alpha: float = 3,
+        beta: float = 6,
+        latency_window: int = 500,
+        max_queue_size: int = 100,
+        queue_timeout_seconds: Optional[float] = 1.0,
+    ):
+        r"""Limits in-flight requests, tuning the limit from observed latency and overload responses.
+
+        The limit grows by one while the estimated number of requests queued at the API (Vegas, derived from the
+        ratio of the no-load latency to the current latency) stays under `alpha`, shrinks by one above `beta`, and is
+        multiplied by `backoff_ratio` on every overload response (AIMD). Callers above the limit wait in a bounded
+        queue and are shed with `ExpediaGroupConcurrencyLimitException` when it is full or their wait times out.
+
+        :param initial_limit: In-flight limit to start with.
+        :param min_limit: Lower bound of the limit.
+        :param max_limit: Upper bound of the limit.
+        :param backoff_ratio: Factor applied to the limit on overload responses.
+        :param alpha: Estimated API queue size under which the limit is increased.
+        :param beta: Estimated API queue size over which the limit is decreased.
+        :param latency_window: Number of samples after which the no-load latency is re-estimated.
+        :param max_queue_size: Maximum number of callers waiting for a slot, `0` sheds immediately.
+        :param queue_timeout_seconds: Maximum time a caller waits for a slot, `None` waits forever.
+        """
+        self.__limit: float = float(initial_limit)
+        self.__min_limit: int = min_limit
+        self.__max_limit: int = max_limit
+        self.__backoff_ratio: float = backoff_ratio
+        self.__alpha: float = alpha
+        self.__beta: float = beta
+        self.__latency_window: int = latency_window
+        self.__max_queue_size: int = max_queue_size
+        self.__queue_timeout_seconds: Optional[float] = queue_timeout_seconds
+
+        self.__in_flight: int = 0
+        self.__waiters: collections.deque[_Waiter] = collections.deque()
+        self.__no_load_latency: Optional[float] = None
+        self.__window_min_latency: float = float("inf")
+        self.__window_samples: int = 0
+        self.__lock = threading.Lock()
+
+    @property
+    def limit(self) -> int:
+        return int(self.__limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self.__in_flight
+
+    @property
+    def queued(self) -> int:
+        return len(self.__waiters)
+
+    def acquire(self) -> None:
+        r"""Blocks until a slot is available.
+
+        :raises ExpediaGroupConcurrencyLimitException: if the request is shed.
+        """
+        event = threading.Event()
+        waiter = self.__enqueue(event.set)
+        if not waiter:
+            return
+
+        if not event.wait(self.__queue_timeout_seconds):
+            self.__abandon(waiter)
+
+    async def acquire_async(self) -> None:
+        r"""Waits, without blocking the event loop, until a slot is available.
+
+        :raises ExpediaGroupConcurrencyLimitException: if the request is shed.
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+
+        def resolve():
+            if not future.done():
+                future.set_result(None)
+
+        waiter = self.__enqueue(lambda: loop.call_soon_threadsafe(resolve))
+        if not waiter:
+            return
+
+        try:
+            await asyncio.wait_for(future, self.__queue_timeout_seconds)
+        except asyncio.TimeoutError:
+            self.__abandon(waiter)
+        except asyncio.CancelledError:
+            with self.__lock:
+                granted = waiter.granted
+                if not granted:
+                    self.__waiters.remove(waiter)
+            if granted:
+                self.release()
+            raise
+
+    def release(self, latency: Optional[float] = None, overloaded: bool = False) -> None:
+        r"""Gives a slot back and feeds the outcome of its request to the limit.
+
+        :param latency: Request latency in seconds, `None` when the request did not complete.
+        :param overloaded: Whether the API rejected the request as overloaded.
+        """
+        with self.__lock:
+            in_flight = self.__in_flight
+            self.__in_flight -= 1
+
+            if overloaded:
+                self.__limit = max(self.__min_limit, self.__limit * self.__backoff_ratio)
+            elif latency:
+                self.__update_limit(latency, in_flight)
+
+            while self.__waiters and self.__in_flight < self.__limit:
+                waiter = self.__waiters.popleft()
+                waiter.granted = True
+                self.__in_flight += 1
+                waiter.notify()
+
+    @contextlib.contextmanager
+    def slot(self) -> Iterator[Slot]:
+        r"""Holds a slot for the duration of the block, releasing it with the observed latency."""
+        self.acquire()
+        slot = Slot()
+        try:
+            yield slot
+        except BaseException as exception:
+            self.release(overloaded=slot.overloaded or AdaptiveConcurrencyLimiter.is_overload(exception))
+            raise
+        self.release(latency=time.monotonic() - slot.start, overloaded=slot.overloaded)
+
+    @contextlib.asynccontextmanager
+    async def async_slot(self) -> AsyncIterator[Slot]:
+        r"""Asynchronous counterpart of `slot`."""
+        await self.acquire_async()
+        slot = Slot()
+        try:
+            yield slot
+        except BaseException as exception:
+            self.release(overloaded=slot.overloaded or AdaptiveConcurrencyLimiter.is_overload(exception))
+            raise
+        self.release(latency=time.monotonic() - slot.start, overloaded=slot.overloaded)
+
+    @staticmethod
+    def is_overload(exception: BaseException) -> bool:
+        r"""Checks whether an exception means the API is overloaded, i.e. an HTTP 429/503 error or a timeout.
+
+        :param exception: The exception raised by a request.
+        """
+        if isinstance(exception, requests.Timeout):
+            return True
+
+        return getattr(exception, "error_code", None) in OVERLOAD_STATUS_CODES
+
+    def __enqueue(self, notify: Callable[[], None]) -> Optional[_Waiter]:
+        with self.__lock:
+            if not self.__waiters and self.__in_flight < self.__limit:
+                self.__in_flight += 1
+                return None
+
+            if len(self.__waiters) >= self.__max_queue_size:
+                raise client_exception.ExpediaGroupConcurrencyLimitException(message.CONCURRENCY_LIMIT_QUEUE_FULL_TEMPLATE.format(len(self.__waiters)))
+
+            waiter = _Waiter(notify)
+            self.__waiters.append(waiter)
+            return waiter
+
+    def __abandon(self, waiter: _Waiter) -> None:
+        with self.__lock:
+            # The slot may have been granted right after the wait timed out, the caller keeps it then.
+            if waiter.granted:
+                return
+            self.__waiters.remove(waiter)
+
+        raise client_exception.ExpediaGroupConcurrencyLimitException(message.CONCURRENCY_LIMIT_QUEUE_TIMEOUT_TEMPLATE.format(self.__queue_timeout_seconds))
+
+    def __update_limit(self, latency: float, in_flight: int) -> None:
+        # The no-load latency follows the minimum of the latest window, so that it can recover from a slower baseline.
+        self.__window_min_latency = min(self.__window_min_latency, latency)
+        self.__window_samples += 1
+        if self.__no_load_latency is None or latency < self.__no_load_latency:
+            self.__no_load_latency = latency
+        if self.__window_samples >= self.__latency_window:
+            self.__no_load_latency = self.__window_min_latency
+            self.__window_min_latency = float("inf")
+            self.__window_samples = 0
+
+        estimated_queue: float = self.__limit * (1 - self.__no_load_latency / latency)
+
+        # Only grow when the limit is actually being used, an idle client says nothing about the API capacity.
+        if estimated_queue < self.__alpha and in_flight * 2 >= self.__limit:
+            self.__limit = min(self.__max_limit, self.__limit + 1)
+        elif estimated_queue > self.__beta:
+            self.__limit = max(self.__min_limit, self.__limit - 1)
+
+
+class ConcurrencyLimitMiddleware(Middleware):
+    def __init__(self, limiter: Optional[AdaptiveConcurrencyLimiter] = None):
+        r"""Runs every request within a slot of an `AdaptiveConcurrencyLimiter`.
+
+        :param limiter: The limiter to use, may be shared among clients. A default one is created if not provided.
+        """
+        self.limiter: AdaptiveConcurrencyLimiter = limiter if limiter else AdaptiveConcurrencyLimiter()
+
+    def __call__(self, request: ApiRequest, call_next: Handler) -> requests.Response:
+        with self.limiter.slot() as slot:
+            response = call_next(request)
+            slot.overloaded = response.status_code in OVERLOAD_STATUS_CODES
+
+        return response
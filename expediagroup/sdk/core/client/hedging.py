@@ -0,0 +1,214 @@
+# Copyright 2022 Expedia, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import collections
+import dataclasses
+import logging
+import math
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Optional
+
+import requests
+
+from expediagroup.sdk.core.client.middleware import Handler, Middleware
+from expediagroup.sdk.core.client.profiler import CallProfile
+from expediagroup.sdk.core.constant import log as log_constant
+from expediagroup.sdk.core.model.api import ApiRequest
+
+LOG = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class HedgingPolicy:
+    r"""Hedging settings of a single operation.
+
+    Attributes:
+        percentile (float): Latency percentile after which a hedge request is sent, e.g. `95.0` hedges the slowest 5%.
+        initial_delay_seconds (float): Hedge delay used until `min_samples` latencies have been observed.
+        min_delay_seconds (float): Lower bound of the computed hedge delay.
+        max_delay_seconds (float): Upper bound of the computed hedge delay.
+        min_samples (int): Number of observed latencies needed before the percentile is used.
+        window_size (int): Number of most recent latencies the percentile is computed over.
+    """
+
+    percentile: float = 95.0
+    initial_delay_seconds: float = 0.5
+    min_delay_seconds: float = 0.005
+    max_delay_seconds: float = 5.0
+    min_samples: int = 20
+    window_size: int = 1_000
+
+
+@dataclass
+class HedgingMetrics:
+    r"""Hedging counters of a single operation.
+
+    Attributes:
+        requests (int): Number of calls that went through hedging.
+        hedged (int): Number of calls for which a hedge request was sent.
+        hedge_wins (int): Number of hedged calls answered by the hedge request rather than the original one.
+    """
+
+    requests: int = 0
+    hedged: int = 0
+    hedge_wins: int = 0
+
+    @property
+    def hedge_rate(self) -> float:
+        return self.hedged / self.requests if self.requests else 0.0
+
+    @property
+    def win_rate(self) -> float:
+        return self.hedge_wins / self.hedged if self.hedged else 0.0
+
+
+class _LatencyTracker:
+    r"""Keeps a sliding window of latencies, and the hedge delay derived from it."""
+
+    def __init__(self, policy: HedgingPolicy):
+        self.__policy: HedgingPolicy = policy
+        self.__samples: collections.deque[float] = collections.deque(maxlen=policy.window_size)
+        self.__recorded_since_update: int = 0
+        self.__delay: float = policy.initial_delay_seconds
+        self.__refresh_interval: int = max(1, policy.window_size // 10)
+        self.__lock = threading.Lock()
+
+    @property
+    def delay(self) -> float:
+        return self.__delay
+
+    def record(self, latency: float) -> None:
+        with self.__lock:
+            self.__samples.append(latency)
+            self.__recorded_since_update += 1
+
+            samples_count: int = len(self.__samples)
+            if samples_count < self.__policy.min_samples:
+                return
+
+            # Sorting the window on every call is wasteful, the delay is refreshed every tenth of the window instead.
+            if samples_count > self.__policy.min_samples and self.__recorded_since_update < self.__refresh_interval:
+                return
+
+            self.__recorded_since_update = 0
+            samples = sorted(self.__samples)
+            index = min(samples_count - 1, max(0, math.ceil(self.__policy.percentile / 100 * samples_count) - 1))
+            self.__delay = min(self.__policy.max_delay_seconds, max(self.__policy.min_delay_seconds, samples[index]))
+
+
+class HedgingMiddleware(Middleware):
+    def __init__(self, operations: dict[str, HedgingPolicy], max_workers: Optional[int] = None):
+        r"""Sends a second, identical request when the first one is slower than the configured latency percentile.
+
+        The first response to arrive wins, the other request is cancelled if it has not started yet, otherwise its
+        response is discarded. Only requests issued by operations flagged as safe to duplicate are hedged. The profile
+        of a profiled call only holds the transport phases of the winning attempt.
+
+        :param operations: Hedging policies, keyed by client operation name (e.g. `screen_account`).
+        :param max_workers: Maximum number of threads used to send hedged requests.
+        """
+        self.__policies: dict[str, HedgingPolicy] = dict(operations)
+        self.__trackers: dict[str, _LatencyTracker] = {operation: _LatencyTracker(policy) for operation, policy in self.__policies.items()}
+        self.__metrics: dict[str, HedgingMetrics] = {operation: HedgingMetrics() for operation in self.__policies.keys()}
+        self.__executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="expediagroup-sdk-hedging")
+        self.__warned_operations: set[str] = set()
+        self.__lock = threading.Lock()
+
+    def metrics(self, operation: str) -> HedgingMetrics:
+        r"""Returns a snapshot of the hedging counters of an operation.
+
+        :param operation: Client operation name.
+        """
+        with self.__lock:
+            return dataclasses.replace(self.__metrics.get(operation, HedgingMetrics()))
+
+    def close(self) -> None:
+        r"""Stops the threads sending hedged requests, without waiting for the attempts in progress.
+
+        Attempts that have not started yet are cancelled. Operations with a hedging policy cannot be called afterwards.
+        """
+        self.__executor.shutdown(wait=False, cancel_futures=True)
+
+    def __enter__(self) -> "HedgingMiddleware":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __call__(self, request: ApiRequest, call_next: Handler) -> requests.Response:
+        tracker = self.__trackers.get(request.operation)
+        if not tracker:
+            return call_next(request)
+
+        if not request.safe_to_duplicate:
+            with self.__lock:
+                warned: bool = request.operation in self.__warned_operations
+                self.__warned_operations.add(request.operation)
+            if not warned:
+                LOG.warning(log_constant.EXPEDIAGROUP_LOG_MESSAGE_TEMPLATE.format(log_constant.HEDGING_NOT_SAFE_TEMPLATE.format(request.operation)))
+            return call_next(request)
+
+        # Each attempt is profiled on its own, the call only keeps the phases of the attempt whose response it returns.
+        profile: Optional[CallProfile] = request.profile
+        attempts: dict[Future, Optional[CallProfile]] = dict()
+
+        primary_profile: Optional[CallProfile] = profile.attempt() if profile else None
+        primary: Future = self.__executor.submit(self.__attempt, tracker, dataclasses.replace(request, profile=primary_profile), call_next)
+        attempts[primary] = primary_profile
+        done, _ = wait([primary], timeout=tracker.delay)
+
+        hedged: bool = not done
+        if hedged:
+            hedge_profile: Optional[CallProfile] = profile.attempt() if profile else None
+            hedge_request: ApiRequest = dataclasses.replace(request, headers=dict(request.headers), profile=hedge_profile)
+            attempts[self.__executor.submit(self.__attempt, tracker, hedge_request, call_next)] = hedge_profile
+
+        winner: Future = self.__first_successful(list(attempts.keys()))
+        for future in attempts.keys():
+            if future is not winner:
+                future.cancel()
+
+        if profile:
+            profile.merge(attempts[winner])
+
+        with self.__lock:
+            metrics = self.__metrics[request.operation]
+            metrics.requests += 1
+            metrics.hedged += hedged
+            metrics.hedge_wins += hedged and winner is not primary
+
+        return winner.result()
+
+    @staticmethod
+    def __first_successful(futures: list[Future]) -> Future:
+        pending = set(futures)
+        while True:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if not future.exception():
+                    return future
+
+            # A failed attempt only wins when there is nothing else left to wait for.
+            if not pending:
+                return done.pop()
+
+    @staticmethod
+    def __attempt(tracker: _LatencyTracker, request: ApiRequest, call_next: Handler) -> requests.Response:
+        start = time.monotonic()
+        response = call_next(request)
+        tracker.record(time.monotonic() - start)
+        return response
@@ -0,0 +1,52 @@
+# Copyright 2022 Expedia, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import abc
+import functools
+from collections.abc import Callable, Sequence
+
+import requests
+
+from expediagroup.sdk.core.model.api import ApiRequest
+
+Handler = Callable[[ApiRequest], requests.Response]
+
+
+class Middleware(abc.ABC):
+    r"""A stage wrapped around the `ApiClient` transport.
+
+    Middlewares receive a prepared `ApiRequest` and the next handler in the chain. They may alter the request,
+    short-circuit it by returning a response of their own, or post-process the response returned by `call_next`.
+    Response models are built only after the whole chain returns, so middlewares always deal with raw responses.
+    """
+
+    @abc.abstractmethod
+    def __call__(self, request: ApiRequest, call_next: Handler) -> requests.Response:
+        pass
+
+
+def build_handler(middlewares: Sequence[Middleware], handler: Handler) -> Handler:
+    r"""Composes middlewares around a terminal handler, first middleware being the outermost one.
+
+    Args:
+        middlewares (Sequence[Middleware]): Middlewares to install, in order of execution.
+        handler (Handler): Terminal handler that sends the request.
+
+    Returns:
+        Handler: The terminal handler itself when no middleware is installed, the composed chain otherwise.
+    """
+    for middleware in reversed(middlewares):
+        handler = functools.partial(middleware, call_next=handler)
+
+    return handler
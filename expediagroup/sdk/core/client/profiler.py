@@ -0,0 +1,291 @@
+# Copyright 2022 Expedia, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from expediagroup.sdk.core.constant import log as log_constant
+
+LOG = logging.getLogger(__name__)
+
+SERIALIZE: str = "serialize"
+HEADERS: str = "headers"
+MIDDLEWARES: str = "middlewares"
+TOKEN_REFRESH: str = "token_refresh"
+NETWORK: str = "network"
+READ: str = "read"
+LOG_EXCHANGE: str = "log"
+DECODE: str = "decode"
+TOTAL: str = "total"
+
+# Phases of a call, in the order they run. `middlewares` is the time spent in the chain outside of the transport.
+PHASES: tuple[str, ...] = (SERIALIZE, HEADERS, MIDDLEWARES, TOKEN_REFRESH, NETWORK, READ, LOG_EXCHANGE, DECODE)
+
+# Phases timed by the transport, at the end of the middleware chain.
+TRANSPORT_PHASES: tuple[str, ...] = (TOKEN_REFRESH, NETWORK, READ, LOG_EXCHANGE)
+
+# Each power of two of nanoseconds is split in this many buckets, which bounds the error of a percentile to 25%.
+_SUB_BUCKETS_BITS: int = 2
+_SUB_BUCKETS: int = 1 << _SUB_BUCKETS_BITS
+_BUCKETS: int = 64 * _SUB_BUCKETS
+
+
+class CallProfile:
+    r"""Phase durations of a single call, in nanoseconds.
+
+    Attributes:
+        operation (Optional[str]): Name of the client operation, if any.
+        start_ns (int): `time.perf_counter_ns()` when the call started.
+        end_ns (int): `time.perf_counter_ns()` when the call ended, `0` while it is in progress.
+        phases (dict[str, int]): Duration of each phase which ran, by name. Transport phases are those of the attempt
+            whose response the call returned, for a call sent several times (e.g. hedged).
+        status_code (Optional[int]): HTTP status code of the response, `None` if none was received.
+        error (Optional[str]): Class name of the exception the call raised, if any.
+    """
+
+    __slots__ = ("operation", "start_ns", "end_ns", "phases", "status_code", "error")
+
+    def __init__(self, operation: Optional[str]):
+        self.operation: Optional[str] = operation
+        self.start_ns: int = time.perf_counter_ns()
+        self.end_ns: int = 0
+        self.phases: dict[str, int] = dict()
+        self.status_code: Optional[int] = None
+        self.error: Optional[str] = None
+
+    def add(self, phase: str, since_ns: int) -> int:
+        r"""Records a phase which started at a given time and ends now.
+
+        :param phase: Phase name.
+        :param since_ns: `time.perf_counter_ns()` when the phase started.
+
+        :return: the current `time.perf_counter_ns()`, where the next phase starts.
+        :rtype: int
+        """
+        now: int = time.perf_counter_ns()
+        self.phases[phase] = self.phases.get(phase, 0) + now - since_ns
+        return now
+
+    def attempt(self) -> "CallProfile":
+        r"""Starts the profile of an attempt, for middlewares sending a request several times.
+
+        Attempts record their transport phases apart from each other and from the call, so that attempts running
+        concurrently or outliving the call never touch its profile. The phases of the attempt whose response the call
+        returns are then added to the call with `merge`, the phases of the other attempts are dropped.
+        """
+        return CallProfile(self.operation)
+
+    def merge(self, attempt: "CallProfile") -> None:
+        r"""Adds the phase durations of an attempt, started with `attempt`, to this profile.
+
+        :param attempt: The profile of the attempt, which must have completed.
+        """
+        for phase, duration_ns in attempt.phases.items():
+            self.phases[phase] = self.phases.get(phase, 0) + duration_ns
+
+    def add_middlewares(self, since_ns: int) -> int:
+        r"""Records the time spent in the middleware chain since a given time, transport phases excluded.
+
+        :param since_ns: `time.perf_counter_ns()` when the request entered the chain.
+
+        :return: the current `time.perf_counter_ns()`, where the next phase starts.
+        :rtype: int
+        """
+        now: int = time.perf_counter_ns()
+        transport: int = sum(self.phases.get(phase, 0) for phase in TRANSPORT_PHASES)
+        self.phases[MIDDLEWARES] = self.phases.get(MIDDLEWARES, 0) + max(0, now - since_ns - transport)
+        return now
+
+    @property
+    def total_ns(self) -> int:
+        return self.end_ns - self.start_ns if self.end_ns else 0
+
+
+@dataclass(frozen=True)
+class PhaseSummary:
+    r"""Aggregated durations of a phase, percentiles are estimated from a histogram.
+
+    Attributes:
+        count (int): Number of calls the phase ran in.
+        mean_us (float): Mean duration, in microseconds.
+        p50_us (float): Median duration, in microseconds.
+        p99_us (float): 99th percentile of the duration, in microseconds.
+        max_us (float): Longest duration, in microseconds.
+    """
+
+    count: int
+    mean_us: float
+    p50_us: float
+    p99_us: float
+    max_us: float
+
+
+class _Histogram:
+    r"""Counts durations in log-linear buckets: a fixed memory, whatever the number and the range of durations."""
+
+    __slots__ = ("buckets", "count", "total_ns", "max_ns")
+
+    def __init__(self):
+        self.buckets: list[int] = [0] * _BUCKETS
+        self.count: int = 0
+        self.total_ns: int = 0
+        self.max_ns: int = 0
+
+    def record(self, duration_ns: int) -> None:
+        self.buckets[min(_Histogram.bucket(duration_ns), _BUCKETS - 1)] += 1
+        self.count += 1
+        self.total_ns += duration_ns
+        self.max_ns = max(self.max_ns, duration_ns)
+
+    def merge(self, other: "_Histogram") -> None:
+        self.buckets = [count + other_count for count, other_count in zip(self.buckets, other.buckets)]
+        self.count += other.count
+        self.total_ns += other.total_ns
+        self.max_ns = max(self.max_ns, other.max_ns)
+
+    def percentile(self, percentile: float) -> int:
+        r"""Returns the upper bound of the bucket holding a percentile, capped by the longest duration."""
+        rank: float = self.count * percentile / 100
+        seen: int = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if count and seen >= rank:
+                return min(_Histogram.lower_bound(index + 1) - 1, self.max_ns)
+
+        return self.max_ns
+
+    def summary(self) -> PhaseSummary:
+        return PhaseSummary(
+            count=self.count,
+            mean_us=self.total_ns / self.count / 1e3 if self.count else 0.0,
+            p50_us=self.percentile(50) / 1e3,
+            p99_us=self.percentile(99) / 1e3,
+            max_us=self.max_ns / 1e3,
+        )
+
+    @staticmethod
+    def bucket(duration_ns: int) -> int:
+        if duration_ns < _SUB_BUCKETS:
+            return max(0, duration_ns)
+
+        # The highest bit picks the power of two, the next bits pick the sub-bucket within it.
+        exponent: int = duration_ns.bit_length() - 1
+        sub_bucket: int = (duration_ns >> (exponent - _SUB_BUCKETS_BITS)) & (_SUB_BUCKETS - 1)
+        return (exponent - _SUB_BUCKETS_BITS + 1) * _SUB_BUCKETS + sub_bucket
+
+    @staticmethod
+    def lower_bound(index: int) -> int:
+        if index < _SUB_BUCKETS:
+            return index
+
+        exponent: int = index // _SUB_BUCKETS + _SUB_BUCKETS_BITS - 1
+        return (_SUB_BUCKETS + index % _SUB_BUCKETS) << (exponent - _SUB_BUCKETS_BITS)
+
+
+class CallProfiler:
+    def __init__(self, capacity: int = 1024, summary_interval_seconds: Optional[float] = None):
+        r"""Records the phase durations of `ApiClient` calls, to tell where the time of slow calls went.
+
+        The profiles of the latest calls are kept in a ring buffer, and the durations of every call are aggregated in
+        histograms of fixed size, per operation and phase. Profiling is opt-in through `ClientConfig(profiler=...)`,
+        clients without a profiler only pay for a few `None` checks per call.
+
+        :param capacity: Number of latest call profiles kept.
+        :param summary_interval_seconds: Interval at which a summary of the histograms is logged at INFO level, at the
+            end of a call. `None` never logs.
+        """
+        if capacity < 1:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+
+        self.__capacity: int = capacity
+        self.__summary_interval_seconds: Optional[float] = summary_interval_seconds
+        self.__lock = threading.Lock()
+        self.reset()
+
+    def begin(self, operation: Optional[str]) -> CallProfile:
+        r"""Starts the profile of a call.
+
+        :param operation: Name of the client operation, if any.
+        """
+        return CallProfile(operation)
+
+    def end(self, profile: CallProfile) -> None:
+        r"""Ends the profile of a call, storing it in the ring buffer and aggregating its durations."""
+        profile.end_ns = time.perf_counter_ns()
+        summary_due: bool = False
+
+        with self.__lock:
+            self.__profiles[self.__recorded % self.__capacity] = profile
+            self.__recorded += 1
+
+            histograms = self.__histograms.get(profile.operation)
+            if histograms is None:
+                histograms = self.__histograms[profile.operation] = {phase: _Histogram() for phase in (*PHASES, TOTAL)}
+            for phase, duration_ns in profile.phases.items():
+                histograms[phase].record(duration_ns)
+            histograms[TOTAL].record(profile.total_ns)
+
+            if self.__summary_interval_seconds is not None and profile.end_ns - self.__last_summary_ns >= self.__summary_interval_seconds * 1e9:
+                self.__last_summary_ns = profile.end_ns
+                summary_due = True
+
+        if summary_due and LOG.isEnabledFor(logging.INFO):
+            LOG.info(log_constant.EXPEDIAGROUP_LOG_MESSAGE_TEMPLATE.format(self.report()))
+
+    def recent(self) -> list[CallProfile]:
+        r"""Returns the profiles kept in the ring buffer, oldest first."""
+        with self.__lock:
+            if self.__recorded <= self.__capacity:
+                return list(self.__profiles[: self.__recorded])
+
+            start: int = self.__recorded % self.__capacity
+            return self.__profiles[start:] + self.__profiles[:start]
+
+    def summary(self, operation: Optional[str] = None) -> dict[str, PhaseSummary]:
+        r"""Returns the aggregated durations of each phase, and of whole calls under `total`.
+
+        :param operation: Client operation name, `None` aggregates all the operations.
+
+        :return: summaries by phase, in the order phases run.
+        :rtype: dict[str, PhaseSummary]
+        """
+        merged: dict[str, _Histogram] = dict()
+        with self.__lock:
+            for histograms_operation, histograms in self.__histograms.items():
+                if operation is not None and histograms_operation != operation:
+                    continue
+                for phase, histogram in histograms.items():
+                    if histogram.count:
+                        merged.setdefault(phase, _Histogram()).merge(histogram)
+
+        return {phase: merged[phase].summary() for phase in (*PHASES, TOTAL) if phase in merged}
+
+    def report(self) -> str:
+        r"""Formats the summary of all the operations, a line per phase."""
+        lines: list[str] = [log_constant.CALL_PROFILE_SUMMARY_TEMPLATE.format(self.__recorded)]
+        for phase, summary in self.summary().items():
+            lines.append(log_constant.CALL_PROFILE_PHASE_TEMPLATE.format(phase, summary.count, summary.mean_us, summary.p50_us, summary.p99_us, summary.max_us))
+
+        return "\n".join(lines)
+
+    def reset(self) -> None:
+        r"""Drops the kept profiles and the aggregated durations."""
+        with self.__lock:
+            self.__profiles: list[Optional[CallProfile]] = [None] * self.__capacity
+            self.__recorded: int = 0
+            self.__histograms: dict[Optional[str], dict[str, _Histogram]] = dict()
+            self.__last_summary_ns: int = time.perf_counter_ns()
@@ -0,0 +1,103 @@
+# Copyright 2022 Expedia, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import dataclasses
+import logging
+import random
+import threading
+from dataclasses import dataclass
+from typing import Optional
+
+import pydantic
+import requests
+
+from expediagroup.sdk.core.client.middleware import Handler, Middleware
+from expediagroup.sdk.core.constant import log as log_constant
+from expediagroup.sdk.core.model.api import ApiRequest, PreparedBody, _type_adapter
+
+LOG = logging.getLogger(__name__)
+
+
+@dataclass
+class SchemaCheckMetrics:
+    r"""Schema check counters of a single operation.
+
+    Attributes:
+        unchecked (int): Number of passed through bodies which were not sampled.
+        checked (int): Number of passed through bodies validated against their request model.
+        failed (int): Number of checked bodies which are not valid for their request model.
+    """
+
+    unchecked: int = 0
+    checked: int = 0
+    failed: int = 0
+
+    @property
+    def failure_rate(self) -> float:
+        return self.failed / self.checked if self.checked else 0.0
+
+
+class SchemaCheckMiddleware(Middleware):
+    def __init__(self, sample_rate: float, raise_on_failure: bool = False, seed: Optional[int] = None):
+        r"""Validates a sample of the request bodies passed through without validation against their request model.
+
+        Passed through bodies skip validation to save its cost, a sample of them is still checked so that a producer
+        drifting away from the schema gets noticed. Failures are logged without the offending values, which may be
+        sensitive. Bodies of models, and bodies already validated when prepared, are never checked twice.
+
+        :param sample_rate: Fraction of the passed through bodies to check, between `0` and `1`.
+        :param raise_on_failure: Whether to raise the validation error of a failed check instead of sending the request.
+        :param seed: Seed of the sampling, for reproducible samples.
+        """
+        self.__sample_rate: float = sample_rate
+        self.__raise_on_failure: bool = raise_on_failure
+        self.__random = random.Random(seed)
+        self.__metrics: dict[Optional[str], SchemaCheckMetrics] = dict()
+        self.__lock = threading.Lock()
+
+    def metrics(self, operation: Optional[str]) -> SchemaCheckMetrics:
+        r"""Returns a snapshot of the schema check counters of an operation.
+
+        :param operation: Client operation name.
+        """
+        with self.__lock:
+            return dataclasses.replace(self.__metrics.get(operation, SchemaCheckMetrics()))
+
+    def __call__(self, request: ApiRequest, call_next: Handler) -> requests.Response:
+        body = request.body
+        if not isinstance(body, PreparedBody) or body.validated or body.model is None:
+            return call_next(request)
+
+        if self.__random.random() >= self.__sample_rate:
+            self.__count(request.operation, checked=False, failed=False)
+            return call_next(request)
+
+        try:
+            _type_adapter(body.model).validate_json(body.content)
+        except pydantic.ValidationError as error:
+            self.__count(request.operation, checked=True, failed=True)
+            locations = ", ".join(f"{'.'.join(str(part) for part in detail['loc'])} ({detail['type']})" for detail in error.errors(include_input=False))
+            LOG.warning(log_constant.EXPEDIAGROUP_LOG_MESSAGE_TEMPLATE.format(log_constant.SCHEMA_CHECK_FAILED_TEMPLATE.format(request.operation, locations)))
+            if self.__raise_on_failure:
+                raise
+        else:
+            self.__count(request.operation, checked=True, failed=False)
+
+        return call_next(request)
+
+    def __count(self, operation: Optional[str], checked: bool, failed: bool) -> None:
+        with self.__lock:
+            metrics = self.__metrics.setdefault(operation, SchemaCheckMetrics())
+            metrics.unchecked += not checked
+            metrics.checked += checked
+            metrics.failed += failed
@@ -12,9 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Optional
 
+from expediagroup.sdk.core.client.middleware import Middleware
+from expediagroup.sdk.core.client.profiler import CallProfiler
 from expediagroup.sdk.core.configuration.auth_config import AuthConfig
 from expediagroup.sdk.core.constant import constant, message, url
 from expediagroup.sdk.core.model.authentication import Credentials
@@ -32,6 +35,8 @@ class ClientConfig:
         endpoint: Optional[str] = url.ENDPOINT,
         request_timeout_milliseconds: Optional[float] = constant.TEN_SECONDS_MILLISECONDS,
         auth_endpoint: Optional[str] = url.AUTH_ENDPOINT,
+        middlewares: Optional[Sequence[Middleware]] = None,
+        profiler: Optional[CallProfiler] = None,
     ):
         r"""SDK Client Configurations Holder.
 
@@ -40,10 +45,14 @@ class ClientConfig:
         :param endpoint: An optional API endpoint to use for requests.
         :param request_timeout_milliseconds: Request timeout to be used in milliseconds.
         :param auth_endpoint: An optional API endpoint to use for authentication.
+        :param middlewares: Optional middlewares wrapped around every API call, first one being the outermost.
+        :param profiler: Optional profiler recording the phase durations of every API call.
         """
         self.__auth_config = AuthConfig(Credentials(key, secret), auth_endpoint)
         self.__endpoint = endpoint
         self.__request_timeout = float(request_timeout_milliseconds / 1000)
+        self.__middlewares: tuple[Middleware, ...] = tuple(middlewares) if middlewares else tuple()
+        self.__profiler: Optional[CallProfiler] = profiler
 
         self.__post_init__()
 
@@ -62,3 +71,11 @@ class ClientConfig:
     @property
     def request_timeout(self) -> float:
         return self.__request_timeout
+
+    @property
+    def middlewares(self) -> tuple[Middleware, ...]:
+        return self.__middlewares
+
+    @property
+    def profiler(self) -> Optional[CallProfiler]:
+        return self.__profiler
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from http import HTTPStatus
+
 EMPTY_STRING: str = ""
 
 REFRESH_TOKEN_TIME_GAP_IN_SECONDS: int = 10
@@ -20,6 +22,8 @@ TEN_SECONDS_MILLISECONDS: float = 10_000.0
 
 OK_STATUS_CODES_RANGE = range(200, 300)
 
+OVERLOAD_STATUS_CODES: frozenset[int] = frozenset({HTTPStatus.TOO_MANY_REQUESTS, HTTPStatus.SERVICE_UNAVAILABLE})
+
 RAPID_TOKEN_LIFE_SPAN_IN_SECONDS = 300
 
 UTF8 = "utf-8"
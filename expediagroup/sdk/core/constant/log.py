@@ -25,6 +25,22 @@ UNSUCCESSFUL_RESPONSE_MESSAGE_TEMPLATE: str = "Unsuccessful response [{0}]"
 
 NEW_TOKEN_EXPIRATION_TEMPLATE: str = "New token expires in {0} seconds"
 
+HEDGING_NOT_SAFE_TEMPLATE: str = "Hedging is configured for operation [{0}], which is not safe to duplicate, requests will not be hedged"
+
+SCHEMA_CHECK_FAILED_TEMPLATE: str = "Passed through body of operation [{0}] does not match its request model at: {1}"
+
+CALL_PROFILE_SUMMARY_TEMPLATE: str = "Call profile over {0} calls:"
+
+CALL_PROFILE_PHASE_TEMPLATE: str = "\t{0:<13} count {1:>8}, mean {2:10.1f} us, p50 {3:10.1f} us, p99 {4:10.1f} us, max {5:10.1f} us"
+
+OMITTED_LOG_VALUE: str = "<-- omitted -->"
+
+OMITTED_LOG_FIELDS_ATTRIBUTE: str = "__omitted_log_fields__"
+
+HTTP_BODY_LOG_MAX_BYTES: int = 16 * 1024
+
+HTTP_BODY_TRUNCATED_LOG_MESSAGE_TEMPLATE: str = "... <{0} more bytes omitted>"
+
 HTTP_HEADERS_LOG_MESSAGE_TEMPLATE: str = dedent(
     """\tHeaders:
     \t--- BEGIN ---
@@ -17,3 +17,7 @@ UNABLE_TO_AUTHENTICATE: str = "Unable to authenticate"
 NONE_VALUE_NOT_ALLOWED = "None value not allowed"
 
 NONE_VALUE_NOT_ALLOWED_FOR_MESSAGE_TEMPLATE = "None value not allowed for {0}"
+
+CONCURRENCY_LIMIT_QUEUE_FULL_TEMPLATE = "Request shed, {0} requests are already waiting for a concurrency slot"
+
+CONCURRENCY_LIMIT_QUEUE_TIMEOUT_TEMPLATE = "Request shed, no concurrency slot freed up within {0} seconds"
@@ -12,10 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import dataclasses
+import functools
 import json
-from typing import Any
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any, Optional, Union
 
-from pydantic import BaseModel, Field
+import pydantic_core
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class RequestHeaders(BaseModel):
@@ -44,3 +49,161 @@ class RequestHeaders(BaseModel):
             return dict()
 
         return json.loads(self.model_dump_json()).get("headers")
+
+
+# Types serialized as they are, checked first since most values of a body are of one of them.
+_SCALAR_TYPES: frozenset[type] = frozenset((str, int, float, bool))
+
+
+@functools.lru_cache(maxsize=None)
+def _type_adapter(model: Any) -> TypeAdapter:
+    # Building a `TypeAdapter` compiles a validator, which is far more expensive than validating a response.
+    return TypeAdapter(model)
+
+
+def _without_none(value: Any) -> Any:
+    # Mirrors `model_dump_json(exclude_none=True)`, for data that never went through a model.
+    value_type = type(value)
+    if value_type in _SCALAR_TYPES:
+        return value
+    if value_type is dict or isinstance(value, Mapping):
+        return {key: _without_none(item) for key, item in value.items() if item is not None}
+    if value_type is list or isinstance(value, tuple):
+        return [_without_none(item) for item in value]
+    if isinstance(value, BaseModel):
+        return value.model_dump(exclude_none=True)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {item.name: _without_none(getattr(value, item.name)) for item in dataclasses.fields(value) if getattr(value, item.name) is not None}
+
+    return value
+
+
+# Request bodies passed through as they are, either pre-serialized JSON or a mapping holding the wire representation.
+RawBody = Union[bytes, bytearray, Mapping[str, Any]]
+
+
+@dataclass(frozen=True)
+class PreparedBody:
+    r"""A request body serialized straight from plain data, without building the request model.
+
+    Meant for data that has already been validated, e.g. records of an internal service or JSON received from an
+    upstream service: building and validating a model of every nested object is skipped, the data is serialized to
+    JSON as is, minus `None` values, like models are. The data must therefore hold the wire representation of the
+    request, defaults included.
+
+    Attributes:
+        model (Any): The request model the data conforms to, or a union of models, used to mask sensitive fields in logs.
+        content (bytes): The serialized body, sent as is.
+        validated (bool): Whether the data was validated against the model.
+    """
+
+    model: Any
+    content: bytes
+    validated: bool = False
+
+    @staticmethod
+    def of(model: Any, data: Union[RawBody, Any], validate: bool = False) -> "PreparedBody":
+        r"""Serializes a request body from a mapping or a dataclass, or wraps an already serialized one.
+
+        :param model: The request model the data conforms to, or a union of models.
+        :param data: The request data, a mapping or a dataclass, possibly nesting enums, dates and other dataclasses,
+            or JSON bytes which are sent unchanged.
+        :param validate: Whether to validate the data against the model first, and serialize the validated model.
+            JSON bytes are only checked, and still sent unchanged.
+
+        :return: the prepared body.
+        :rtype: PreparedBody
+        """
+        if isinstance(data, (bytes, bytearray)):
+            if validate:
+                _type_adapter(model).validate_json(data)
+            return PreparedBody(model=model, content=bytes(data), validated=validate)
+
+        if validate:
+            adapter: TypeAdapter = _type_adapter(model)
+            return PreparedBody(model=model, content=adapter.dump_json(adapter.validate_python(_without_none(data)), exclude_none=True), validated=True)
+
+        return PreparedBody(model=model, content=pydantic_core.to_json(_without_none(data)))
+
+
+def _validate_response(content: Union[bytes, bytearray], response_models: list[Any]) -> Any:
+    # The first model the content is valid for wins, `None` when there is none.
+    for model in response_models:
+        if not model:
+            continue
+        try:
+            return _type_adapter(model).validate_json(content)
+        except Exception:
+            continue
+
+    return None
+
+
+# Marks a `RawResponse` which has not been decoded yet, `None` being a valid decoding.
+_UNDECODED: Any = object()
+
+
+@dataclass
+class RawResponse:
+    r"""A successful response whose body is handed out as received, and decoded to a response model on demand only.
+
+    Attributes:
+        status_code (int): HTTP status code.
+        headers (Mapping[str, str]): Response headers.
+        content (Union[bytes, bytearray]): The raw JSON body.
+        response_models (list[Any]): Models to decode the body into, the first valid one wins.
+    """
+
+    status_code: int
+    headers: Mapping[str, str]
+    content: Union[bytes, bytearray]
+    response_models: list[Any] = field(default_factory=list)
+    __decoded: Any = field(default=_UNDECODED, init=False, repr=False, compare=False)
+
+    def json(self) -> Any:
+        r"""Parses the body to plain Python objects, without validating it.
+
+        :return: the parsed body.
+        :rtype: Any
+        """
+        return pydantic_core.from_json(self.content)
+
+    def decode(self) -> Any:
+        r"""Validates the body against the response models on first call, later calls return the same object.
+
+        :return: the response object, `None` if the body is valid for none of the response models.
+        :rtype: Any
+        """
+        if self.__decoded is _UNDECODED:
+            self.__decoded = _validate_response(self.content, self.response_models)
+
+        return self.__decoded
+
+
+@dataclass
+class ApiRequest:
+    r"""A prepared request as it travels through the `ApiClient` middleware chain.
+
+    Attributes:
+        method (str): Upper-cased HTTP request method.
+        url (str): URL used to send the request.
+        headers (dict[str, Any]): Final request headers, auth header excluded.
+        body (Union[BaseModel, PreparedBody, None]): Object that holds request data, raw bodies come as a `PreparedBody`.
+        data (Union[str, bytes, None]): Serialized request body sent on the wire.
+        response_models (list[Any]): Models to fetch the response data into.
+        error_responses (dict[int, Any]): Deserialization contracts of error responses, keyed by status code.
+        operation (Optional[str]): Name of the client operation issuing the request, if any.
+        safe_to_duplicate (bool): Whether sending the request more than once is harmless.
+        profile (Optional[CallProfile]): Phase durations of the call, set when the client profiles its calls.
+    """
+
+    method: str
+    url: str
+    headers: dict[str, Any]
+    body: Union[BaseModel, PreparedBody, None] = None
+    data: Union[str, bytes, None] = None
+    response_models: list[Any] = field(default_factory=list)
+    error_responses: dict[int, Any] = field(default_factory=dict)
+    operation: Optional[str] = None
+    safe_to_duplicate: bool = False
+    profile: Optional[Any] = None
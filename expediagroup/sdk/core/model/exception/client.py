@@ -25,3 +25,8 @@ class ExpediaGroupClientException(ExpediaGroupException):
 class ExpediaGroupConfigurationException(ExpediaGroupClientException):
     def __init__(self, message: str, cause: Optional[BaseException] = None):
         super().__init__(message, cause)
+
+
+class ExpediaGroupConcurrencyLimitException(ExpediaGroupClientException):
+    def __init__(self, message: str, cause: Optional[BaseException] = None):
+        super().__init__(message, cause)
@@ -20,14 +20,15 @@ from expediagroup.sdk.core.model.exception.expediagroup import ExpediaGroupExcep
 
 
 class ExpediaGroupApiException(ExpediaGroupException):
-    def __init__(self, message: str, cause: Optional[BaseException] = None):
+    def __init__(self, message: str, cause: Optional[BaseException] = None, error_code: Optional[HTTPStatus] = None):
         super().__init__(message, cause)
+        self.error_code: Optional[HTTPStatus] = error_code
 
-    @staticmethod
-    def of(error: Error, error_code: HTTPStatus):
-        return ExpediaGroupApiException(message=f"[{error_code.value}] {error}")
+    @classmethod
+    def of(cls, error: Error, error_code: HTTPStatus):
+        return cls(message=f"[{error_code.value}] {error}", error_code=error_code)
 
 
 class ExpediaGroupAuthException(ExpediaGroupApiException):
     def __init__(self, error_code: HTTPStatus, message: str):
-        super().__init__(message=f"[{error_code.value}] {message}")
+        super().__init__(message=f"[{error_code.value}] {message}", error_code=error_code)
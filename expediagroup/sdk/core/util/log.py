@@ -12,11 +12,164 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
+import typing
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+from typing import Any, Optional
+
 import requests
+from pydantic import BaseModel
 
 from expediagroup.sdk.core.constant import constant, log
 
 
+@dataclass(frozen=True)
+class _LogMaskPlan:
+    r"""Fields of a model to mask when logging, and fields that may hold models having fields to mask."""
+
+    omitted: frozenset[str]
+    nested: tuple[str, ...]
+
+
+_log_mask_plans: dict[type, _LogMaskPlan] = dict()
+
+
+def _models(annotation: Any) -> Iterator[type[BaseModel]]:
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        # A field may hold any subclass of the declared model.
+        yield annotation
+        subclasses = annotation.__subclasses__()
+        while subclasses:
+            subclass = subclasses.pop()
+            yield subclass
+            subclasses.extend(subclass.__subclasses__())
+
+    for argument in typing.get_args(annotation):
+        yield from _models(argument)
+
+
+def _log_mask_plan(model: type[BaseModel], planning: frozenset[type] = frozenset()) -> _LogMaskPlan:
+    plan = _log_mask_plans.get(model)
+    if plan:
+        return plan
+
+    planning = planning | {model}
+    omitted: frozenset[str] = frozenset(getattr(model, log.OMITTED_LOG_FIELDS_ATTRIBUTE, frozenset()))
+    nested: list[str] = list()
+    for name, field in model.model_fields.items():
+        if name in omitted:
+            continue
+        # Models being planned are part of a cycle, they are assumed to hold fields to mask.
+        if any(candidate in planning or _has_omitted_fields(_log_mask_plan(candidate, planning)) for candidate in _models(field.annotation)):
+            nested.append(name)
+
+    plan = _LogMaskPlan(omitted=omitted, nested=tuple(nested))
+    if len(planning) == 1:
+        _log_mask_plans[model] = plan
+
+    return plan
+
+
+def _has_omitted_fields(plan: _LogMaskPlan) -> bool:
+    return bool(plan.omitted or plan.nested)
+
+
+def _mask(value: Any, data: Any) -> None:
+    if isinstance(value, BaseModel):
+        plan = _log_mask_plan(type(value))
+        for name in plan.omitted:
+            if data.get(name) is not None:
+                data[name] = log.OMITTED_LOG_VALUE
+        for name in plan.nested:
+            _mask(getattr(value, name), data.get(name))
+    elif isinstance(value, (list, tuple)):
+        for item, item_data in zip(value, data):
+            _mask(item, item_data)
+    elif isinstance(value, dict):
+        for item, item_data in zip(value.values(), data.values()):
+            _mask(item, item_data)
+
+
+def redacted_dump(model: BaseModel) -> dict[str, Any]:
+    r"""Dumps a model for logging, masking the values of the fields it declares as omitted from logs.
+
+    Models list such fields in a `__omitted_log_fields__` class variable. Which fields to mask, and which fields to
+    walk to find them, is planned once per model class, so that only the parts of a dump that may hold sensitive
+    values are visited. Wire serialization is left untouched.
+
+    :param model: The model to dump.
+    """
+    data: dict[str, Any] = model.model_dump()
+    _mask(model, data)
+
+    return data
+
+
+def _mask_data(annotation: Any, data: Any) -> None:
+    # Without model instances to tell which model a value was built from, every model a field may hold is applied.
+    if data is None:
+        return
+
+    origin = typing.get_origin(annotation)
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        if not isinstance(data, dict):
+            return
+        for model in _models(annotation):
+            plan = _log_mask_plan(model)
+            for name in plan.omitted:
+                if data.get(name) is not None:
+                    data[name] = log.OMITTED_LOG_VALUE
+            for name in plan.nested:
+                _mask_data(model.model_fields[name].annotation, data.get(name))
+    elif isinstance(origin, type) and issubclass(origin, Mapping):
+        if isinstance(data, dict):
+            for item in data.values():
+                _mask_data(typing.get_args(annotation)[-1], item)
+    elif isinstance(origin, type) and issubclass(origin, (list, tuple, set, frozenset)):
+        if isinstance(data, list):
+            for argument in typing.get_args(annotation):
+                for item in data:
+                    _mask_data(argument, item)
+    else:
+        for argument in typing.get_args(annotation):
+            _mask_data(argument, data)
+
+
+def redacted_data(model: Any, content: bytes) -> dict[str, Any]:
+    r"""Decodes a serialized body for logging, masking the values of the fields its model declares as omitted from logs.
+
+    The counterpart of `redacted_dump` for bodies serialized without building their model. Such bodies may not have been
+    validated, a body that is not a JSON object raises a `ValueError` rather than being logged without masking.
+
+    :param model: The model the body conforms to, or a union of models.
+    :param content: The serialized body.
+    """
+    data: Any = json.loads(content)
+    if not isinstance(data, dict):
+        raise ValueError(f"Expected a JSON object, got {type(data).__name__}")
+    _mask_data(model, data)
+
+    return data
+
+
+def body_log(content: bytes, encoding: Optional[str] = None) -> str:
+    r"""Decodes a bounded prefix of a body for logging, large bodies are never decoded as a whole.
+
+    :param content: The raw body.
+    :param encoding: The body encoding, defaults to UTF-8.
+    """
+    if not content:
+        return constant.EMPTY_STRING
+
+    result: str = bytes(content[: log.HTTP_BODY_LOG_MAX_BYTES]).decode(encoding or constant.UTF8, errors="replace")
+
+    if len(content) > log.HTTP_BODY_LOG_MAX_BYTES:
+        result += log.HTTP_BODY_TRUNCATED_LOG_MESSAGE_TEMPLATE.format(len(content) - log.HTTP_BODY_LOG_MAX_BYTES)
+
+    return result
+
+
 def response_log(response: requests.Response):
     headers: dict = response.headers
     headers_log: str = constant.EMPTY_STRING
@@ -28,7 +181,9 @@ def response_log(response: requests.Response):
         headers_log += "\n"
 
     result: str = (
-        "\nResponse:\n" + log.HTTP_HEADERS_LOG_MESSAGE_TEMPLATE.format(headers_log) + log.HTTP_BODY_LOG_MESSAGE_TEMPLATE.format("\t\t" + response.text + "\n")
+        "\nResponse:\n"
+        + log.HTTP_HEADERS_LOG_MESSAGE_TEMPLATE.format(headers_log)
+        + log.HTTP_BODY_LOG_MESSAGE_TEMPLATE.format("\t\t" + body_log(response.content, response.encoding) + "\n")
     )
 
     return result
@@ -56,7 +211,7 @@ def filter_credentials(data: dict):
     for key, value in data.items():
         for word in filter_keys:
             if word.lower() in key.lower():
-                new_data[key] = "<-- omitted -->"
+                new_data[key] = log.OMITTED_LOG_VALUE
                 break
             new_data[key] = value
     return new_data
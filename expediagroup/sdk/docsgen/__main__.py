@@ -16,6 +16,7 @@ from typing import Optional
 
 import typer
 from generator import ExpediaGroupDocumentationGenerator
+from module_cache import DEFAULT_CACHE_DIR
 from pydoc_markdown.contrib.loaders.python import PythonLoader
 from pydoc_markdown.interfaces import Context
 
@@ -27,6 +28,9 @@ def main(
     package_path: Path = typer.Option(..., "--package-path", "-p"),
     templates_path: Optional[Path] = typer.Option(Path(__file__).parent / "templates", "--templates-path", "-t"),
     output_path: Optional[Path] = typer.Option(Path() / "docs", "--output-path", "-o"),
+    workers: Optional[int] = typer.Option(None, "--workers", "-w", help="Number of worker processes rendering pages, defaults to the number of CPUs."),
+    cache_dir: Path = typer.Option(DEFAULT_CACHE_DIR, "--cache-dir"),
+    no_cache: bool = typer.Option(False, "--no-cache"),
 ):
     context = Context(directory=str(package_path.absolute()))
     loader = PythonLoader(search_path=[str(package_path.absolute())])
@@ -36,9 +40,12 @@ def main(
         loader=loader,
         templates_path=templates_path,
         package_name=package_name,
+        workers=workers,
+        cache_dir=None if no_cache else cache_dir,
     )
 
-    generator.generate(output_path=output_path)
+    written: dict[str, bool] = generator.generate(output_path=output_path)
+    typer.echo(f"{sum(written.values())} pages written, {len(written) - sum(written.values())} unchanged")
 
 
 if __name__ == "__main__":
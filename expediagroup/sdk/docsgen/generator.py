@@ -12,15 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import copy
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 import docspec
 from helper import helpers
-from model import Master, Module
+from model import Master, Module, ModuleTree
+from module_cache import ModuleCache
 from pydoc_markdown import Context, Loader
+from pydoc_markdown.contrib.loaders.python import PythonLoader
 from render import MarkdownRenderer
 from resolver import CrossReferenceResolver, Resolver
 
@@ -39,6 +40,8 @@ class ExpediaGroupDocumentationGenerator:
         helpers (dict[str, Any]): A dictionary of helper functions for documentation generation.
         resolvers (dict[str, Resolver]): A dictionary of resolvers for resolving cross-references.
         master_filename (str): The filename for the master documentation file.
+        workers (Optional[int]): Number of worker processes rendering pages, defaults to the number of CPUs.
+        cache_dir (Optional[Path]): Where the modules loaded by a `PythonLoader` are cached, `None` disables caching.
     """
 
     context: Context
@@ -50,6 +53,8 @@ class ExpediaGroupDocumentationGenerator:
     resolvers: dict[str, Resolver]
     master_filename: str
     package_name: str
+    workers: Optional[int]
+    cache_dir: Optional[Path]
 
     def __init__(
         self,
@@ -60,6 +65,8 @@ class ExpediaGroupDocumentationGenerator:
         master_filename: str = "index",
         helpers: dict[str, Any] = dict(),  # noqa
         resolvers: dict[str, Resolver] = dict(),  # noqa
+        workers: Optional[int] = None,
+        cache_dir: Optional[Path] = None,
     ):
         """
         Initializes the ExpediaGroupDocumentationGenerator.
@@ -72,6 +79,9 @@ class ExpediaGroupDocumentationGenerator:
             helpers (dict[str, Any], optional): A dictionary of helper functions for documentation generation used in the `jinja2` modules.
             resolvers (dict[str, Resolver], optional): A dictionary of resolvers used in the `jinja2` modules.
             package_name(str): Package name.
+            workers (Optional[int], optional): Number of worker processes rendering pages. Defaults to the number of CPUs.
+            cache_dir (Optional[Path], optional): Where the modules loaded by a `PythonLoader` are cached, keyed by the
+                content of their source files. Defaults to `None`, no caching.
         """
         self.context = context
         self.master_filename = master_filename
@@ -80,6 +90,8 @@ class ExpediaGroupDocumentationGenerator:
         self.helpers = helpers
         self.resolvers = resolvers
         self.package_name = package_name
+        self.workers = workers
+        self.cache_dir = cache_dir
 
         self.__post_init__()
 
@@ -88,7 +100,10 @@ class ExpediaGroupDocumentationGenerator:
         Post-initialization method to initialize loader, modules, renderer, and other necessary attributes.
         """
         self.loader.init(context=self.context)
-        self.modules = list(map(Module.from_, filter(lambda m: isinstance(m, docspec.Module), list(self.loader.load()))))
+        if self.cache_dir and isinstance(self.loader, PythonLoader):
+            self.modules = ModuleCache(directory=self.cache_dir).load(loader=self.loader)
+        else:
+            self.modules = list(map(Module.from_, filter(lambda m: isinstance(m, docspec.Module), list(self.loader.load()))))
         self.__post_process_modules()
 
         cross_reference_resolver: Resolver = CrossReferenceResolver(modules=self.modules)
@@ -101,26 +116,31 @@ class ExpediaGroupDocumentationGenerator:
             templates_path=self.templates_path,
             helpers=self.helpers,
             resolvers=self.resolvers,
-            master=Master.from_modules(copy.deepcopy(self.modules)),
+            master=Master.from_modules(self.modules),
             master_filename=self.master_filename,
             package_name=self.package_name,
+            workers=self.workers,
         )
 
-    def generate(self, output_path: Path):
+    def generate(self, output_path: Path) -> dict[str, bool]:
         """
         Generates the documentation and writes it to the specified output path.
 
         Args:
             output_path (Path): The path where the generated documentation will be written to.
+
+        Returns:
+            dict[str, bool]: Whether each page was written, by filename. Pages whose content did not change are not.
         """
-        self.renderer.render(output_path=output_path)
+        return self.renderer.render(output_path=output_path)
 
     def __post_process_modules(self):
         """
         Post-processes the modules to sync submodules and remove modules with no classes and one or fewer submodules.
         """
-        for index, _ in enumerate(self.modules):
-            self.modules[index].sync_submodules(modules=self.modules)
+        tree: ModuleTree = ModuleTree(modules=self.modules)
+        for module in self.modules:
+            module.submodules.extend(tree.submodules(module.name))
 
         # Removes modules that have no classes along with 1 or less submodule
         self.modules = list(filter(lambda module: len(module.classes) or len(module.submodules) > 1, self.modules))
@@ -336,20 +336,6 @@ class Module(Document):
 
     # TODO: Add module level functions to `Module` attributes.
 
-    def sync_submodules(self, modules: list[Module]) -> None:
-        """Syncs the submodules within the current module instance by checking the
-        names of modules from the input list.
-
-        Args:
-            modules (list[Module]): List of module instances to check for submodule relationships.
-        """
-        for module in modules:
-            if module.name == self.name:
-                continue
-
-            if module.name.rsplit(sep=".", maxsplit=1).pop(0) == self.name:
-                self.submodules.append(module)
-
     @staticmethod
     def from_(other: docspec.Module):
         r"""Creates an instance of the Module class from a docspec.Module object.
@@ -415,16 +401,72 @@ class Master(Document):
         Returns:
             list[Module]: List of organized module instances for inclusion in the master document.
         """
-        modules: dict[str, Union[Module, None]] = collections.defaultdict(lambda m: None, {module.name: module for module in modules})
-        master_modules: list[Module] = list()
-        has_parent: dict[str, bool] = collections.defaultdict(bool)
+        return ModuleTree(modules=modules).master_modules()
+
+
+class ModuleTree:
+    """Index of modules by name and by parent module name, built in a single pass over the modules.
+
+    The modules are indexed, not copied, so that the documents built from the tree share them.
+
+    Attributes:
+        modules (tuple[Module, ...]): The indexed modules, in their order.
+    """
+
+    def __init__(self, modules: list[Module]):
+        """Indexes modules by name and by parent module name.
+
+        Args:
+            modules (list[Module]): The modules to index.
+        """
+        self.modules: tuple[Module, ...] = tuple(modules)
+        self.__modules: dict[str, Module] = {module.name: module for module in modules}
+        self.__submodules: dict[str, list[Module]] = collections.defaultdict(list)
+
+        for module in modules:
+            parent_module_name: str = ModuleTree.parent_module_name(module.name)
+            if parent_module_name != module.name:
+                self.__submodules[parent_module_name].append(module)
+
+    @staticmethod
+    def parent_module_name(module_name: str) -> str:
+        """Returns the name of the parent module of a module, the name of the module itself for a top-level module.
+
+        Args:
+            module_name (str): The dotted name of the module.
+
+        Returns:
+            str: The name of the parent module.
+        """
+        return module_name.rsplit(sep=".", maxsplit=1)[0]
+
+    def module(self, module_name: str) -> Union[Module, None]:
+        """Returns the module of a name, `None` if there is none.
 
-        for module_name in modules.keys():
-            parent_module_name = module_name.rsplit(sep=".", maxsplit=1).pop(0)
-            has_parent[module_name] = bool(modules.get(parent_module_name))
+        Args:
+            module_name (str): The dotted name of the module.
 
-        for module_name, parent_does_exist in has_parent.items():
-            if parent_does_exist:
-                master_modules.append(modules[module_name])
+        Returns:
+            Module | None: The module.
+        """
+        return self.__modules.get(module_name)
 
-        return master_modules
+    def submodules(self, module_name: str) -> list[Module]:
+        """Returns the modules directly under a module.
+
+        Args:
+            module_name (str): The dotted name of the parent module.
+
+        Returns:
+            list[Module]: A new list of the submodules, in their order in the tree.
+        """
+        return list(self.__submodules.get(module_name, ()))
+
+    def master_modules(self) -> list[Module]:
+        """Returns the modules listed in the master document: top-level modules, and modules whose parent module is
+        in the tree.
+
+        Returns:
+            list[Module]: The master modules, in their order in the tree.
+        """
+        return [module for module in self.__modules.values() if ModuleTree.parent_module_name(module.name) in self.__modules]
@@ -0,0 +1,171 @@
+# Copyright 2022 Expedia, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Caches the modules loaded from Python source files, keyed by the content of the files.
+
+Parsing the sources with `docspec_python` is most of the time it takes to load a package, and generated modules are
+thousands of lines long. The modules converted from the parsed sources, docstrings parsed included, are stored on disk
+so that regenerating the documentation only parses the files that changed.
+"""
+
+import functools
+import hashlib
+import io
+import os
+import pickle
+import tempfile
+from importlib import metadata
+from pathlib import Path
+from typing import Union
+
+import docspec_python
+from model import Module
+from pydoc_markdown.contrib.loaders.python import PythonLoader
+
+# Packages whose versions change the parsed modules, or how they are stored.
+DOCSGEN_DEPENDENCIES: tuple[str, ...] = ("docspec", "docspec-python", "pydoc-markdown", "docstring-parser", "pydantic")
+
+DEFAULT_CACHE_DIR: Path = Path.home() / ".cache" / "expediagroup-sdk-docsgen"
+
+
+@functools.lru_cache(maxsize=None)
+def code_digest() -> str:
+    """Hashes the sources of the documentation generator and the versions of its dependencies.
+
+    Returns:
+        str: The SHA-256 hex digest.
+    """
+    hasher = hashlib.sha256()
+    for path in sorted(Path(__file__).parent.glob("*.py")):
+        hasher.update(path.name.encode())
+        hasher.update(path.read_bytes())
+
+    for dependency in DOCSGEN_DEPENDENCIES:
+        try:
+            hasher.update(f"{dependency}=={metadata.version(dependency)}".encode())
+        except metadata.PackageNotFoundError:
+            hasher.update(f"{dependency}==".encode())
+
+    return hasher.hexdigest()
+
+
+def python_files(loader: PythonLoader) -> list[tuple[str, str]]:
+    """Lists the Python source files a loader parses, discovering them the way `PythonLoader.load` does.
+
+    Args:
+        loader (PythonLoader): An initialized loader.
+
+    Returns:
+        list[tuple[str, str]]: The module names and filenames, in the order the loader parses them.
+    """
+    search_path: list[str] = loader.get_effective_search_path()
+    modules: list[str] = list(loader.modules or [])
+    packages: list[str] = list(loader.packages or [])
+
+    if loader.modules is None and loader.packages is None:
+        for path in search_path:
+            try:
+                discovered_items = list(docspec_python.discover(path))
+            except FileNotFoundError:
+                continue
+
+            for item in discovered_items:
+                if item.name in loader.ignore_when_discovered:
+                    continue
+                if isinstance(item, docspec_python.DiscoveryResult.Module):
+                    modules.append(item.name)
+                elif isinstance(item, docspec_python.DiscoveryResult.Package):
+                    packages.append(item.name)
+
+    files: list[tuple[str, str]] = [(module_name, docspec_python.find_module(module_name, search_path)) for module_name in modules]
+    for package_name in packages:
+        files.extend(docspec_python.iter_package_files(package_name, search_path))
+
+    return files
+
+
+class ModuleCache:
+    """Content-addressed store of the modules loaded from Python source files.
+
+    Attributes:
+        directory (Path | None): Where entries are stored, `None` disables caching.
+        hits (int): Number of modules loaded from the cache.
+        misses (int): Number of modules parsed.
+    """
+
+    def __init__(self, directory: Union[Path, None]):
+        """Initializes the cache.
+
+        Args:
+            directory (Path | None): Where entries are stored, `None` disables caching.
+        """
+        self.directory: Union[Path, None] = directory
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def load(self, loader: PythonLoader) -> list[Module]:
+        """Loads the modules of a loader, parsing only the source files that have no entry yet.
+
+        Args:
+            loader (PythonLoader): An initialized loader.
+
+        Returns:
+            list[Module]: The modules, in the order the loader loads them.
+        """
+        modules: list[Module] = list()
+        for module_name, filename in python_files(loader):
+            content: bytes = Path(filename).read_bytes()
+            entry: Union[Path, None] = self.__entry(module_name, content)
+
+            module: Union[Module, None] = ModuleCache.__read(entry) if entry else None
+            if module is None:
+                self.misses += 1
+                # Sources are decoded as `io.open` decodes them when the loader parses a file, newlines translated.
+                source = io.TextIOWrapper(io.BytesIO(content), encoding=loader.encoding)
+                module = Module.from_(docspec_python.parse_python_module(source, filename=filename, module_name=module_name, options=loader.parser))
+                if entry:
+                    ModuleCache.__write_atomically(entry, pickle.dumps(module))
+            else:
+                self.hits += 1
+
+            modules.append(module)
+
+        return modules
+
+    def __entry(self, module_name: str, content: bytes) -> Union[Path, None]:
+        if not self.directory:
+            return None
+
+        hasher = hashlib.sha256(code_digest().encode())
+        hasher.update(module_name.encode())
+        hasher.update(b"\0")
+        hasher.update(content)
+        key: str = hasher.hexdigest()
+        return self.directory / "modules" / key[:2] / f"{key}.pickle"
+
+    @staticmethod
+    def __read(entry: Path) -> Union[Module, None]:
+        # Entries are only written by this class, in a directory of the user, a missing or unreadable one is a miss.
+        try:
+            return pickle.loads(entry.read_bytes())
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+
+    @staticmethod
+    def __write_atomically(path: Path, content: bytes) -> None:
+        # Concurrent generations may share the cache, an entry is either complete or absent.
+        path.parent.mkdir(parents=True, exist_ok=True)
+        descriptor, temporary = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(descriptor, "wb") as file:
+            file.write(content)
+        os.replace(temporary, path)
@@ -14,14 +14,30 @@
 
 from __future__ import annotations
 
+import functools
+import multiprocessing
+import os
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 import constant
 from jinja2 import Environment, FileSystemLoader, Template
-from model import Breadcrumbs, Document, DocumentedObject, Master, Module
-from util import write_markdown_file
+from model import Breadcrumbs, Class, Document, DocumentedObject, Master, Module
+from util import write_markdown_file_if_changed
+
+# A page to render: the index of its module and of its class in the module, `None` for the module page itself. The
+# master page has no module.
+Page = tuple[Optional[int], Optional[int]]
+
+# The renderer of the pages sent to worker processes, which inherit it when they are forked.
+_forked_renderer: Optional[MarkdownRenderer] = None
+
+
+def _render_forked_page(output_path: Path, page: Page) -> tuple[str, bool]:
+    return _forked_renderer.write_page(output_path=output_path, page=page)
 
 
 @dataclass
@@ -35,6 +51,7 @@ class MarkdownRenderer:
         helpers (dict[str, Any]): A dictionary of helper functions to assist in rendering.
         resolvers (dict[str, Any]): A dictionary of resolver functions to assist in rendering.
         master_filename (str): The filename for the master documentation file.
+        workers (Optional[int]): Number of worker processes rendering pages, defaults to the number of CPUs.
     """
 
     master: Master
@@ -44,6 +61,7 @@ class MarkdownRenderer:
     resolvers: dict[str, Any]
     master_filename: str
     package_name: str
+    workers: Optional[int]
 
     def __init__(
         self,
@@ -54,6 +72,7 @@ class MarkdownRenderer:
         templates_path: Path = Path(__file__).parent / constant.TEMPLATES_DIR,
         helpers: dict[str, Any] = dict(),  # noqa
         resolvers: dict[str, Any] = dict(),  # noqa
+        workers: Optional[int] = None,
     ):
         """Initializes the MarkdownRenderer instance with the given parameters.
 
@@ -64,6 +83,8 @@ class MarkdownRenderer:
             templates_path (Path): The path to the directory containing Jinja2 templates.
             helpers (dict[str, Any]): Dictionary of helper functions to assist in rendering.
             resolvers (dict[str, Any]): Dictionary of resolver functions to assist in rendering.
+            workers (Optional[int]): Number of worker processes rendering pages, defaults to the number of CPUs, `1`
+                renders in process.
         """
         self.package_name = package_name
         self.master = master
@@ -73,6 +94,7 @@ class MarkdownRenderer:
         self.helpers = helpers
         self.resolvers = resolvers
         self.environment = Environment(loader=FileSystemLoader(searchpath=templates_path, encoding=constant.UTF8))
+        self.workers = workers
 
         self.__post_init__()
 
@@ -80,21 +102,83 @@ class MarkdownRenderer:
         """Called after the object is initialized to setup additional initial configurations."""
         self.__init_breadcrumbs()
 
-    def render(self, output_path: Path):
+    def render(self, output_path: Path) -> dict[str, bool]:
         """Renders the documentation to markdown files and writes them to the specified output path.
 
+        Each page is written as soon as it is rendered, and only when its content changed, so that unchanged files
+        keep their timestamps and downstream builds stay incremental. Pages are rendered by a pool of processes forked
+        from this one where the platform allows it.
+
         Args:
             output_path (Path): The path where the rendered markdown files should be saved.
+
+        Returns:
+            dict[str, bool]: Whether each page was written, by filename.
         """
+        global _forked_renderer
+
         output_path.mkdir(exist_ok=True)
+        pages: list[Page] = list(self.pages())
+
+        workers: int = min(self.workers or os.cpu_count() or 1, len(pages))
+        if workers <= 1 or "fork" not in multiprocessing.get_all_start_methods():
+            return dict(self.write_page(output_path=output_path, page=page) for page in pages)
+
+        _forked_renderer = self
+        try:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("fork")) as executor:
+                chunksize: int = max(1, len(pages) // (workers * 4))
+                return dict(executor.map(functools.partial(_render_forked_page, output_path), pages, chunksize=chunksize))
+        finally:
+            _forked_renderer = None
+
+    def pages(self) -> Iterator[Page]:
+        """Lists the pages of the documentation: module pages, class pages, then the master page.
+
+        Returns:
+            Iterator[Page]: The pages, as indices of their module and class.
+        """
+        for module_index in range(len(self.modules)):
+            yield module_index, None
+
+        for module_index, module in enumerate(self.modules):
+            for class_index in range(len(module.classes)):
+                yield module_index, class_index
+
+        yield None, None
+
+    def render_page(self, page: Page) -> tuple[str, str]:
+        """Renders a single page to markdown.
+
+        Args:
+            page (Page): Indices of the module and class of the page.
+
+        Returns:
+            tuple[str, str]: The filename of the page, and its rendered markdown content.
+        """
+        module_index, class_index = page
+        if module_index is None:
+            return self.master_filename, self.render_master()
+
+        module: Module = self.modules[module_index]
+        if class_index is None:
+            return module.name, self.render_module(module)
+
+        class_: Class = module.classes[class_index]
+        return class_.name, self.render_class(module, class_)
 
-        for name, documentation in self.render_modules().items():
-            write_markdown_file(path=output_path, filename=name, content=documentation)
+    def write_page(self, output_path: Path, page: Page) -> tuple[str, bool]:
+        """Renders a single page and writes it unless the file already holds the same content.
 
-        for name, documentation in self.render_classes().items():
-            write_markdown_file(path=output_path, filename=name, content=documentation)
+        Args:
+            output_path (Path): The path where the rendered markdown file should be saved.
+            page (Page): Indices of the module and class of the page.
 
-        write_markdown_file(path=output_path, filename=self.master_filename, content=self.render_master())
+        Returns:
+            tuple[str, bool]: The filename of the page, and whether it was written.
+        """
+        name, content = self.render_page(page)
+        return name, write_markdown_file_if_changed(path=output_path, filename=name, content=content)
 
     def render_modules(self) -> dict[str, str]:
         """Renders the documentation for each module to markdown.
@@ -102,19 +186,26 @@ class MarkdownRenderer:
         Returns:
             dict[str, str]: A dictionary mapping module names to their rendered markdown content.
         """
-        template: Template = self.environment.get_template(constant.TemplateFileNames.MODULE)
-        rendered_modules: dict[str, str] = dict()
+        return {module.name: self.render_module(module) for module in self.modules}
+
+    def render_module(self, module: Module) -> str:
+        """Renders the documentation for a module to markdown.
+
+        Args:
+            module (Module): The module to render.
 
-        for module in self.modules:
-            environment_args: dict[str, Any] = {
-                constant.Jinja2EnvironmentVariables.MODULE: module,
-                constant.Jinja2EnvironmentVariables.BREADCRUMBS: module.breadcrumbs,
-            }
-            self.setup_jinja_environment_arguments(environment_arguments=environment_args)
+        Returns:
+            str: The rendered markdown content.
+        """
+        template: Template = self.environment.get_template(constant.TemplateFileNames.MODULE)
 
-            rendered_modules[module.name] = template.render(environment_args)
+        environment_args: dict[str, Any] = {
+            constant.Jinja2EnvironmentVariables.MODULE: module,
+            constant.Jinja2EnvironmentVariables.BREADCRUMBS: module.breadcrumbs,
+        }
+        self.setup_jinja_environment_arguments(environment_arguments=environment_args)
 
-        return rendered_modules
+        return template.render(environment_args)
 
     def render_classes(self) -> dict[str, str]:
         """Renders the documentation for each class in each module to markdown.
@@ -122,24 +213,28 @@ class MarkdownRenderer:
         Returns:
             dict[str, str]: A dictionary mapping class names to their rendered markdown content.
         """
-        template: Template = self.environment.get_template(constant.TemplateFileNames.CLASS)
-        rendered_classes: dict[str, str] = dict()
+        return {class_.name: self.render_class(module, class_) for module in self.modules for class_ in module.classes}
 
-        for module in self.modules:
-            if not module.classes:
-                continue
+    def render_class(self, module: Module, class_: Class) -> str:
+        """Renders the documentation for a class to markdown.
 
-            for class_ in module.classes:
-                environment_args: dict[str, DocumentedObject] = {
-                    constant.Jinja2EnvironmentVariables.MODULE: module,
-                    constant.Jinja2EnvironmentVariables.CLASS: class_,
-                    constant.Jinja2EnvironmentVariables.BREADCRUMBS: class_.breadcrumbs,
-                }
-                self.setup_jinja_environment_arguments(environment_arguments=environment_args)
+        Args:
+            module (Module): The module defining the class.
+            class_ (Class): The class to render.
+
+        Returns:
+            str: The rendered markdown content.
+        """
+        template: Template = self.environment.get_template(constant.TemplateFileNames.CLASS)
 
-                rendered_classes[class_.name] = template.render(environment_args)
+        environment_args: dict[str, DocumentedObject] = {
+            constant.Jinja2EnvironmentVariables.MODULE: module,
+            constant.Jinja2EnvironmentVariables.CLASS: class_,
+            constant.Jinja2EnvironmentVariables.BREADCRUMBS: class_.breadcrumbs,
+        }
+        self.setup_jinja_environment_arguments(environment_arguments=environment_args)
 
-        return rendered_classes
+        return template.render(environment_args)
 
     def render_master(self) -> str:
         """Renders the master documentation to markdown.
@@ -13,10 +13,10 @@
 # limitations under the License.
 
 import abc
-import copy
+from typing import Union
 
 from model import Module
-from util import replace_word
+from util import WordMatcher, to_markdown_file_ref
 
 
 class Resolver(abc.ABC):
@@ -46,7 +46,39 @@ class Resolver(abc.ABC):
 
 
 class TypeAliasResolver(Resolver):
-    """A resolver class that handles the resolving of type aliases within the documentation text."""
+    """A resolver class that handles the resolving of type aliases within the documentation text.
+
+    Attributes:
+        aliases (dict[str, str]): Values of the module variables, by variable name.
+        expansions (dict[str, str]): Values of the module variables with the aliases they refer to expanded, by variable name.
+        cyclic_aliases (frozenset[str]): Aliases referring to themselves, directly or through other aliases.
+    """
+
+    aliases: dict[str, str]
+    expansions: dict[str, str]
+    cyclic_aliases: frozenset[str]
+
+    def __init__(self, modules: list[Module]):
+        """Initializes the TypeAliasResolver, expanding every alias once for all the texts to resolve.
+
+        Aliases are expanded in topological order, each one after the aliases it refers to, so that expanding an alias
+        is a single substitution of already expanded values. Within a cycle, the alias closing the cycle is left
+        unexpanded, where expanding it would never terminate.
+
+        Args:
+            modules (list[Module]): A list of modules containing documentation information.
+        """
+        super().__init__(modules)
+
+        # The first module defining a variable wins, as it did when modules were searched in order.
+        self.aliases = dict()
+        for module in modules:
+            for var in module.variables:
+                if var.value:
+                    self.aliases.setdefault(var.name, var.value)
+
+        self.__matcher: WordMatcher = WordMatcher(self.aliases.keys())
+        self.expansions, self.cyclic_aliases = self.__expand()
 
     def resolve(self, text):
         """Resolves type aliases in the provided text by replacing alias names with their actual values.
@@ -57,23 +89,49 @@ class TypeAliasResolver(Resolver):
         Returns:
             str: The text with type aliases resolved.
         """
-        has_resolved_text: bool = False
+        expansion: Union[str, None] = self.expansions.get(text)
+        if expansion is not None:
+            return expansion
 
-        for module in self.modules:
-            for var in module.variables:
-                value = var.value
-                if not value:
-                    continue
+        return self.__matcher.sub(self.expansions.__getitem__, text)
 
-                if var.name == text:
-                    return self.resolve(value)
+    def __expand(self) -> tuple[dict[str, str], frozenset[str]]:
+        """Expands the aliases in topological order, walking the graph of the aliases they refer to depth-first.
 
-                original_text: str = copy.deepcopy(text)
-                text = replace_word(text, var.name, value)
+        Returns:
+            tuple[dict[str, str], frozenset[str]]: The expanded aliases, and the aliases taking part in a cycle.
+        """
+        references: dict[str, list[str]] = {name: self.__matcher.findall(value) for name, value in self.aliases.items()}
+        expansions: dict[str, str] = dict()
+        cyclic: set[str] = set()
+        in_progress: set[str] = set()
+
+        for root in self.aliases.keys():
+            if root in expansions:
+                continue
+
+            # Each frame is an alias and the index of the next alias it refers to, to be visited.
+            stack: list[tuple[str, int]] = [(root, 0)]
+            in_progress.add(root)
+            while stack:
+                name, index = stack.pop()
+                if index < len(references[name]):
+                    stack.append((name, index + 1))
+                    reference = references[name][index]
+                    if reference in in_progress:
+                        # A reference back to an alias being expanded closes a cycle, all the aliases on it are cyclic.
+                        cycle_start: int = next(position for position, (frame, _) in enumerate(stack) if frame == reference)
+                        cyclic.update(frame for frame, _ in stack[cycle_start:])
+                    elif reference not in expansions:
+                        stack.append((reference, 0))
+                        in_progress.add(reference)
+                    continue
 
-                has_resolved_text = has_resolved_text or (text != original_text)
+                # The aliases this one refers to are expanded, except those being expanded in a cycle.
+                in_progress.discard(name)
+                expansions[name] = self.__matcher.sub(lambda word: expansions.get(word, word), self.aliases[name])
 
-        return self.resolve(text) if has_resolved_text else text
+        return expansions, frozenset(cyclic)
 
 
 class CrossReferenceResolver(Resolver):
@@ -81,18 +139,26 @@ class CrossReferenceResolver(Resolver):
 
     Attributes:
         type_alias_resolver (Resolver): An instance of the TypeAliasResolver to resolve type aliases in the text.
+        references (dict[str, str]): Markdown links to the documentation of the classes, by class name.
     """
 
     type_alias_resolver: Resolver
+    references: dict[str, str]
 
     def __init__(self, modules: list[Module]):
         """Initializes the CrossReferenceResolver with a list of modules and a type alias resolver.
 
+        Class names are matched all at once, by a matcher built here once per generation. The same type hints come up
+        in many classes, resolved texts are kept so that each distinct text is resolved only once.
+
         Args:
             modules (list[Module]): A list of modules containing documentation information.
         """
         super().__init__(modules)
         self.type_alias_resolver = TypeAliasResolver(modules)
+        self.references = {class_.name: to_markdown_file_ref(class_.name) for module in modules for class_ in module.classes}
+        self.__matcher: WordMatcher = WordMatcher(self.references.keys())
+        self.__resolved: dict[str, str] = dict()
 
     def resolve(self, text: str) -> str:
         """Resolves cross-references in the provided text by replacing class names with markdown links to their documentation.
@@ -103,15 +169,10 @@ class CrossReferenceResolver(Resolver):
         Returns:
             str: The text with cross-references resolved.
         """
-        text = self.type_alias_resolver.resolve(text)
-
-        for module in self.modules:
-            for class_ in module.classes:
-                reference = f"[{class_.name}]({class_.name}.md)"
-
-                if class_.name == text:
-                    return reference
-
-                text = replace_word(text, class_.name, reference)
+        resolved: Union[str, None] = self.__resolved.get(text)
+        if resolved is None:
+            resolved = self.type_alias_resolver.resolve(text)
+            resolved = self.references.get(resolved) or self.__matcher.sub(self.references.__getitem__, resolved)
+            self.__resolved[text] = resolved
 
-        return text
+        return resolved
@@ -0,0 +1,157 @@
+# Copyright 2022 Expedia, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Renders the markdown pipe tables of the documentation.
+
+Tables are laid out the way `markdown_prettytable.PrettyTable` lays them out with its default options, cells centered
+in columns as wide as their widest line, but in a single pass over the cells and without its options machinery.
+"""
+
+import functools
+import re
+import unicodedata
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any
+
+# Terminal escape sequences, which take no room on screen.
+ESCAPE_SEQUENCE_PATTERN: re.Pattern = re.compile("\033\\[[0-9;]*m")
+
+
+def character_width(code: int) -> int:
+    """Returns the number of columns a character takes on screen.
+
+    Args:
+        code (int): The Unicode code point of the character.
+
+    Returns:
+        int: 2 for wide East Asian characters, 0 for combining and some control characters, -1 for backspace and
+            delete, 1 otherwise.
+    """
+    if 0x0021 <= code <= 0x007E:
+        return 1
+    if 0x4E00 <= code <= 0x9FFF or 0xAC00 <= code <= 0xD7AF:
+        return 2
+    if unicodedata.combining(chr(code)):
+        return 0
+    if 0x3040 <= code <= 0x30FF or 0xFF01 <= code <= 0xFF60 or 0x3000 <= code <= 0x303E:
+        return 2
+    if code in (0x0008, 0x007F):
+        return -1
+    if code in (0x0000, 0x000F, 0x001F):
+        return 0
+    return 1
+
+
+def line_width(line: str) -> int:
+    """Returns the number of columns a line of text takes on screen.
+
+    Args:
+        line (str): The line, without line breaks.
+
+    Returns:
+        int: The width of the line.
+    """
+    # Printable ASCII, which is nearly all of the documentation, is one column per character.
+    if line.isascii() and line.isprintable():
+        return len(line)
+
+    return sum(map(character_width, map(ord, ESCAPE_SEQUENCE_PATTERN.sub("", line))))
+
+
+@functools.lru_cache(maxsize=8192)
+def cell_width(text: str) -> int:
+    """Returns the width of a table cell, the width of its widest line.
+
+    Cells repeat a lot across the tables of a package, such as field names, `True` and `False`, or common types, the
+    widths are cached by text.
+
+    Args:
+        text (str): The text of the cell.
+
+    Returns:
+        int: The width of the cell.
+    """
+    if "\n" not in text:
+        return line_width(text)
+
+    return max(map(line_width, text.split("\n")))
+
+
+def center(line: str, width: int) -> str:
+    """Centers a line in a column, putting the extra space on the right of odd width lines, like `str.center`.
+
+    Args:
+        line (str): The line to center.
+        width (int): The width of the column.
+
+    Returns:
+        str: The line, padded with spaces to the width of the column.
+    """
+    width_of_line: int = line_width(line)
+    excess: int = width - width_of_line
+    left: int = excess // 2 + (excess % 2 and not width_of_line % 2)
+    return " " * left + line + " " * (excess - left)
+
+
+def render_table(field_names: Sequence[str], rows: Iterable[Sequence[Any]]) -> str:
+    """Renders a markdown pipe table.
+
+    Args:
+        field_names (Sequence[str]): The column names.
+        rows (Iterable[Sequence[Any]]): The rows, values are rendered with `str`.
+
+    Returns:
+        str: The table, preceded by an empty line and followed by two line breaks.
+
+    Raises:
+        ValueError: If a row does not have a value for each column.
+    """
+    cells: list[list[str]] = []
+    widths: list[int] = [cell_width(name) for name in field_names]
+
+    # Widths are computed while the cells are collected, the only pass over them before they are laid out.
+    for row in rows:
+        if len(row) != len(widths):
+            raise ValueError(f"Row has {len(row)} values, expected {len(widths)}: {row}")
+
+        texts: list[str] = [str(value) for value in row]
+        for index, text in enumerate(texts):
+            width: int = cell_width(text)
+            if width > widths[index]:
+                widths[index] = width
+        cells.append(texts)
+
+    return "\n".join(_table_lines(field_names, cells, widths))
+
+
+def _table_lines(field_names: Sequence[str], cells: list[list[str]], widths: list[int]) -> Iterator[str]:
+    yield ""
+    yield _row_line(field_names, widths)
+    yield "|" + "".join("-" * (width + 2) + "|" for width in widths)
+
+    for texts in cells:
+        if not any("\n" in text for text in texts):
+            yield _row_line(texts, widths)
+            continue
+
+        # Values of several lines spread over as many table lines, shorter values are padded with empty lines.
+        lines: list[list[str]] = [text.split("\n") for text in texts]
+        for y in range(max(map(len, lines))):
+            yield _row_line([column[y] if y < len(column) else "" for column in lines], widths)
+
+    yield ""
+    yield ""
+
+
+def _row_line(texts: Sequence[str], widths: list[int]) -> str:
+    return "|" + "".join(f" {center(text, width)} |" for text, width in zip(texts, widths))
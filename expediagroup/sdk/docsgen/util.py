@@ -13,9 +13,11 @@
 # limitations under the License.
 
 import re
+from collections.abc import Callable, Iterable
 from pathlib import Path
 from typing import Union
 
+import constant
 import docstring_parser
 from docstring_parser.parser import parse
 
@@ -48,48 +50,98 @@ def parse_method_description_docstrings(description: Union[str, None]) -> str:
     return max(docstring.long_description if docstring.long_description else "", docstring.short_description if docstring.short_description else "", key=len)
 
 
-def write_markdown_file(path: Path, filename: str, content: str) -> None:
-    """Writes content to a markdown file in the specified path with the given filename.
+def write_markdown_file_if_changed(path: Path, filename: str, content: str) -> bool:
+    """Writes content to a markdown file unless the file already holds the same content.
+
+    Unchanged files are left untouched, timestamps included, so that tools watching the output only see the pages
+    that actually changed.
 
     Args:
         path (Path): The path where the file will be created.
         filename (str): The name of the file (without the extension).
         content (str): The content to write to the file.
+
+    Returns:
+        bool: Whether the file was written.
     """
-    file = f"{str(path.absolute())}/{filename}.md"
-    with open(file, "w+") as markdown_file:
-        markdown_file.write(content)
+    file: Path = path / f"{filename}{constant.FileExtensions.MARKDOWN}"
+    data: bytes = content.encode(constant.UTF8)
 
+    # Files of another size are known to differ without reading them.
+    if file.is_file() and file.stat().st_size == len(data) and file.read_bytes() == data:
+        return False
 
-def replace_word(text: str, word: str, replacement: str) -> str:
-    """Replaces occurrences of a word in a text with the specified replacement, considering word boundaries.
+    file.write_bytes(data)
+    return True
 
-    Args:
-        text (str): The original text.
-        word (str): The word to replace.
-        replacement (str): The word to replace the original word with.
 
-    Returns:
-        str: The modified text with the word replaced.
+class WordMatcher:
+    r"""Finds any of a set of words in a text in a single pass, considering word boundaries.
+
+    The words are arranged in a trie, which is compiled to a single regular expression: words sharing a prefix share
+    its branch, and at any position the longest word is tried first. A text is thus scanned once whatever the number
+    of words, instead of once per word.
+
+    Attributes:
+        words (frozenset[str]): The words to find.
     """
-    if len(word) > len(text):
-        return text
 
-    index_change_value: int = 0
-    index_change_ratio: int = len(replacement) - len(word)
+    # End of word marker in the trie, no character is empty.
+    __END: str = ""
+
+    def __init__(self, words: Iterable[str]):
+        """Builds the trie of the words and compiles it.
+
+        Args:
+            words (Iterable[str]): The words to find.
+        """
+        self.words: frozenset[str] = frozenset(word for word in words if word)
+
+        trie: dict = dict()
+        for word in self.words:
+            node = trie
+            for char in word:
+                node = node.setdefault(char, dict())
+            node[WordMatcher.__END] = dict()
+
+        # A word is neither preceded nor followed by a letter or a digit.
+        self.__regex: Union[re.Pattern, None] = re.compile(rf"(?<![^\W_]){WordMatcher.__pattern(trie)}(?![^\W_])") if trie else None
+
+    def sub(self, replacement: Callable[[str], str], text: str) -> str:
+        """Replaces every word found in a text.
+
+        Args:
+            replacement (Callable[[str], str]): Returns the replacement of a found word.
+            text (str): The original text.
+
+        Returns:
+            str: The text with the words replaced.
+        """
+        if not self.__regex:
+            return text
+
+        return self.__regex.sub(lambda match: replacement(match.group()), text)
+
+    def findall(self, text: str) -> list[str]:
+        """Finds every word in a text.
+
+        Args:
+            text (str): The text to search.
 
-    for index in [w.start() for w in re.finditer(word, text)]:
-        index += index_change_value
-        if index == 0 and not text[len(word)].isalnum():
-            text = replacement + text[len(word) : :]
-            index_change_value += index_change_ratio
+        Returns:
+            list[str]: The words found, in order of appearance.
+        """
+        if not self.__regex:
+            return []
 
-        elif index + len(word) == len(text) and not text[index - 1].isalnum():
-            text = text[:index] + replacement
-            index_change_value += index_change_ratio
+        return self.__regex.findall(text)
 
-        elif not text[index - 1].isalpha() and not text[index + len(word)].isalnum():
-            text = text[:index] + replacement + text[index + len(word) :]
-            index_change_value += index_change_ratio
+    @staticmethod
+    def __pattern(node: dict) -> str:
+        branches: list[str] = [re.escape(char) + WordMatcher.__pattern(child) for char, child in sorted(node.items()) if char != WordMatcher.__END]
+        if not branches:
+            return ""
 
-    return text
+        pattern: str = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        # A word ending here is only matched when none of the longer words is.
+        return f"(?:{pattern})?" if WordMatcher.__END in node else pattern
@@ -35,13 +35,24 @@
 # SOFTWARE.
 
 
+import functools
+import warnings
 from parser import OpenApiParser
 from pathlib import Path
 from typing import Optional
 
 import typer
+from batch import generate_batch, load_manifest
+from cache import (
+    DEFAULT_CACHE_DIR,
+    GenerationCache,
+    StageTimings,
+    dependencies_digest,
+    digest,
+    files_digest,
+    write_if_changed,
+)
 from datamodel_code_generator import LiteralType, PythonVersion, chdir
-from datamodel_code_generator.format import CodeFormatter
 from fastapi_code_generator.__main__ import (
     BUILTIN_TEMPLATE_DIR,
     MODEL_PATH,
@@ -49,6 +60,7 @@ from fastapi_code_generator.__main__ import (
     dynamic_load_module,
 )
 from fastapi_code_generator.visitor import Visitor
+from formatting import CHUNK_MIN_LINES, format_sources, formatter_settings_files
 from jinja2 import Environment, FileSystemLoader
 
 
@@ -60,103 +72,187 @@ def generate_code(
     model_path: Optional[Path] = None,
     enum_field_as_literal: Optional[str] = None,
     custom_visitors: Optional[list[Path]] = [],  # noqa
-) -> None:
+    cache_dir: Optional[Path] = None,
+    workers: Optional[int] = None,
+    chunk_lines: int = CHUNK_MIN_LINES,
+    sdk_config: Optional[dict[str, str]] = None,
+    compact_responses: bool = False,
+) -> Optional[str]:
     if not model_path:
         model_path = MODEL_PATH
     if not output_dir.exists():
         output_dir.mkdir(parents=True)
     if not template_dir:
         template_dir = BUILTIN_TEMPLATE_DIR
-    if enum_field_as_literal:
-        parser = OpenApiParser(input_text, enum_field_as_literal=enum_field_as_literal)  # noqa
-    else:
-        parser = OpenApiParser(input_text)
-        parser.collapse_root_models = True
-    with chdir(output_dir):
-        models = parser.parse()
-    if not models:
-        return
-    elif isinstance(models, str):
-        output = output_dir / model_path
-        modules = {output: (models, input_name)}
-    else:
-        raise Exception("Modular references are not supported in this version")
 
+    # expediagroup: cache the generated files, keyed by everything they are generated from.
+    timings = StageTimings()
+    cache = GenerationCache(cache_dir)
+    # expediagroup: set new visitors' path.
+    BUILTIN_VISITOR_DIR = Path(__file__).parent / "visitors"
+    # expediagroup: formatted code depends on the black and isort settings, looked up from the working directory.
+    settings_path: Path = Path().resolve()
+    with timings.stage("hash"):
+        settings_files: list[Path] = formatter_settings_files(settings_path)
+        if not settings_files:
+            warnings.warn(f"No black or isort settings found from {settings_path}, generated code is formatted with their defaults", stacklevel=2)
+        formatter_key: str = digest(str(PythonVersion.PY_38), files_digest(settings_files), dependencies_digest())
+        cache_key: str = digest(
+            input_text,
+            str(model_path),
+            str(enum_field_as_literal),
+            str(sorted(sdk_config.items()) if sdk_config else None),
+            str(compact_responses),
+            files_digest([template_dir, BUILTIN_VISITOR_DIR, *Path(__file__).parent.glob("*.py"), *(custom_visitors if custom_visitors else [])]),
+            formatter_key,
+        )
+        outputs: Optional[dict[str, str]] = cache.load_outputs(cache_key)
+
+    if outputs is None:
+        outputs = _generate_outputs(
+            input_text,
+            output_dir,
+            template_dir,
+            model_path,
+            enum_field_as_literal,
+            custom_visitors,
+            BUILTIN_VISITOR_DIR,
+            settings_path,
+            formatter_key,
+            cache,
+            timings,
+            workers,
+            chunk_lines,
+            sdk_config,
+            compact_responses,
+        )
+        if outputs is None:
+            return None
+        cache.store_outputs(cache_key, outputs)
+
+    with timings.stage("write"):
+        written: list[str] = [path for path, code in outputs.items() if write_if_changed(output_dir / path, code)]
+
+    summary: str = f"{len(written)} of {len(outputs)} files changed" + (" (cached)" if "parse" not in timings.durations else "")
+    return summary + "\n" + timings.report()
+
+
+@functools.lru_cache(maxsize=None)
+def _environment(template_dir: Path) -> Environment:
+    # expediagroup: templates are compiled once per process, and inherited by batch workers forked afterwards.
     environment: Environment = Environment(
         loader=FileSystemLoader(
             template_dir if template_dir else f"{Path(__file__).parent}/template",
             encoding="utf8",
         ),
     )
+    for target in template_dir.rglob("*"):
+        environment.get_template(str(target.relative_to(template_dir)))
+
+    return environment
+
+
+def _generate_outputs(
+    input_text: str,
+    output_dir: Path,
+    template_dir: Path,
+    model_path: Path,
+    enum_field_as_literal: Optional[str],
+    custom_visitors: Optional[list[Path]],
+    visitors_dir: Path,
+    settings_path: Path,
+    formatter_key: str,
+    cache: GenerationCache,
+    timings: StageTimings,
+    workers: Optional[int],
+    chunk_lines: int,
+    sdk_config: Optional[dict[str, str]],
+    compact_responses: bool,
+) -> Optional[dict[str, str]]:
+    with timings.stage("parse"):
+        if enum_field_as_literal:
+            parser = OpenApiParser(input_text, enum_field_as_literal=enum_field_as_literal)  # noqa
+        else:
+            parser = OpenApiParser(input_text)
+            parser.collapse_root_models = True
+        parser.sdk_config = sdk_config
+        parser.compact_responses = compact_responses
+        with chdir(output_dir):
+            models = parser.parse()
+    if not models:
+        return None
+    elif isinstance(models, str):
+        # expediagroup: removed `generated by fastapi-codegen` header from generated files.
+        modules: dict[str, str] = {model_path.as_posix(): "\n" + models.rstrip() + "\n"}
+    else:
+        raise Exception("Modular references are not supported in this version")
 
-    results: dict[Path, str] = {}
-    code_formatter = CodeFormatter(PythonVersion.PY_38, Path().resolve())
+    environment: Environment = _environment(template_dir)
 
     template_vars: dict[str, object] = {"info": parser.parse_info()}
     visitors: list[tuple[int, Visitor]] = []
 
-    # expediagroup: set new visitors' path.
-    BUILTIN_VISITOR_DIR = Path(__file__).parent / "visitors"
-    # Load visitors
-    builtin_visitors = BUILTIN_VISITOR_DIR.rglob("*.py")
-    visitors_path = [*builtin_visitors, *(custom_visitors if custom_visitors else [])]
-    for visitor_path in visitors_path:
-        module = dynamic_load_module(visitor_path)
-        if hasattr(module, "visit"):
-            visitor_order = int(module.order) if hasattr(module, "order") and module.order > 0 else int(1e18)
-
-            visitors.append((visitor_order, module.visit))
-        else:
-            raise Exception(f"{visitor_path.stem} does not have any visit function")
+    with timings.stage("visit"):
+        # Load visitors
+        builtin_visitors = visitors_dir.rglob("*.py")
+        visitors_path = [*builtin_visitors, *(custom_visitors if custom_visitors else [])]
+        for visitor_path in visitors_path:
+            module = dynamic_load_module(visitor_path)
+            if hasattr(module, "visit"):
+                visitor_order = int(module.order) if hasattr(module, "order") and module.order > 0 else int(1e18)
 
-    # Sort visitors by their given order
-    visitors.sort(key=lambda item: item[0])
+                visitors.append((visitor_order, module.visit))
+            else:
+                raise Exception(f"{visitor_path.stem} does not have any visit function")
 
-    # Call visitors to build template_vars
-    for _, visitor in visitors:
-        visitor_result = visitor(parser, model_path)
-        template_vars = {**template_vars, **visitor_result}
+        # Sort visitors by their given order
+        visitors.sort(key=lambda item: item[0])
 
-    for target in template_dir.rglob("*"):
-        relative_path = target.relative_to(template_dir)
-        template = environment.get_template(str(relative_path))
-        result = template.render(template_vars)
-        results[relative_path] = code_formatter.format_code(result)
-
-    # expediagroup: removed `generated by fastapi-codegen` header from generated files.
-
-    for path, code in results.items():
-        with output_dir.joinpath(path.with_suffix(".py")).open("wt") as file:
-            # expediagroup: removed `generated by fastapi-codegen` header from generated files.
-            print(code.rstrip(), file=file)
-
-    # expediagroup: removed `generated by fastapi-codegen` header from generated files.
-    for path, body_and_filename in modules.items():
-        body, filename = body_and_filename
-        if path is None:
-            file = None
-        else:
-            if not path.parent.exists():
-                path.parent.mkdir(parents=True)
-            file = path.open("wt", encoding="utf8")
+        # Call visitors to build template_vars
+        for _, visitor in visitors:
+            visitor_result = visitor(parser, model_path)
+            template_vars = {**template_vars, **visitor_result}
 
-        if body:
-            print("", file=file)
-            print(body.rstrip(), file=file)
+    rendered: dict[str, str] = {}
+    with timings.stage("render"):
+        for target in template_dir.rglob("*"):
+            relative_path = target.relative_to(template_dir)
+            template = environment.get_template(str(relative_path))
+            rendered[relative_path.with_suffix(".py").as_posix()] = template.render(template_vars)
 
-        if file is not None:
-            file.close()
+    with timings.stage("format"):
+        formatted: dict[str, str] = format_sources(rendered, settings_path, cache, formatter_key, workers=workers, chunk_lines=chunk_lines)
+        # expediagroup: removed `generated by fastapi-codegen` header from generated files.
+        results: dict[str, str] = {path: code.rstrip() + "\n" for path, code in formatted.items()}
+
+    return {**results, **modules}
 
 
 @app.command()
 def main(
-    input_file: typer.FileText = typer.Option(..., "--input", "-i"),
-    output_dir: Path = typer.Option(..., "--output", "-o"),
+    input_file: Optional[typer.FileText] = typer.Option(None, "--input", "-i"),
+    output_dir: Optional[Path] = typer.Option(None, "--output", "-o"),
     model_file: str = typer.Option(None, "--model-file", "-m"),
     template_dir: Optional[Path] = typer.Option(None, "--template-dir", "-t"),
     enum_field_as_literal: Optional[LiteralType] = typer.Option(None, "--enum-field-as-literal"),
     custom_visitors: Optional[list[Path]] = typer.Option(None, "--custom-visitor", "-c"),
+    cache_dir: Path = typer.Option(DEFAULT_CACHE_DIR, "--cache-dir"),
+    no_cache: bool = typer.Option(False, "--no-cache"),
+    workers: Optional[int] = typer.Option(None, "--workers", "-w"),
+    chunk_lines: int = typer.Option(CHUNK_MIN_LINES, "--chunk-lines"),
+    compact_responses: bool = typer.Option(False, "--compact-responses"),
+    manifest: Optional[Path] = typer.Option(None, "--manifest"),
+    jobs: int = typer.Option(1, "--jobs", "-j"),
 ) -> None:
+    # expediagroup: batch mode, generates every SDK of a manifest in this process and its forks.
+    if manifest:
+        return batch(
+            manifest, template_dir, enum_field_as_literal, custom_visitors, None if no_cache else cache_dir, workers, chunk_lines, compact_responses, jobs
+        )
+
+    if not input_file or not output_dir:
+        raise typer.BadParameter("--input and --output are required unless --manifest is given")
+
     input_name: str = input_file.name
     input_text: str = input_file.read()
     if model_file:
@@ -165,23 +261,76 @@ def main(
         model_path = MODEL_PATH
 
     if enum_field_as_literal:
-        return generate_code(
+        report = generate_code(
             input_name,
             input_text,
             output_dir,
             template_dir,
             model_path,
             enum_field_as_literal,
+            cache_dir=None if no_cache else cache_dir,
+            workers=workers,
+            chunk_lines=chunk_lines,
+            compact_responses=compact_responses,
         )
-    return generate_code(
-        input_name,
-        input_text,
-        output_dir,
-        template_dir,
-        model_path,
+    else:
+        report = generate_code(
+            input_name,
+            input_text,
+            output_dir,
+            template_dir,
+            model_path,
+            custom_visitors=custom_visitors,
+            cache_dir=None if no_cache else cache_dir,
+            workers=workers,
+            chunk_lines=chunk_lines,
+            compact_responses=compact_responses,
+        )
+    if report:
+        typer.echo(report, err=True)
+
+
+def batch(
+    manifest: Path,
+    template_dir: Optional[Path],
+    enum_field_as_literal: Optional[str],
+    custom_visitors: Optional[list[Path]],
+    cache_dir: Optional[Path],
+    workers: Optional[int],
+    chunk_lines: int,
+    compact_responses: bool,
+    jobs: int,
+) -> None:
+    template_dir = template_dir if template_dir else BUILTIN_TEMPLATE_DIR
+    # Compile the templates before workers are forked, so that they all inherit them.
+    _environment(template_dir)
+
+    generate = functools.partial(
+        generate_code,
+        template_dir=template_dir,
+        enum_field_as_literal=enum_field_as_literal,
         custom_visitors=custom_visitors,
+        cache_dir=cache_dir,
+        # Specs are already generated concurrently, nesting a pool of formatting processes in each worker would not help.
+        workers=1 if jobs > 1 else workers,
+        chunk_lines=chunk_lines,
+        compact_responses=compact_responses,
     )
 
+    try:
+        entries = load_manifest(manifest)
+    except ValueError as error:
+        raise typer.BadParameter(str(error), param_hint="--manifest")
+
+    failed: bool = False
+    for result in generate_batch(entries, generate, jobs):
+        typer.echo(f"[{result.entry.namespace}] {result.entry.input} -> {result.entry.output}", err=True)
+        typer.echo(result.error if result.error else result.report, err=True)
+        failed = failed or bool(result.error)
+
+    if failed:
+        raise typer.Exit(code=1)
+
 
 if __name__ == "__main__":
     typer.run(main)
@@ -0,0 +1,145 @@
+# Copyright 2022 Expedia, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import functools
+import multiprocessing
+import traceback
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+import yaml
+
+MANIFEST_REQUIRED_KEYS: tuple[str, ...] = ("input", "output", "namespace", "version")
+
+
+@dataclass(frozen=True)
+class BatchEntry:
+    r"""A spec to generate an SDK from, as listed in a batch manifest.
+
+    Attributes:
+        input (Path): The OpenAPI spec.
+        output (Path): Directory the SDK is generated into.
+        namespace (str): SDK namespace, e.g. `fraudPreventionV2`.
+        version (str): SDK version.
+        model_file (str): Name of the generated models module.
+    """
+
+    input: Path
+    output: Path
+    namespace: str
+    version: str
+    model_file: str = "model.py"
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    r"""Outcome of the generation of a single manifest entry.
+
+    Attributes:
+        entry (BatchEntry): The generated entry.
+        report (Optional[str]): The generation report, `None` if the generation failed.
+        error (Optional[str]): The formatted exception the generation failed with.
+    """
+
+    entry: BatchEntry
+    report: Optional[str] = None
+    error: Optional[str] = None
+
+
+def load_manifest(manifest_path: Path) -> list[BatchEntry]:
+    r"""Reads a YAML manifest of the SDKs to generate.
+
+    The manifest holds a `specs` list, each item with the `input`, `output`, `namespace` and `version` of an SDK and
+    an optional `model_file`. Relative paths are resolved against the manifest directory. Namespaces must be unique,
+    SDKs sharing one would be published under the same package.
+
+    Args:
+        manifest_path (Path): The manifest.
+
+    Returns:
+        list[BatchEntry]: The manifest entries, in order.
+
+    Raises:
+        ValueError: If the manifest is malformed or lists a namespace more than once.
+    """
+    manifest: Any = yaml.safe_load(manifest_path.read_text(encoding="utf8"))
+    if not isinstance(manifest, dict) or not isinstance(manifest.get("specs"), list):
+        raise ValueError(f"{manifest_path}: expected a mapping with a `specs` list")
+    base_dir: Path = manifest_path.parent
+
+    entries: list[BatchEntry] = []
+    namespaces: set[str] = set()
+    for index, spec in enumerate(manifest["specs"]):
+        if not isinstance(spec, dict):
+            raise ValueError(f"{manifest_path}: specs[{index}] is not a mapping")
+        missing: list[str] = [key for key in MANIFEST_REQUIRED_KEYS if spec.get(key) is None]
+        if missing:
+            raise ValueError(f"{manifest_path}: specs[{index}] is missing {', '.join(missing)}")
+
+        namespace: str = str(spec["namespace"])
+        if namespace in namespaces:
+            raise ValueError(f"{manifest_path}: specs[{index}] repeats the namespace {namespace}")
+        namespaces.add(namespace)
+
+        entries.append(
+            BatchEntry(
+                input=base_dir / spec["input"],
+                output=base_dir / spec["output"],
+                namespace=namespace,
+                version=str(spec["version"]),
+                model_file=spec.get("model_file", BatchEntry.model_file),
+            )
+        )
+
+    return entries
+
+
+def _generate_entry(generate: Callable[..., str], entry: BatchEntry) -> BatchResult:
+    try:
+        report: str = generate(
+            input_name=str(entry.input),
+            input_text=entry.input.read_text(encoding="utf8"),
+            output_dir=entry.output,
+            model_path=Path(entry.model_file).with_suffix(".py"),
+            sdk_config={"namespace": entry.namespace, "version": entry.version},
+        )
+    except Exception:
+        return BatchResult(entry=entry, error=traceback.format_exc())
+
+    return BatchResult(entry=entry, report=report)
+
+
+def generate_batch(entries: list[BatchEntry], generate: Callable[..., str], jobs: int = 1) -> list[BatchResult]:
+    r"""Generates the SDKs of a manifest, `jobs` at a time.
+
+    Workers are forked from the current process where the platform allows it, so that they start with the generator
+    dependencies already imported and its templates already compiled. A failed entry does not stop the others.
+
+    Args:
+        entries (list[BatchEntry]): The SDKs to generate.
+        generate (Callable[..., str]): Generates a single SDK, with the keyword arguments of `generate_code` not bound yet.
+        jobs (int): Maximum number of SDKs generated concurrently.
+
+    Returns:
+        list[BatchResult]: The results, in the order of `entries`.
+    """
+    generate_entry = functools.partial(_generate_entry, generate)
+    if jobs <= 1 or len(entries) <= 1:
+        return list(map(generate_entry, entries))
+
+    context = multiprocessing.get_context("fork") if "fork" in multiprocessing.get_all_start_methods() else None
+    with ProcessPoolExecutor(max_workers=min(jobs, len(entries)), mp_context=context) as executor:
+        return list(executor.map(generate_entry, entries))
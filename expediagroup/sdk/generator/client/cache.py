@@ -0,0 +1,179 @@
+# Copyright 2022 Expedia, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import contextlib
+import functools
+import hashlib
+import json
+import os
+import tempfile
+import time
+from collections.abc import Iterable, Iterator
+from importlib import metadata
+from pathlib import Path
+from typing import Optional, Union
+
+# Packages whose versions change the generated code.
+GENERATOR_DEPENDENCIES: tuple[str, ...] = ("datamodel-code-generator", "fastapi-code-generator", "black", "isort")
+
+DEFAULT_CACHE_DIR: Path = Path.home() / ".cache" / "expediagroup-sdk-generator"
+
+
+def digest(*parts: Union[str, bytes]) -> str:
+    r"""Hashes a sequence of parts, parts boundaries are part of the hash.
+
+    Returns:
+        str: The SHA-256 hex digest.
+    """
+    hasher = hashlib.sha256()
+    for part in parts:
+        data: bytes = part.encode("utf8") if isinstance(part, str) else part
+        hasher.update(len(data).to_bytes(8, "big"))
+        hasher.update(data)
+
+    return hasher.hexdigest()
+
+
+def files_digest(paths: Iterable[Path]) -> str:
+    r"""Hashes the names and contents of files, in a stable order.
+
+    Args:
+        paths (Iterable[Path]): Files to hash, directories are walked recursively.
+
+    Returns:
+        str: The SHA-256 hex digest.
+    """
+    # Files are named relative to the hashed directory, so that the digest does not depend on where it lives.
+    files: dict[str, Path] = dict()
+    for path in paths:
+        if path.is_dir():
+            for file in path.rglob("*"):
+                if file.is_file() and "__pycache__" not in file.parts:
+                    files[f"{path.name}/{file.relative_to(path).as_posix()}"] = file
+        elif path.is_file():
+            files[path.name] = path
+
+    parts: list[Union[str, bytes]] = []
+    for name in sorted(files.keys()):
+        parts.extend((name, files[name].read_bytes()))
+
+    return digest(*parts)
+
+
+@functools.lru_cache(maxsize=None)
+def dependencies_digest() -> str:
+    r"""Hashes the installed versions of `GENERATOR_DEPENDENCIES`."""
+    versions: list[str] = []
+    for dependency in GENERATOR_DEPENDENCIES:
+        try:
+            versions.append(f"{dependency}=={metadata.version(dependency)}")
+        except metadata.PackageNotFoundError:
+            versions.append(f"{dependency}==")
+
+    return digest(*versions)
+
+
+class GenerationCache:
+    def __init__(self, directory: Optional[Path]):
+        r"""Content-addressed store of generated files.
+
+        Two kinds of entries are kept: the whole output of a generation, keyed by a digest of all of its inputs, and
+        the formatted version of a rendered file, keyed by a digest of the rendered code. The former lets an unchanged
+        spec skip every stage, the latter lets a partial change skip formatting the files it does not affect.
+
+        Args:
+            directory (Optional[Path]): Where entries are stored, `None` disables caching.
+        """
+        self.directory: Optional[Path] = directory
+
+    def load_outputs(self, key: str) -> Optional[dict[str, str]]:
+        r"""Returns the generated files stored for a key, by path relative to the output directory."""
+        entry = self.__entry("outputs", key, ".json")
+        if not entry or not entry.exists():
+            return None
+
+        return json.loads(entry.read_text(encoding="utf8"))
+
+    def store_outputs(self, key: str, outputs: dict[str, str]) -> None:
+        r"""Stores generated files, by path relative to the output directory."""
+        entry = self.__entry("outputs", key, ".json")
+        if entry:
+            GenerationCache.__write_atomically(entry, json.dumps(outputs))
+
+    def load_formatted(self, formatter_key: str, code: str) -> Optional[str]:
+        r"""Returns the formatted version of rendered code stored by a previous run, if any.
+
+        Args:
+            formatter_key (str): Digest of the formatter settings and versions.
+            code (str): The rendered code.
+        """
+        entry = self.__entry("formatted", digest(formatter_key, code), ".py")
+        if not entry or not entry.exists():
+            return None
+
+        return entry.read_text(encoding="utf8")
+
+    def store_formatted(self, formatter_key: str, code: str, formatted: str) -> None:
+        r"""Stores the formatted version of rendered code."""
+        entry = self.__entry("formatted", digest(formatter_key, code), ".py")
+        if entry:
+            GenerationCache.__write_atomically(entry, formatted)
+
+    def __entry(self, kind: str, key: str, suffix: str) -> Optional[Path]:
+        if not self.directory:
+            return None
+
+        return self.directory / kind / key[:2] / f"{key}{suffix}"
+
+    @staticmethod
+    def __write_atomically(path: Path, content: str) -> None:
+        # Concurrent generations may share the cache, an entry is either complete or absent.
+        path.parent.mkdir(parents=True, exist_ok=True)
+        descriptor, temporary = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(descriptor, "wt", encoding="utf8") as file:
+            file.write(content)
+        os.replace(temporary, path)
+
+
+def write_if_changed(path: Path, content: str) -> bool:
+    r"""Writes a file unless it already holds the same content, so that unchanged files keep their timestamps.
+
+    Returns:
+        bool: Whether the file was written.
+    """
+    if path.exists() and path.read_text(encoding="utf8") == content:
+        return False
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf8")
+    return True
+
+
+class StageTimings:
+    r"""Wall-clock durations of the generation stages, in order of execution."""
+
+    def __init__(self):
+        self.durations: dict[str, float] = dict()
+
+    @contextlib.contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start: float = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.durations[name] = self.durations.get(name, 0.0) + time.perf_counter() - start
+
+    def report(self) -> str:
+        lines: list[str] = [f"{name:<10} {duration:8.3f}s" for name, duration in self.durations.items()]
+        lines.append(f"{'total':<10} {sum(self.durations.values()):8.3f}s")
+        return "\n".join(lines)
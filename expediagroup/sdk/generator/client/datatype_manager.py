@@ -12,11 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import re
 from copy import deepcopy
 from typing import Any
 
 from datamodel_code_generator.model import pydantic as datamodel_code_generator_pydantic
-from datamodel_code_generator.model.pydantic.imports import IMPORT_CONSTR
 from datamodel_code_generator.model.pydantic.types import (
     escape_characters,
     string_kwargs,
@@ -26,6 +26,9 @@ from datamodel_code_generator.types import DataType, StrictTypes, Types
 
 PYDANTIC_V2_MIGRATION_CONSTRAINTS_MAPPING: dict[str, str] = {"regex": "pattern"}
 
+# Lookarounds and backreferences, which the Rust regex engine of `pydantic-core` does not support.
+PYTHON_ONLY_REGEX_CONSTRUCTS: re.Pattern = re.compile(r"\(\?<?[=!]|\(\?P=|\\[1-9]")
+
 
 class PydanticV2DataTypeManager(datamodel_code_generator_pydantic.DataTypeManager):
     r"""
@@ -36,8 +39,48 @@ class PydanticV2DataTypeManager(datamodel_code_generator_pydantic.DataTypeManage
             its `datamodel-code-generator` from `0.16.1` to `>=0.25.1` which includes
             PydanticV2 support.
             GitHub Issue: https://github.com/koxudaxi/fastapi-code-generator/issues/378
+        - Constrained strings are not generated inline, each distinct set of constraints is defined once as a
+            module-level `Annotated` type that all the fields sharing those constraints use.
     """
 
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        # expediagroup: module-level constrained string types, definitions by name, in order of first use.
+        self.constrained_str_types: dict[str, str] = dict()
+        self.python_regex_required: bool = False
+        self.__constrained_str_names: dict[tuple[tuple[str, Any], ...], str] = dict()
+        self.__patterns: dict[str, int] = dict()
+
+    def get_constrained_str_type(self, data_type_kwargs: dict[str, Any]) -> DataType:
+        """
+        Returns the module-level type of a set of string constraints, defining it on first use.
+
+        Args:
+            data_type_kwargs (dict[str, Any]): The constraints, as pydantic v2 `StringConstraints` arguments.
+
+        Returns:
+            DataType: A data type referring to the shared type by name.
+        """
+        key: tuple[tuple[str, Any], ...] = tuple(data_type_kwargs.items())
+        name: str = self.__constrained_str_names.get(key)
+        if not name:
+            parts: list[str] = ["Str"]
+            for constraint, value in data_type_kwargs.items():
+                if constraint == "pattern":
+                    parts.append(f"Pattern{self.__patterns.setdefault(value, len(self.__patterns) + 1)}")
+                    self.python_regex_required |= bool(PYTHON_ONLY_REGEX_CONSTRUCTS.search(value))
+                elif value is True:
+                    parts.append(constraint.title().replace("_", ""))
+                else:
+                    parts.append(f"{constraint.split('_')[0].title()}{value}")
+            name = "".join(parts)
+
+            constraints: str = ", ".join(f"{constraint}={value}" for constraint, value in data_type_kwargs.items())
+            self.constrained_str_types[name] = f"Annotated[str, StringConstraints({constraints})]"
+            self.__constrained_str_names[key] = name
+
+        return self.data_type(type=name)
+
     @staticmethod
     def migrate_datatype_constraints(data_type_kwargs: dict[str, Any]) -> dict[str, Any]:
         """
@@ -71,7 +114,7 @@ class PydanticV2DataTypeManager(datamodel_code_generator_pydantic.DataTypeManage
                 # Copied code, single line added.
                 data_type_kwargs = PydanticV2DataTypeManager.migrate_datatype_constraints(data_type_kwargs)
 
-            return self.data_type.from_import(IMPORT_CONSTR, kwargs=data_type_kwargs)
+            return self.get_constrained_str_type(data_type_kwargs)
         if strict:
             return self.strict_type_map[StrictTypes.str]
         return self.type_map[types]
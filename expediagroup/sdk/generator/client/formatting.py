@@ -0,0 +1,166 @@
+# Copyright 2022 Expedia, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import ast
+import functools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional, Protocol
+
+import isort
+from datamodel_code_generator import PythonVersion
+from datamodel_code_generator.format import CodeFormatter, black_find_project_root
+
+CHUNK_MIN_LINES: int = 400
+
+# Formatted chunks end with a single newline, two more make the two blank lines black puts before a top-level definition.
+CHUNKS_SEPARATOR: str = "\n\n"
+
+DEFINITIONS: tuple[type, ...] = (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)
+
+
+class FormattedCodeCache(Protocol):
+    def load_formatted(self, formatter_key: str, code: str) -> Optional[str]:
+        r"""Returns the formatted code of a chunk, `None` if it was never formatted with this formatter."""
+
+    def store_formatted(self, formatter_key: str, code: str, formatted: str) -> None:
+        r"""Stores the formatted code of a chunk."""
+
+
+def split_top_level(code: str, min_lines: int = CHUNK_MIN_LINES) -> list[str]:
+    r"""Splits code into chunks of at least `min_lines` lines, each of them formattable on its own.
+
+    Chunks only start at a top-level class or function definition, decorators and comments right above it included.
+    Black always separates such a definition from what precedes it with two blank lines, so formatting chunks one by
+    one and joining them with `CHUNKS_SEPARATOR` gives the same result as formatting the whole code.
+
+    Args:
+        code (str): The code to split.
+        min_lines (int): Minimum size of a chunk, `0` disables splitting.
+
+    Returns:
+        list[str]: The chunks, in order. Code that does not parse is returned as a single chunk.
+    """
+    if min_lines <= 0:
+        return [code]
+
+    try:
+        tree = ast.parse(code)
+    except SyntaxError:
+        return [code]
+
+    lines: list[str] = code.splitlines(keepends=True)
+    boundaries: list[int] = []
+    chunk_start: int = 0
+    for node in tree.body:
+        if not isinstance(node, DEFINITIONS):
+            continue
+
+        start: int = min([node.lineno, *(decorator.lineno for decorator in node.decorator_list)]) - 1
+        while start > 0 and lines[start - 1].lstrip().startswith("#"):
+            start -= 1
+
+        if start - chunk_start >= min_lines:
+            boundaries.append(start)
+            chunk_start = start
+
+    return ["".join(lines[start:end]) for start, end in zip([0, *boundaries], [*boundaries, len(lines)])]
+
+
+def formatter_settings_files(settings_path: Path) -> list[Path]:
+    r"""Returns the files black and isort read their settings from, resolved from `settings_path` as `CodeFormatter` does.
+
+    Black reads the `pyproject.toml` at the project root found from `settings_path`, isort reads the files its own
+    lookup from `settings_path` finds, which usually is the same `pyproject.toml`.
+
+    Args:
+        settings_path (Path): Directory the isort and black settings are looked up from.
+
+    Returns:
+        list[Path]: The settings files, empty if both formatters run with their defaults.
+    """
+    files: list[Path] = []
+    black_settings: Path = black_find_project_root((settings_path,)) / "pyproject.toml"
+    if black_settings.is_file():
+        files.append(black_settings)
+
+    for source in isort.Config(settings_path=str(settings_path)).sources:
+        isort_settings: Path = Path(source.get("source", ""))
+        if isort_settings.is_file() and isort_settings.resolve() not in {file.resolve() for file in files}:
+            files.append(isort_settings)
+
+    return files
+
+
+@functools.lru_cache(maxsize=None)
+def _code_formatter(settings_path: str) -> CodeFormatter:
+    return CodeFormatter(PythonVersion.PY_38, Path(settings_path))
+
+
+def format_chunk(settings_path: str, code: str) -> str:
+    r"""Formats code with a `CodeFormatter` built once per process, so that it can run in worker processes.
+
+    Args:
+        settings_path (str): Directory the isort and black settings are looked up from.
+        code (str): The code to format.
+
+    Returns:
+        str: The formatted code.
+    """
+    return _code_formatter(settings_path).format_code(code)
+
+
+def format_sources(
+    sources: dict[str, str],
+    settings_path: Path,
+    cache: FormattedCodeCache,
+    formatter_key: str,
+    workers: Optional[int] = None,
+    chunk_lines: int = CHUNK_MIN_LINES,
+) -> dict[str, str]:
+    r"""Formats rendered files, splitting large ones into chunks, in a pool of processes.
+
+    Chunks already formatted by a previous run are taken from the cache. The output does not depend on the number of
+    workers, nor on the order in which chunks complete.
+
+    Args:
+        sources (dict[str, str]): Rendered code, by file path.
+        settings_path (Path): Directory the isort and black settings are looked up from.
+        cache (FormattedCodeCache): Cache of formatted chunks.
+        formatter_key (str): Digest of the formatter settings and versions.
+        workers (Optional[int]): Number of worker processes, defaults to the number of CPUs, `1` formats in process.
+        chunk_lines (int): Minimum size of a chunk, `0` formats every file as a whole.
+
+    Returns:
+        dict[str, str]: The formatted code, by file path.
+    """
+    chunks: dict[str, list[str]] = {path: split_top_level(code, chunk_lines) for path, code in sources.items()}
+    formatted: dict[str, list[Optional[str]]] = {path: [cache.load_formatted(formatter_key, chunk) for chunk in parts] for path, parts in chunks.items()}
+
+    pending: list[tuple[str, int]] = [(path, index) for path, parts in formatted.items() for index, part in enumerate(parts) if part is None]
+    pending_code: list[str] = [chunks[path][index] for path, index in pending]
+    format_pending = functools.partial(format_chunk, str(settings_path))
+
+    workers = min(workers or os.cpu_count() or 1, len(pending))
+    if workers <= 1:
+        results = list(map(format_pending, pending_code))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(format_pending, pending_code))
+
+    for (path, index), code, result in zip(pending, pending_code, results):
+        formatted[path][index] = result
+        cache.store_formatted(formatter_key, code, result)
+
+    return {path: CHUNKS_SEPARATOR.join(parts) for path, parts in formatted.items()}
@@ -0,0 +1,103 @@
+# Copyright 2022 Expedia, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import collections
+from collections.abc import Iterable
+from typing import Optional
+
+from datamodel_code_generator.model import DataModel, DataModelFieldBase
+
+
+class ModelGraph:
+    def __init__(self, models: dict[str, DataModel]):
+        r"""Indexes models by class name, parent and field name, once for all the visitors.
+
+        Looking up the children of a model or one of its fields is then a dictionary access, instead of a scan over
+        all the models or all the fields of the model.
+
+        Args:
+            models(dict[str, DataModel]): A mapping for models, and their classnames as keys. The graph reads and
+            updates this mapping, it is not copied.
+        """
+        self.models: dict[str, DataModel] = models
+        self.__children: dict[str, list[str]] = collections.defaultdict(list)
+        self.__fields: dict[str, dict[str, list[DataModelFieldBase]]] = dict()
+
+        # Children are listed in the order of `models`, as a scan over `models` would find them.
+        for model in models.values():
+            self.__children[model.base_class].append(model.class_name)
+
+    def model(self, classname: str) -> Optional[DataModel]:
+        r"""Returns the model of a classname, `None` if there is none."""
+        return self.models.get(classname)
+
+    def children_classnames(self, parent_classname: str) -> list[str]:
+        r"""Returns the classnames of the models which directly inherit a given model.
+
+        Args:
+            parent_classname(str): Parent model classname.
+
+        Returns:
+            list[str]: A new list, safe to be modified by the caller.
+        """
+        return list(self.__children.get(parent_classname, ()))
+
+    def fields(self, classname: str, name: str) -> list[DataModelFieldBase]:
+        r"""Returns the fields of a model with a given name.
+
+        Args:
+            classname(str): Classname of the model holding the fields.
+            name(str): Name of the fields.
+
+        Returns:
+            list[DataModelFieldBase]: The fields, in their order in the model. A well-formed model has at most one.
+        """
+        return list(self.__fields_by_name(classname).get(name, ()))
+
+    def add_field(self, classname: str, field: DataModelFieldBase) -> None:
+        r"""Appends a field to a model, keeping the index of its fields up to date.
+
+        Args:
+            classname(str): Classname of the model to add the field to.
+            field(DataModelFieldBase): The field to add.
+        """
+        self.models[classname].fields.append(field)
+        if classname in self.__fields:
+            self.__fields[classname][field.name].append(field)
+
+    def remove(self, classnames: Iterable[str]) -> None:
+        r"""Removes models from the graph, and from the mapping it indexes.
+
+        Args:
+            classnames(Iterable[str]): Classnames of the models to remove.
+        """
+        removed: set[str] = set(classnames)
+        for classname in removed:
+            model = self.models.pop(classname, None)
+            if model is None:
+                continue
+
+            siblings = self.__children.get(model.base_class)
+            if siblings:
+                siblings.remove(classname)
+            self.__fields.pop(classname, None)
+
+    def __fields_by_name(self, classname: str) -> dict[str, list[DataModelFieldBase]]:
+        # Fields are only indexed for the models they are looked up in.
+        if classname not in self.__fields:
+            fields: dict[str, list[DataModelFieldBase]] = collections.defaultdict(list)
+            for field in self.models[classname].fields:
+                fields[field.name].append(field)
+            self.__fields[classname] = fields
+
+        return self.__fields[classname]
@@ -64,10 +64,18 @@ from datamodel_code_generator.types import DataType, DataTypeManager, StrictType
 from datatype_manager import PydanticV2DataTypeManager
 from fastapi_code_generator import parser
 from model import Argument, Operation, ParamTypes
+from model_graph import ModelGraph
 from stringcase import snakecase
 
 
 class OpenApiParser(parser.OpenAPIParser, JsonSchemaParser):
+    # expediagroup: SDK namespace and version read by the `sdk_info` visitor, `None` falls back to `visitors/sdk.config`.
+    sdk_config: Optional[dict[str, str]] = None
+    # expediagroup: models indexed by the `models` visitor, for the visitors that run after it.
+    model_graph: Optional[ModelGraph] = None
+    # expediagroup: generate models only used by successful responses as compact, read-only dataclasses.
+    compact_responses: bool = False
+
     def __init__(
         self,
         source: Union[str, pathlib.Path, list[pathlib.Path], ParseResult],
@@ -0,0 +1,38 @@
+# Copyright 2022 Expedia, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from pathlib import Path
+
+from fastapi_code_generator.parser import OpenAPIParser
+from fastapi_code_generator.visitor import Visitor
+
+
+def get_safe_to_duplicate_operations() -> frozenset[str]:
+    r"""Returns a static set of operation IDs whose requests can be sent more than once without side effects,
+    e.g. by request hedging.
+
+    Returns:
+        frozenset[str]
+    """
+    return frozenset(
+        {
+            "screenAccount",
+        }
+    )
+
+
+def get_duplication_config(parser: OpenAPIParser, model_path: Path) -> dict[str, object]:
+    return {"safe_to_duplicate_operations": get_safe_to_duplicate_operations()}
+
+
+visit: Visitor = get_duplication_config
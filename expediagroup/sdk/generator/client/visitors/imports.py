@@ -42,6 +42,10 @@ def get_imports(parser: OpenAPIParser, model_path: Path) -> dict[str, object]:
         if reference:
             imports.append(data_type.all_imports)
             imports.append(Import.from_full_path(f".{model_path.stem}.{reference.name}"))
+        # expediagroup: constrained strings are types defined in the models module.
+        for nested_data_type in data_type.all_data_types:
+            if nested_data_type.type in getattr(parser.data_type_manager, "constrained_str_types", ()):
+                imports.append(Import.from_full_path(f".{model_path.stem}.{nested_data_type.type}"))
     # expediagroup: refactor fastapi_imports to parameter_imports.
     for from_, imports_ in parser.parameter_imports.items():
         imports[from_].update(imports_)
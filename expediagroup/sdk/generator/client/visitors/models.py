@@ -13,6 +13,7 @@
 # limitations under the License.
 import collections
 import dataclasses
+import re
 from collections.abc import Callable
 from pathlib import Path
 from typing import Any
@@ -23,6 +24,7 @@ from datamodel_code_generator.parser.base import sort_data_models
 from datamodel_code_generator.types import DataType
 from fastapi_code_generator.parser import OpenAPIParser, Operation
 from fastapi_code_generator.visitor import Visitor
+from model_graph import ModelGraph
 from pydantic import BaseModel, Extra, Field, parse_obj_as
 
 GENERIC_TYPES: list[str] = ["BaseModel", "Enum"]
@@ -92,27 +94,26 @@ def parse_datamodels(parser: OpenAPIParser) -> collections.defaultdict[str, Data
     return models
 
 
-def parse_children_classnames(parent_classname: str, models: dict[str, DataModel]) -> list[str]:
+def parse_children_classnames(parent_classname: str, graph: ModelGraph) -> list[str]:
     r"""Parses children classnames of a given parent.
 
     Args:
         parent_classname(str): Parent model classname.
-        models(dict[str, DataModel]): A mapping for models, and their classnames as keys.
+        graph(ModelGraph): The indexed models.
 
     Returns:
 
     """
-    children = list(filter(lambda model: model.base_class == parent_classname, models.values()))
-    return [child.class_name for child in children]
+    return graph.children_classnames(parent_classname)
 
 
-def parse_raw_discriminator(owner: str, raw_discriminator: dict[str, str], models: dict[str, DataModel]) -> Discriminator:
+def parse_raw_discriminator(owner: str, raw_discriminator: dict[str, str], graph: ModelGraph) -> Discriminator:
     r"""Parses discriminator object from its raw representation parsed from the spec.
 
     Args:
         owner(str): Owner model of the discriminator, aka parent.
         raw_discriminator(dict[str, str]): Raw discriminator object.
-        models(dict[str, DataModel]): A mapping for models, and their classnames as keys.
+        graph(ModelGraph): The indexed models.
 
     Returns:
 
@@ -121,26 +122,26 @@ def parse_raw_discriminator(owner: str, raw_discriminator: dict[str, str], model
 
     if not discriminator.mapping:
         discriminator.mapping = {
-            child_classname: child_classname for child_classname in parse_children_classnames(parent_classname=discriminator.owner, models=models)
+            child_classname: child_classname for child_classname in parse_children_classnames(parent_classname=discriminator.owner, graph=graph)
         }
 
     return discriminator
 
 
-def parse_discriminators(parser: OpenAPIParser, models: dict[str, DataModel]) -> list[Discriminator]:
+def parse_discriminators(parser: OpenAPIParser, graph: ModelGraph) -> list[Discriminator]:
     r"""Parses `Discriminator` objects from specs.
 
     Args:
         parser(OpenAPIParser): The OpenApiParser which holds all the results.
-        models(dict[str, DataModel]): A mapping for models, and their classnames as keys.
+        graph(ModelGraph): The indexed models.
 
     Returns:
 
     """
     discriminators: list[Discriminator] = []
 
-    for model in models.values():
-        if not (model.reference and model.reference.path and parse_children_classnames(parent_classname=model.class_name, models=models)):
+    for model in graph.models.values():
+        if not (model.reference and model.reference.path and parse_children_classnames(parent_classname=model.class_name, graph=graph)):
             continue
 
         raw_model = parser.get_ref_model(model.reference.path)
@@ -148,7 +149,7 @@ def parse_discriminators(parser: OpenAPIParser, models: dict[str, DataModel]) ->
         if not raw_model or DISCRIMINATOR not in raw_model.keys():
             continue
 
-        discriminator: Discriminator = parse_raw_discriminator(owner=model.class_name, raw_discriminator=raw_model[DISCRIMINATOR], models=models)
+        discriminator: Discriminator = parse_raw_discriminator(owner=model.class_name, raw_discriminator=raw_model[DISCRIMINATOR], graph=graph)
 
         for key, value in discriminator.mapping.items():
             # This might happen in case a reference to the model in schemas section is
@@ -164,18 +165,16 @@ def parse_discriminators(parser: OpenAPIParser, models: dict[str, DataModel]) ->
     return discriminators
 
 
-def apply_discriminators_to_models(discriminators: list[Discriminator], models: dict[str, DataModel]) -> None:
+def apply_discriminators_to_models(discriminators: list[Discriminator], graph: ModelGraph) -> None:
     r"""Adds discriminator attributes & constraints to all models that inherit a discriminator from their parent.
 
     Args:
         discriminators(list[Discriminator]): List of parsed discriminator objects.
-        models(dict[str, DataModel]): A mapping for models, and their classnames as keys.
+        graph(ModelGraph): The indexed models.
     """
     for discriminator in discriminators:
-        parent: DataModel = models[discriminator.owner]
-
         for discriminator_value, discriminated_model_classname in discriminator.mapping.items():
-            discriminator_field = list(filter(lambda f: f.name == discriminator.property_name, parent.fields))
+            discriminator_field = graph.fields(discriminator.owner, discriminator.property_name)
 
             if len(discriminator_field) != 1:
                 continue
@@ -188,15 +187,15 @@ def apply_discriminators_to_models(discriminators: list[Discriminator], models:
             cloned_discriminator_field.has_default = True
             cloned_discriminator_field.data_type = DataType(data_types=[literal])
 
-            models[discriminated_model_classname].fields.append(cloned_discriminator_field)
+            graph.add_field(discriminated_model_classname, cloned_discriminator_field)
 
 
-def parse_sorted_aliases(models: dict[str, DataModel], discriminators: list[Discriminator]) -> list[Alias]:
+def parse_sorted_aliases(graph: ModelGraph, discriminators: list[Discriminator]) -> list[Alias]:
     r"""Generates a list of aliases, sorted based on their dependency.
 
     Args:
         discriminators(list[Discriminator]): List of parsed discriminator objects.
-        models(dict[str, DataModel]): A mapping for models, and their classnames as keys.
+        graph(ModelGraph): The indexed models.
 
     Returns:
         list[Alias]: A list of aliases, sorted based on their dependency/inheritance tree.
@@ -214,7 +213,7 @@ def parse_sorted_aliases(models: dict[str, DataModel], discriminators: list[Disc
         order = current_order if not alias_order[parent_classname] else min(current_order - 1, -current_order)
 
         alias: Alias = Alias(
-            parent_classname=parent_classname, children_classnames=parse_children_classnames(parent_classname=parent_classname, models=models), order=order
+            parent_classname=parent_classname, children_classnames=parse_children_classnames(parent_classname=parent_classname, graph=graph), order=order
         )
         alias.children_classnames.append(f"{alias.parent_classname}Generic")
 
@@ -245,22 +244,78 @@ def get_error_models(parser: OpenAPIParser) -> list:
     for response in list(map(lambda operation: operation.error_responses, parser.operations.values())):
         for model in response.values():
             error_models.add(model["model"])
-    return list(error_models)
+    return sorted(error_models)
 
 
-def delete_root_models(models: dict[str, DataModel]):
+def delete_root_models(graph: ModelGraph):
     """
-    Deletes root models from a dictionary of DataModel objects.
+    Deletes root models from an indexed graph of DataModel objects.
 
     Args:
-        models (dict[str, DataModel]): A dictionary containing DataModel objects, where the keys are the class names.
+        graph (ModelGraph): The indexed models.
 
     """
     is_root_model: Callable = lambda model: len(model.fields) == 1 and not model.fields[0].name
-    root_models_classnames: list[str] = list(map(lambda model: model.class_name, filter(is_root_model, models.values())))
+    graph.remove([model.class_name for model in graph.models.values() if is_root_model(model)])
+
+
+def referenced_classnames(model: DataModel) -> set[str]:
+    r"""Parses the classnames of the models referenced by the fields of a model.
+
+    Args:
+        model(DataModel): The referencing model.
+
+    Returns:
+        set[str]: Classnames of the referenced models, including those nested in containers and unions.
+    """
+    return {data_type.reference.short_name for field in model.fields for data_type in field.data_type.all_data_types if data_type.reference}
+
+
+def get_compact_models(parser: OpenAPIParser, graph: ModelGraph, error_models: list[str]) -> set[str]:
+    r"""Selects the models to be generated as compact, read-only dataclasses when `parser.compact_responses` is set.
 
-    for root_model_classname in root_models_classnames:
-        models.pop(root_model_classname)
+    Those are the models only ever used by successful responses: the response models themselves and the models they
+    reference, as long as neither another model nor a request body references them too. Models taking part in inheritance are left as they are,
+    dataclasses can neither inherit nor be inherited by pydantic models.
+
+    Args:
+        parser(OpenAPIParser): The OpenApiParser which holds all the results.
+        graph(ModelGraph): The indexed models.
+        error_models(list[str]): Classnames of the error responses models, which stay pydantic models.
+
+    Returns:
+        set[str]: Classnames of the compact models.
+    """
+    if not getattr(parser, "compact_responses", False):
+        return set()
+
+    is_compactable: Callable = lambda model: model and model.base_class == "BaseModel" and not graph.children_classnames(model.class_name)
+
+    compact: set[str] = set()
+    pending: list[str] = [operation.response for operation in parser.operations.values() if operation.response]
+    while pending:
+        classname: str = pending.pop()
+        if classname in compact or classname in error_models or not is_compactable(graph.model(classname)):
+            continue
+        compact.add(classname)
+        pending.extend(referenced_classnames(graph.model(classname)))
+
+    # Models also referenced from outside of the responses are shared, e.g. with requests, and stay pydantic models.
+    # Request bodies are serialized with `model_dump_json`, the body of an operation is shared even if no model references it.
+    shared: set[str] = set()
+    for operation in parser.operations.values():
+        if operation.request and operation.request.name == "body":
+            shared.update(set(re.findall(r"\w+", operation.request.type_hint)) & compact)
+    for model in graph.models.values():
+        if model.class_name not in compact:
+            shared.update(referenced_classnames(model) & compact)
+    while shared:
+        classname = shared.pop()
+        if classname in compact:
+            compact.discard(classname)
+            shared.update(referenced_classnames(graph.model(classname)) & compact)
+
+    return compact
 
 
 def get_models(parser: OpenAPIParser, model_path: Path) -> dict[str, object]:
@@ -273,25 +328,31 @@ def get_models(parser: OpenAPIParser, model_path: Path) -> dict[str, object]:
     Returns:
         dict[str, object]: Data to be exposed to `jinja2` templates.
     """
-    models: dict[str, DataModel] = parse_datamodels(parser)
-    delete_root_models(models)
+    graph: ModelGraph = ModelGraph(parse_datamodels(parser))
+    delete_root_models(graph)
+    # Shared with the visitors that run after this one.
+    parser.model_graph = graph
 
-    _, sorted_models, __ = sort_data_models(unsorted_data_models=list(models.values()))
+    _, sorted_models, __ = sort_data_models(unsorted_data_models=list(graph.models.values()))
 
-    discriminators: list[Discriminator] = parse_discriminators(parser=parser, models=models)
+    discriminators: list[Discriminator] = parse_discriminators(parser=parser, graph=graph)
 
     set_other_responses_models([operation for operation in parser.operations.values()])
-    apply_discriminators_to_models(discriminators=discriminators, models=models)
+    apply_discriminators_to_models(discriminators=discriminators, graph=graph)
 
-    aliases: list[Alias] = parse_sorted_aliases(models=models, discriminators=discriminators)
+    aliases: list[Alias] = parse_sorted_aliases(graph=graph, discriminators=discriminators)
     is_aliased: collections.defaultdict[str, bool] = collections.defaultdict(bool, {alias.parent_classname: True for alias in aliases})
+    error_models: list = get_error_models(parser)
 
     return {
         "models": sorted_models.values(),
         "model_imports": collect_imports(sorted_models, parser),
         "aliases": aliases,
         "is_aliased": is_aliased,
-        "error_responses_models": get_error_models(parser),
+        "error_responses_models": error_models,
+        "compact_models": get_compact_models(parser, graph, error_models),
+        "constrained_str_types": getattr(parser.data_type_manager, "constrained_str_types", dict()),
+        "regex_engine": "python-re" if getattr(parser.data_type_manager, "python_regex_required", False) else "rust-regex",
     }
 
 
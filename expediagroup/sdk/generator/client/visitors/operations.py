@@ -14,6 +14,7 @@
 import collections
 import re
 import typing
+from collections.abc import Iterable
 from pathlib import Path
 
 from datamodel_code_generator.model import DataModel
@@ -59,33 +60,26 @@ class ModelUtils:
         Returns:
             list[DataModel]
         """
-        models: list[DataModel] = list(set(filter(ModelUtils.is_non_schema_model, parser.results)))
+        # Duplicates are dropped keeping the order of the results, so that the output does not depend on hashing.
+        models: list[DataModel] = list(dict.fromkeys(filter(ModelUtils.is_non_schema_model, parser.results)))
 
-        models_classnames = [model.class_name for model in models]
-        for index in range(len(models) - 1, -1, -1):
-            model = models[index]
-            if model.class_name[-1].isdigit() or f"{model.class_name}1" in models_classnames:
-                continue
-            models.pop(index)
-            index += 1
-
-        return models
+        models_classnames: set[str] = {model.class_name for model in models}
+        return [model for model in models if model.class_name[-1].isdigit() or f"{model.class_name}1" in models_classnames]
 
     @staticmethod
-    def clean_unused_models(parser: OpenAPIParser, unused_models_classnames: list[str]):
-        r"""Removes unused models from parser results.
+    def clean_unused_models(parser: OpenAPIParser, unused_models_classnames: Iterable[str]):
+        r"""Removes unused models from parser results, in a single pass.
 
         Args:
             parser(OpenAPIParser): The parser holding results.
-            unused_models_classnames(list[str]): A list of models class names which are to be removed.
+            unused_models_classnames(Iterable[str]): Class names of the models which are to be removed.
         """
-        indices_stack = list()
-        for index, result in enumerate(parser.results):
-            if isinstance(result, DataModel) and result.class_name in unused_models_classnames:
-                indices_stack.append(index)
+        unused: set[str] = set(unused_models_classnames)
+        if not unused:
+            return
 
-        while len(indices_stack):
-            parser.results.pop(indices_stack.pop())
+        # The results list is updated in place, other references to it see the removal.
+        parser.results[:] = [result for result in parser.results if not (isinstance(result, DataModel) and result.class_name in unused)]
 
     @staticmethod
     def update_classname_by_operation_id(operation_id: str, classname: str) -> str:
@@ -145,32 +139,41 @@ class OperationParamUtils:
     """
 
     @staticmethod
-    def clean_non_schema_parameter_models(operations: list[Operation], non_schema_models: list[DataModel], models_classnames_to_update: dict[str, str]):
-        r"""For each operation's set of params, replaces a param's type-hint using `update_classname_by_operation_id`, removes any uneeded header,
-        and rebuilds the value of `operation.snake_case_arguments`.
+    def clean_non_schema_parameter_models(
+        operations: list[Operation], non_schema_models: list[DataModel], models_classnames_to_update: dict[str, str], body_models: dict[str, str]
+    ):
+        r"""For each operation's set of params, replaces a param's type-hint using `update_classname_by_operation_id`, lets the body be a
+        `PreparedBody` or a raw body, removes any uneeded header, and rebuilds the value of `operation.snake_case_arguments`.
 
         Args:
             operations(list[Operation]): List of operations to be processed.
             non_schema_models(list[DataModel]): List of non-schema models to be replaced for each operation's param type-hint.
             models_classnames_to_update(dict[str, DataModel]): An empty dictionary to be filled with old classnames as keys, and new classnames as values.
+            body_models(dict[str, str]): An empty dictionary to be filled with the body model of each operation, keyed by function name.
 
         Returns:
              list[Operation]
         """
+        # `DataModel.class_name` is computed on every access, classnames are read once and kept in sync with renames.
+        classnames: list[str] = [model.class_name for model in non_schema_models]
         for operation_index, operation in enumerate(operations):
             for arg_index, arg in enumerate(operation.snake_case_arguments_list):
                 if arg.name == "body":
+                    # Bodies may also be serialized straight from plain data, see `PydanticModel.prepare`, or passed through raw.
+                    body_models[operation.function_name] = arg.type_hint
+                    operations[operation_index].snake_case_arguments_list[arg_index].type_hint = f"Union[{arg.type_hint}, PreparedBody, RawBody]"
                     continue
 
-                for model_index, model in enumerate(non_schema_models):
+                for model_index, classname in enumerate(classnames):
                     # TODO: Do processing using a `DataType`` object instead of `type_hint`
-                    if model.class_name in arg.type_hint:
-                        new_classname = ModelUtils.update_classname_by_operation_id(operation.operationId, model.class_name)
-                        models_classnames_to_update[model.class_name] = new_classname
+                    if classname in arg.type_hint:
+                        new_classname = ModelUtils.update_classname_by_operation_id(operation.operationId, classname)
+                        models_classnames_to_update[classname] = new_classname
 
-                        operations[operation_index].snake_case_arguments_list[arg_index].type_hint = arg.type_hint.replace(model.class_name, new_classname)
+                        operations[operation_index].snake_case_arguments_list[arg_index].type_hint = arg.type_hint.replace(classname, new_classname)
 
                         non_schema_models[model_index].class_name = new_classname
+                        classnames[model_index] = new_classname
                         break
 
             operations[operation_index].snake_case_arguments_list = OperationParamUtils.clean_unwanted_headers(
@@ -217,15 +220,16 @@ def post_process_operations(parser: OpenAPIParser):
         parser(OpenAPIParser): The parser holding results.
 
     Returns:
-        list[Operation]
+        tuple[list[Operation], dict[str, str]]: The operations, and the body model of each operation keyed by function name.
     """
     models = {model.class_name: model for model in parser.results if isinstance(model, DataModel)}
 
     non_schema_models = sorted(ModelUtils.parse_non_schema_models(parser), key=lambda m: len(m.class_name), reverse=True)
     models_classnames_to_update: dict[str, str] = collections.defaultdict(lambda: None)
+    body_models: dict[str, str] = dict()
 
     sorted_operations = OperationParamUtils.clean_non_schema_parameter_models(
-        ModelUtils.clean_root_models_from_operations_return_type(parser, models), non_schema_models, models_classnames_to_update
+        ModelUtils.clean_root_models_from_operations_return_type(parser, models), non_schema_models, models_classnames_to_update, body_models
     )
 
     OperationParamUtils.update_non_schema_models_names(parser, models_classnames_to_update)
@@ -234,15 +238,16 @@ def post_process_operations(parser: OpenAPIParser):
 
     ModelUtils.clean_unused_models(
         parser,
-        [model.class_name for model in non_schema_models if model.class_name not in models_classnames_to_update.keys() and model.class_name[-1].isdigit()],
+        {model.class_name for model in non_schema_models if model.class_name not in models_classnames_to_update and model.class_name[-1].isdigit()},
     )
 
-    return sorted_operations
+    return sorted_operations, body_models
 
 
 def get_operations(parser: OpenAPIParser, model_path: Path) -> dict[str, object]:
     r"""A visitor to expose operations to Jinja2 templates."""
-    return {"operations": post_process_operations(parser)}
+    operations, body_models = post_process_operations(parser)
+    return {"operations": operations, "body_models": body_models}
 
 
 order: int = 1
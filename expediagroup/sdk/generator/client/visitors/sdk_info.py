@@ -15,7 +15,9 @@
 
 import configparser
 import re
+from collections.abc import Mapping
 from pathlib import Path
+from typing import Optional
 
 from fastapi_code_generator.parser import OpenAPIParser
 from fastapi_code_generator.visitor import Visitor
@@ -23,16 +25,19 @@ from fastapi_code_generator.visitor import Visitor
 
 # expediagroup: new visitor.
 def get_sdk(parser: OpenAPIParser, model_path: Path) -> dict[str, object]:
-    config = configparser.ConfigParser()
-    config.read(f"{Path(__file__).parent}/sdk.config")
+    sdk_config: Optional[Mapping[str, str]] = getattr(parser, "sdk_config", None)
+    if not sdk_config:
+        config = configparser.ConfigParser()
+        config.read(f"{Path(__file__).parent}/sdk.config")
+        sdk_config = config["sdk"]
 
-    classname = "".join(list(map(lambda s: s[0].upper() + s[1::] if len(s) > 1 else s[0].upper(), re.findall(r"[a-zA-Z0-9]+", config["sdk"]["namespace"]))))
+    classname = "".join(list(map(lambda s: s[0].upper() + s[1::] if len(s) > 1 else s[0].upper(), re.findall(r"[a-zA-Z0-9]+", sdk_config["namespace"]))))
 
     api = "".join([" " + classname[index] if index and classname[index].isupper() else classname[index] for index in range(len(classname))])
 
     namespace = classname.lower()
 
-    version = config["sdk"]["version"]
+    version = sdk_config["version"]
 
     id = f"expediagroup-{namespace}-sdk"
 
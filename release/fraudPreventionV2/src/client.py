@@ -26,7 +26,12 @@ from expediagroup.sdk.core.client.expediagroup_auth_client import (
 )
 from expediagroup.sdk.core.configuration.client_config import ClientConfig
 from expediagroup.sdk.core.constant import header
-from expediagroup.sdk.core.model.api import RequestHeaders
+from expediagroup.sdk.core.model.api import (
+    PreparedBody,
+    RawBody,
+    RawResponse,
+    RequestHeaders,
+)
 
 from .model import (
     AccountScreenRequest,
@@ -87,9 +92,7 @@ class FraudPreventionV2Client:
 
         self.__user_agent = f"{sdk_metadata} (Python {python_version}; {os_name} {os_version})"
 
-    def screen_account(
-        self, body: AccountScreenRequest = None
-    ) -> Union[
+    def screen_account(self, body: Union[AccountScreenRequest, PreparedBody, RawBody] = None, raw_response: bool = False) -> Union[
         AccountScreenResponse,
         AccountTakeoverBadRequestError,
         AccountTakeoverUnauthorizedError,
@@ -100,13 +103,15 @@ class FraudPreventionV2Client:
         BadGatewayError,
         ServiceUnavailableError,
         GatewayTimeoutError,
+        RawResponse,
     ]:
         r"""
         The Account Screen API gives a Fraud recommendation for an account transaction.
 
         A recommendation can be ACCEPT, CHALLENGE, or REJECT. A transaction is marked as CHALLENGE whenever there are insufficient signals to recommend ACCEPT or REJECT. These CHALLENGE incidents are manually reviewed, and a corrected recommendation is made asynchronously.
         Args:
-           body(AccountScreenRequest): ...
+           body(Union[AccountScreenRequest, PreparedBody, RawBody]): ...
+           raw_response(bool, optional): Whether to return a successful response as a `RawResponse`, decoded on demand only.
 
         """
         headers = RequestHeaders(
@@ -154,11 +159,13 @@ class FraudPreventionV2Client:
             ],
             url=request_url,
             error_responses=error_responses,
+            operation="screen_account",
+            body_model=AccountScreenRequest,
+            raw_response=raw_response,
+            safe_to_duplicate=True,
         )
 
-    def notify_with_account_update(
-        self, body: AccountUpdateRequest = None
-    ) -> Union[
+    def notify_with_account_update(self, body: Union[AccountUpdateRequest, PreparedBody, RawBody] = None, raw_response: bool = False) -> Union[
         AccountUpdateResponse,
         AccountTakeoverBadRequestError,
         AccountTakeoverUnauthorizedError,
@@ -169,6 +176,7 @@ class FraudPreventionV2Client:
         BadGatewayError,
         ServiceUnavailableError,
         GatewayTimeoutError,
+        RawResponse,
     ]:
         r"""
         The Account Update API is called when there is an account lifecycle transition
@@ -177,7 +185,8 @@ class FraudPreventionV2Client:
 
         For example, if a user's account is disabled, deleted, or restored, the Account Update API is called to notify Expedia Group about the change. The Account Update API is also called when a user responds to a login Multi-Factor Authentication based on a Fraud recommendation.
         Args:
-           body(AccountUpdateRequest): An AccountUpdate request may be of one of the following types `MULTI_FACTOR_AUTHENTICATION_UPDATE`, `REMEDIATION_UPDATE`.
+           body(Union[AccountUpdateRequest, PreparedBody, RawBody]): An AccountUpdate request may be of one of the following types `MULTI_FACTOR_AUTHENTICATION_UPDATE`, `REMEDIATION_UPDATE`.
+           raw_response(bool, optional): Whether to return a successful response as a `RawResponse`, decoded on demand only.
 
         """
         headers = RequestHeaders(
@@ -225,11 +234,12 @@ class FraudPreventionV2Client:
             ],
             url=request_url,
             error_responses=error_responses,
+            operation="notify_with_account_update",
+            body_model=AccountUpdateRequest,
+            raw_response=raw_response,
         )
 
-    def screen_order(
-        self, body: OrderPurchaseScreenRequest = None
-    ) -> Union[
+    def screen_order(self, body: Union[OrderPurchaseScreenRequest, PreparedBody, RawBody] = None, raw_response: bool = False) -> Union[
         OrderPurchaseScreenResponse,
         BadRequestError,
         UnauthorizedError,
@@ -240,13 +250,15 @@ class FraudPreventionV2Client:
         BadGatewayError,
         RetryableOrderPurchaseScreenFailure,
         GatewayTimeoutError,
+        RawResponse,
     ]:
         r"""
         The Order Purchase API gives a Fraud recommendation for a transaction.
 
         A recommendation can be Accept, Reject, or Review. A transaction is marked as Review whenever there are insufficient signals to recommend Accept or Reject. These incidents are manually reviewed, and a corrected recommendation is made asynchronously.
         Args:
-           body(OrderPurchaseScreenRequest): ...
+           body(Union[OrderPurchaseScreenRequest, PreparedBody, RawBody]): ...
+           raw_response(bool, optional): Whether to return a successful response as a `RawResponse`, decoded on demand only.
 
         """
         headers = RequestHeaders(
@@ -294,11 +306,12 @@ class FraudPreventionV2Client:
             ],
             url=request_url,
             error_responses=error_responses,
+            operation="screen_order",
+            body_model=OrderPurchaseScreenRequest,
+            raw_response=raw_response,
         )
 
-    def notify_with_order_update(
-        self, body: OrderPurchaseUpdateRequest = None
-    ) -> Union[
+    def notify_with_order_update(self, body: Union[OrderPurchaseUpdateRequest, PreparedBody, RawBody] = None, raw_response: bool = False) -> Union[
         OrderPurchaseUpdateResponse,
         BadRequestError,
         UnauthorizedError,
@@ -309,6 +322,7 @@ class FraudPreventionV2Client:
         BadGatewayError,
         RetryableOrderPurchaseUpdateFailure,
         GatewayTimeoutError,
+        RawResponse,
     ]:
         r"""
         The Order Purchase Update API is called when the status of the order has
@@ -319,7 +333,8 @@ class FraudPreventionV2Client:
         The Order Purchase Update API is also called when the merchant cancels or changes an order based on a Fraud recommendation.
 
         Args:
-           body(OrderPurchaseUpdateRequest): An OrderPurchaseUpdate request may be of one of the following types `ORDER_UPDATE`, `CHARGEBACK_FEEDBACK`, `INSULT_FEEDBACK`, `REFUND_UPDATE`, `PAYMENT_UPDATE`.
+           body(Union[OrderPurchaseUpdateRequest, PreparedBody, RawBody]): An OrderPurchaseUpdate request may be of one of the following types `ORDER_UPDATE`, `CHARGEBACK_FEEDBACK`, `INSULT_FEEDBACK`, `REFUND_UPDATE`, `PAYMENT_UPDATE`.
+           raw_response(bool, optional): Whether to return a successful response as a `RawResponse`, decoded on demand only.
 
         """
         headers = RequestHeaders(
@@ -367,4 +382,7 @@ class FraudPreventionV2Client:
             ],
             url=request_url,
             error_responses=error_responses,
+            operation="notify_with_order_update",
+            body_model=OrderPurchaseUpdateRequest,
+            raw_response=raw_response,
         )
@@ -16,39 +16,67 @@ from __future__ import annotations
 
 from datetime import datetime
 from enum import Enum
-from typing import Any, Literal, Optional, Union
+from typing import Annotated, Any, ClassVar, Literal, Optional, Union
 
 from pydantic import (
     BaseModel,
     ConfigDict,
     EmailStr,
     Field,
-    SecretBytes,
-    SecretStr,
+    StringConstraints,
     confloat,
     conint,
-    constr,
-    field_validator,
 )
 from pydantic.dataclasses import dataclass
 
+from expediagroup.sdk.core.model.api import PreparedBody
 from expediagroup.sdk.core.model.exception.service import ExpediaGroupApiException
 
-SecretStr.__str__ = lambda self: "<-- omitted -->" if self.get_secret_value() else ""
-
 
 class PydanticModel(BaseModel):
     r"""Generic model that is a parent to all pydantic models, holds models
     configuration.
     """
 
-    model_config: dict[str, Any] = ConfigDict(
-        extra="forbid",
-        json_encoders={
-            SecretStr: lambda v: v.get_secret_value() if v else None,
-            SecretBytes: lambda v: v.get_secret_value() if v else None,
-        },
-    )
+    model_config: dict[str, Any] = ConfigDict(extra="forbid")
+
+    @classmethod
+    def prepare(cls, data: Any, validate: bool = False) -> PreparedBody:
+        r"""
+        Serializes already validated data, a mapping or a dataclass, to a request body
+        of this model without building the model.
+
+        Args:
+            data(Any): The wire representation of the model, nested objects included.
+            validate(bool): Whether to validate the data against the model first.
+
+        """
+        return PreparedBody.of(cls, data, validate)
+
+
+StrMax200 = Annotated[str, StringConstraints(max_length=200)]
+StrPattern1 = Annotated[str, StringConstraints(pattern=r"^[A-Z]{3}$")]
+StrMax50 = Annotated[str, StringConstraints(max_length=50)]
+StrPattern2 = Annotated[
+    str,
+    StringConstraints(
+        pattern=r"^(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$|^(?:[A-F0-9]{1,4}:){7}[A-F0-9]{1,4}$"
+    ),
+]
+StrMin3Max3Pattern1 = Annotated[str, StringConstraints(min_length=3, max_length=3, pattern=r"^[A-Z]{3}$")]
+StrMax100 = Annotated[str, StringConstraints(max_length=100)]
+StrPattern3 = Annotated[str, StringConstraints(pattern=r"^[A-Z]{2}$")]
+StrMax20 = Annotated[str, StringConstraints(max_length=20)]
+StrMax30 = Annotated[str, StringConstraints(max_length=30)]
+StrMax10 = Annotated[str, StringConstraints(max_length=10)]
+StrMax16Pattern4 = Annotated[str, StringConstraints(max_length=16, pattern=r"^[0-9A-Za-z]{4,16}$")]
+StrMax8Pattern5 = Annotated[str, StringConstraints(max_length=8, pattern=r"^[0-9]{4,8}$")]
+StrMax15 = Annotated[str, StringConstraints(max_length=15)]
+StrMax3Pattern6 = Annotated[str, StringConstraints(max_length=3, pattern=r"^[0-9]{1,3}$")]
+StrMax20Pattern7 = Annotated[str, StringConstraints(max_length=20, pattern=r"^[0-9]{1,20}$")]
+StrMax50Pattern8 = Annotated[str, StringConstraints(max_length=50, pattern=r"^[0-9]{1,50}$")]
+StrMax3Pattern1 = Annotated[str, StringConstraints(max_length=3, pattern=r"^[A-Z]{3}$")]
+StrPattern9 = Annotated[str, StringConstraints(pattern=r"^([a-z]{2}-[A-Z]{2})$")]
 
 
 class Code(
@@ -168,18 +196,18 @@ class CancellationReason(
 ):
     r"""pydantic model CancellationReason: Reason of order update cancellation."""
 
-    primary_reason_code: Optional[constr(max_length=200)] = None
+    primary_reason_code: Optional[StrMax200] = None
     """Primary cancellation reason code."""
-    sub_reason_code: Optional[constr(max_length=200)] = None
+    sub_reason_code: Optional[StrMax200] = None
     """Substitute cancellation reason code."""
-    primary_reason_description: Optional[constr(max_length=200)] = None
+    primary_reason_description: Optional[StrMax200] = None
     """
     Primary cancellation reason code.
 
     Required if `order_status = CANCELLED`.
 
     """
-    sub_reason_description: Optional[constr(max_length=200)] = None
+    sub_reason_description: Optional[StrMax200] = None
     """Substitute cancellation reason description."""
 
 
@@ -257,7 +285,7 @@ class OrderPurchaseUpdateResponse(
 ):
     r"""Pydantic model OrderPurchaseUpdateResponse."""
 
-    risk_id: Optional[constr(max_length=200)] = Field(None, example="1234567")
+    risk_id: Optional[StrMax200] = Field(None, example="1234567")
     """Unique identifier of transaction that was updated."""
 
 
@@ -276,7 +304,7 @@ class SiteInfo(
 ):
     r"""Pydantic model SiteInfo."""
 
-    country_code: constr(pattern=r"^[A-Z]{3}$") = Field(..., example="USA")
+    country_code: StrPattern1 = Field(..., example="USA")
     """The alpha-3 ISO code that represents a country name."""
     agent_assisted: bool = None
     """
@@ -292,7 +320,7 @@ class DeviceDetails(
 ):
     r"""Pydantic model DeviceDetails."""
 
-    source: Optional[constr(max_length=50)] = None
+    source: Optional[StrMax50] = None
     """
     Source of the device_box.
 
@@ -301,9 +329,7 @@ class DeviceDetails(
     """
     device_box: Optional[str] = None
     """Device related information retrieved from TrustWidget."""
-    ip_address: constr(
-        pattern=r"^(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$|^(?:[A-F0-9]{1,4}:){7}[A-F0-9]{1,4}$"
-    ) = Field(..., example="192.168.32.48")
+    ip_address: StrPattern2 = Field(..., example="192.168.32.48")
     """IP address of the device used for booking."""
 
 
@@ -365,17 +391,17 @@ class Address(
     r"""Pydantic model Address."""
 
     address_type: Optional[AddressType] = None
-    address_line1: Optional[constr(max_length=200)] = None
+    address_line1: Optional[StrMax200] = None
     """Address line 1 of the address provided."""
-    address_line2: Optional[constr(max_length=200)] = None
+    address_line2: Optional[StrMax200] = None
     """Address line 2 of the address provided."""
-    city: Optional[constr(max_length=200)] = None
+    city: Optional[StrMax200] = None
     """City of the address provided."""
-    state: Optional[constr(pattern=r"^[A-Z]{2}$")] = None
+    state: Optional[StrPattern3] = None
     """The two-characters ISO code for the state or province of the address."""
-    zip_code: Optional[constr(max_length=20)] = None
+    zip_code: Optional[StrMax20] = None
     """Zip code of the address provided."""
-    country_code: Optional[constr(pattern=r"^[A-Z]{3}$")] = None
+    country_code: Optional[StrPattern1] = None
     """ISO alpha-3 country code of the address provided."""
 
 
@@ -435,7 +461,7 @@ class OperatingCompany(
 ):
     r"""pydantic model OperatingCompany: This attribute captures the name or identifier of the company responsible for operating the Rail product. It represents the specific operating entity, such as Amtrak, British Railways, or a bus company."""
 
-    marketing_name: Optional[constr(max_length=200)] = None
+    marketing_name: Optional[StrMax200] = None
     """
     The name used by the transportation carrier for marketing purposes in the travel
     segment.
@@ -459,7 +485,7 @@ class RailwayStationDetails(
 ):
     r"""Pydantic model RailwayStationDetails."""
 
-    name: constr(max_length=200) = Field(..., example="Grand Central Terminal")
+    name: StrMax200 = Field(..., example="Grand Central Terminal")
     """The popularly known name or title by which the railway station is identified."""
     type: Optional[Type] = Field(None, example="STATION")
     """
@@ -470,13 +496,13 @@ class RailwayStationDetails(
     (STATION) or stations located within a city (city).
 
     """
-    station_code: constr(max_length=200) = Field(..., example="GCT")
+    station_code: StrMax200 = Field(..., example="GCT")
     """The unique identifier or code assigned to an individual rail station or a pseudo-
     station representing all the stations within a specific city, from which rail travel
     originates.
     """
     address: Address = None
-    timezone: Optional[constr(max_length=200)] = Field(None, example="America/New_York")
+    timezone: Optional[StrMax200] = Field(None, example="America/New_York")
     """The timezone associated with the location of the station, specifying the local
     time offset from Coordinated Universal Time (UTC).
     """
@@ -521,7 +547,7 @@ class SupplyProvider(
 ):
     r"""Pydantic model SupplyProvider."""
 
-    name: constr(max_length=200) = Field(..., example="VIATOR")
+    name: StrMax200 = Field(..., example="VIATOR")
     """This field provides name of the partner involved in offering the activity."""
     type: Type1 = None
     """
@@ -532,7 +558,7 @@ class SupplyProvider(
     * `DIRECT`: This value signifies that the partner is a direct entity or provider associated with the organization or platform offering the activity.
 
     """
-    vendor_name: Optional[constr(max_length=200)] = Field(None, example="SuperShuttle")
+    vendor_name: Optional[StrMax200] = Field(None, example="SuperShuttle")
     """This field describes the name of the third-party vendor who provided the supply
     provider or the operating company with the activity.
     """
@@ -572,7 +598,7 @@ class DelayedFulfillment(
     """This field indicates if the fulfillment of an activity is possible or not."""
     hold_duration_value: Optional[float] = Field(None, example=40)
     """This field indicates the duration of the hold on an activity."""
-    hold_duration_unit_of_measure: Optional[constr(max_length=100)] = Field(None, example="minutes")
+    hold_duration_unit_of_measure: Optional[StrMax100] = Field(None, example="minutes")
     """This field indicates the unit of duration of the hold on an activity."""
     is_delayed_customer_confirmation: Optional[bool] = None
     """
@@ -600,11 +626,11 @@ class AirSegment(
 ):
     r"""Pydantic model AirSegment."""
 
-    airline_code: constr(max_length=10) = None
+    airline_code: StrMax10 = None
     """Airline code of the trip segment."""
-    departure_airport_code: constr(max_length=10) = None
+    departure_airport_code: StrMax10 = None
     """Departure airport of the trip segment."""
-    arrival_airport_code: constr(max_length=10) = None
+    arrival_airport_code: StrMax10 = None
     """Arrival airport of the trip segment."""
     departure_time: Optional[datetime] = None
     """Local date and time of departure from departure location, in ISO-8601 date and
@@ -764,7 +790,7 @@ class PaymentThreeDSCriteria(
     """This is a flag passed that indicates that this transaction could potentially go
     through 3DS.
     """
-    transaction_model: Optional[constr(max_length=200)] = None
+    transaction_model: Optional[StrMax200] = None
     """Model used to process payment transaction."""
 
 
@@ -904,15 +930,15 @@ class Name(
 ):
     r"""pydantic model Name: Group of attributes intended to hold information about a customer or traveler's name for the order."""
 
-    last_name: constr(max_length=200) = None
+    last_name: StrMax200 = None
     """Surname, or last name, of the person."""
-    first_name: constr(max_length=200) = None
+    first_name: StrMax200 = None
     """Given, or first name, of the person."""
-    middle_name: Optional[constr(max_length=200)] = None
+    middle_name: Optional[StrMax200] = None
     """Middle name of the person."""
-    title: Optional[constr(max_length=200)] = None
+    title: Optional[StrMax200] = None
     """Title of the person for name (e.g. Mr., Ms. etc)."""
-    suffix: Optional[constr(max_length=50)] = None
+    suffix: Optional[StrMax50] = None
     """Generational designations (e.g. Sr, Jr, III) or values that indicate the
     individual holds a position, educational degree, accreditation, office, or honor
     (e.g. PhD, CCNA, OBE).
@@ -959,7 +985,7 @@ class Amount(
     """The amount required in payment for the product/order in local currency (including
     any taxes and fees).
     """
-    currency_code: constr(max_length=3, pattern=r"^[A-Z]{3}$") = None
+    currency_code: StrMax3Pattern1 = None
     """The ISO  alpha-3 country code for the amount currency."""
 
 
@@ -1072,7 +1098,7 @@ class AccountUpdateRequestGeneric(
 
     type: Type3 = None
     """The categorized type of account update event from the Partner's system."""
-    risk_id: constr(max_length=200) = Field(..., example="123456789")
+    risk_id: StrMax200 = Field(..., example="123456789")
     """The `risk_id` provided by Expedia's Fraud Prevention Service in the
     `AccountScreenResponse`.
     """
@@ -1166,7 +1192,7 @@ class AccountUpdateResponse(
 ):
     r"""Pydantic model AccountUpdateResponse."""
 
-    risk_id: Optional[constr(max_length=200)] = Field(None, example="1234567")
+    risk_id: Optional[StrMax200] = Field(None, example="1234567")
     """Unique identifier of transaction that was updated."""
 
 
@@ -1203,14 +1229,14 @@ class AccountTakeoverSiteInfo(
 ):
     r"""pydantic model AccountTakeoverSiteInfo: Information specific to the Partner's website through which a transaction was made."""
 
-    locale: Optional[constr(pattern=r"^([a-z]{2}-[A-Z]{2})$")] = Field(None, example="en-US")
+    locale: Optional[StrPattern9] = Field(None, example="en-US")
     """The locale of the website a user is accessing, which is separate from the user
     configured browser locale, in ISO 639-2 language code format and in ISO 3166-1
     country code format.
     """
-    name: Optional[constr(max_length=200)] = Field(None, example="expedia.com")
+    name: Optional[StrMax200] = Field(None, example="expedia.com")
     """Name of the website from which the event is generated."""
-    brand_name: constr(max_length=200) = None
+    brand_name: StrMax200 = None
     """The trademark brand name that is displayed to a user on the website."""
     placement_name: Optional[PlacementName] = None
     """
@@ -1246,7 +1272,7 @@ class AccountTakeoverDeviceDetails(
 ):
     r"""pydantic model AccountTakeoverDeviceDetails: Information specific to the Partner's device through which a transaction was made."""
 
-    source: Optional[constr(max_length=50)] = None
+    source: Optional[StrMax50] = None
     """
     Source of the device_box.
 
@@ -1255,9 +1281,7 @@ class AccountTakeoverDeviceDetails(
     """
     device_box: str = None
     """Device related information retrieved from TrustWidget."""
-    ip_address: constr(
-        pattern=r"^(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$|^(?:[A-F0-9]{1,4}:){7}[A-F0-9]{1,4}$"
-    ) = Field(..., example="192.168.32.48")
+    ip_address: StrPattern2 = Field(..., example="192.168.32.48")
     """IP address of the device used for this event."""
     user_agent: str = Field(..., example="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/114.0.0.0 Safari/537.36")
     """The application type, operating system, software vendor, or software version of
@@ -1309,15 +1333,15 @@ class AccountTakeoverName(
 ):
     r"""pydantic model AccountTakeoverName: Group of attributes intended to hold information about a customer or traveler''s name for the account."""
 
-    last_name: constr(max_length=200) = None
+    last_name: StrMax200 = None
     """Surname, or last name, of the person."""
-    first_name: constr(max_length=200) = None
+    first_name: StrMax200 = None
     """Given, or first name, of the person."""
-    middle_name: Optional[constr(max_length=200)] = None
+    middle_name: Optional[StrMax200] = None
     """Middle name of the person."""
-    title: Optional[constr(max_length=200)] = None
+    title: Optional[StrMax200] = None
     """Title of the person for name (e.g. Mr., Ms. etc)."""
-    suffix: Optional[constr(max_length=50)] = None
+    suffix: Optional[StrMax50] = None
     """Generational designations (e.g. Sr, Jr, III) or values indicate that the
     individual holds a position, educational degree, accreditation, office, or honor
     (e.g. PhD, CCNA, OBE).
@@ -1519,7 +1543,7 @@ class OrderPurchaseUpdateRequestGeneric(
     """
 
     type: UpdateType = None
-    risk_id: constr(max_length=200) = Field(..., example="123456789")
+    risk_id: StrMax200 = Field(..., example="123456789")
     """The `risk_id` provided by Expedia's Fraud Prevention Service in the
     `OrderPurchaseScreenResponse`.
     """
@@ -1531,7 +1555,7 @@ class OrderUpdate(
     r"""pydantic model OrderUpdate: Order related data that should be updated."""
 
     order_status: Status = None
-    acquirer_reference_number: Optional[constr(max_length=200)] = None
+    acquirer_reference_number: Optional[StrMax200] = None
     """
     A unique number that tags a credit or debit card transaction when it goes from the
     merchant's bank through to the cardholder's bank.
@@ -1593,7 +1617,7 @@ class SettledRefundUpdateDetails(
     """
     refund_deposit_date_time: datetime = None
     """Date and time when the refund was deposited to the original form of payment."""
-    acquirer_reference_number: constr(max_length=200) = None
+    acquirer_reference_number: StrMax200 = None
     """
     A unique number that tags a credit or debit card transaction when it goes from the
     merchant's bank through to the cardholder's bank.
@@ -1602,7 +1626,7 @@ class SettledRefundUpdateDetails(
     is used when dealing with disputes/chargebacks on original transactions.
 
     """
-    settlement_id: constr(max_length=200) = None
+    settlement_id: StrMax200 = None
     """Unique settlement identifier specific to the payment processor for the settlement
     transaction generated for a previously submitted payment refund.
     """
@@ -1614,7 +1638,7 @@ class PaymentUpdate(
 ):
     r"""pydantic model PaymentUpdate: Payment related data that should be updated."""
 
-    merchant_order_code: constr(max_length=200) = None
+    merchant_order_code: StrMax200 = None
     """
     Reference code passed to acquiring bank at the time of payment.
 
@@ -1640,7 +1664,7 @@ class ChargebackDetail(
     chargeback_reason: ChargebackReason = None
     """Reason for chargeback which can be `Fraud` or `Non Fraud`."""
     chargeback_amount: Amount = None
-    bank_reason_code: Optional[constr(max_length=200)] = None
+    bank_reason_code: Optional[StrMax200] = None
     """Unique code provided by the acquiring bank for the category of fraud."""
     chargeback_reported_date_time: Optional[datetime] = None
     """Date and time when the chargeback was reported to the partner, in ISO-8601 date
@@ -1653,7 +1677,7 @@ class OrderPurchaseScreenResponse(
 ):
     r"""Pydantic model OrderPurchaseScreenResponse."""
 
-    risk_id: Optional[constr(max_length=200)] = Field(None, example="1234567")
+    risk_id: Optional[StrMax200] = Field(None, example="1234567")
     """Unique identifier assigned to the transaction by Expedia's Fraud Prevention
     Service.
     """
@@ -1676,7 +1700,7 @@ class TravelProductGeneric(
 
     price: Amount = None
     type: TravelProductType = None
-    inventory_type: constr(max_length=30) = None
+    inventory_type: StrMax30 = None
     """
     Type of inventory. Ensure attributes mentioned in dictionary below are set to
     corresponding values only.
@@ -1702,7 +1726,7 @@ class TravelProductGeneric(
     * `AGENCY` is used when this order is through an agency booking.
 
     """
-    travelers_references: Optional[list[constr(max_length=50)]] = Field(None, maxItems=40, minItems=1)
+    travelers_references: Optional[list[StrMax50]] = Field(None, maxItems=40, minItems=1)
     """
     List of travelerGuids who are part of the traveling party on the order for the
     product. Information for each product and its required travelers should be provided
@@ -1821,9 +1845,9 @@ class Air(
     """Additional airline and flight details for each of the trip segments."""
     flight_type: Optional[FlightType] = None
     """Identifies the type of air trip based on the air destinations."""
-    passenger_name_record: Optional[constr(max_length=100)] = None
+    passenger_name_record: Optional[StrMax100] = None
     """Airline booking confirmation code for the trip."""
-    global_distribution_system_type: Optional[constr(max_length=100)] = None
+    global_distribution_system_type: Optional[StrMax100] = None
     """Associated with Passenger Name Record (PNR)."""
     type: Literal["AIR"] = "AIR"
 
@@ -1841,11 +1865,11 @@ class Cruise(
     """Local date and time of arrival from original arrival location, in ISO-8601 date
     and time format `yyyy-MM-ddTHH:mm:ss.SSSZ`.
     """
-    embarkation_port: constr(max_length=200) = None
+    embarkation_port: StrMax200 = None
     """Location from where cruise will depart."""
-    disembarkation_port: constr(max_length=200) = None
+    disembarkation_port: StrMax200 = None
     """The cruise's final destination."""
-    ship_name: constr(max_length=200) = None
+    ship_name: StrMax200 = None
     """Name of the cruise ship."""
     type: Literal["CRUISE"] = "CRUISE"
 
@@ -1855,9 +1879,9 @@ class Car(
 ):
     r"""Pydantic model Car."""
 
-    pick_up_location: constr(max_length=200) = None
+    pick_up_location: StrMax200 = None
     """Location where the automobile will be picked up."""
-    drop_off_location: constr(max_length=200) = None
+    drop_off_location: StrMax200 = None
     """Location at which the automobile will be returned."""
     pickup_time: datetime = None
     """Local date and time the automobile will be picked-up, in ISO-8601 date and time
@@ -1875,13 +1899,13 @@ class Hotel(
 ):
     r"""Pydantic model Hotel."""
 
-    hotel_id: constr(max_length=200) = Field(..., example="8883333999221")
+    hotel_id: StrMax200 = Field(..., example="8883333999221")
     """Unique hotel identifier assigned by the partner."""
     price_withheld: Optional[bool] = None
     """Identifies if the product price was withheld from the customer during the booking
     process.
     """
-    hotel_name: constr(max_length=200) = Field(..., example="Hotel Expedia")
+    hotel_name: StrMax200 = Field(..., example="Hotel Expedia")
     """Name of the hotel."""
     room_count: Optional[int] = None
     """Total number of rooms booked within the hotel product collection."""
@@ -1903,9 +1927,9 @@ class PaymentOutcome(
     r"""Pydantic model PaymentOutcome."""
 
     status: Optional[PaymentStatus] = None
-    code: Optional[constr(max_length=200)] = None
+    code: Optional[StrMax200] = None
     """A mnemonic code for the payment processing."""
-    description: Optional[constr(max_length=200)] = None
+    description: Optional[StrMax200] = None
     """A short description providing additional explanation regarding the mnemonic
     code.
     """
@@ -1926,7 +1950,7 @@ class Telephone(
 
     type: Optional[TelephoneType] = None
     platform_type: Optional[TelephonePlatformType] = None
-    country_access_code: constr(max_length=3, pattern=r"^[0-9]{1,3}$") = Field(..., example="1")
+    country_access_code: StrMax3Pattern6 = Field(..., example="1")
     """
     Numeric digit between 1 to 3 characters used to represent the country code for
     international dialing.
@@ -1934,11 +1958,11 @@ class Telephone(
     Does not include symbols, spaces, or leading zeros.
 
     """
-    area_code: constr(max_length=20, pattern=r"^[0-9]{1,20}$") = Field(..., example="1")
+    area_code: StrMax20Pattern7 = Field(..., example="1")
     """
     A number prefixed to an individual telephone number: used in making long-distance calls.  Does not include symbols, spaces, or leading zeros.
     """
-    phone_number: constr(max_length=50, pattern=r"^[0-9]{1,50}$") = Field(..., example="1234567")
+    phone_number: StrMax50Pattern8 = Field(..., example="1234567")
     """
     A number that is dialed on a telephone, without the country or area codes, to reach
     a particular person, business, etc.
@@ -1946,7 +1970,7 @@ class Telephone(
     Does not include symbols, spaces, or leading zeros.
 
     """
-    extension_number: Optional[constr(max_length=20, pattern=r"^[0-9]{1,20}$")] = Field(None, example="89")
+    extension_number: Optional[StrMax20Pattern7] = Field(None, example="89")
     """
     The number used to reach an individual once a phone connection is established.
 
@@ -1989,11 +2013,11 @@ class MultiFactorAuthenticationAttempt(
     - `FAILED` - Applicable if the user failed the challenge.
 
     """
-    reference_id: constr(max_length=200) = None
+    reference_id: StrMax200 = None
     """The identifier related to a Multi-Factor Authentication attempt by the Partner's
     system to the Multi-Factor Authentication provider.
     """
-    provider_name: constr(max_length=200) = None
+    provider_name: StrMax200 = None
     """The vendor providing the Multi-Factor Authentication verification."""
     attempt_count: float = None
     """The number of attempts a user tried for this Multi-Factor Authentication."""
@@ -2026,7 +2050,7 @@ class AccountScreenResponse(
 ):
     r"""pydantic model AccountScreenResponse: Response for an account transaction provided by Expedia's Fraud Prevention Service."""
 
-    risk_id: Optional[constr(max_length=200)] = Field(None, example="1234567")
+    risk_id: Optional[StrMax200] = Field(None, example="1234567")
     """Unique identifier assigned to the transaction by Expedia's Fraud Prevention
     Service.
     """
@@ -2038,7 +2062,7 @@ class AccountTakeoverCustomerAccount(
 ):
     r"""pydantic model AccountTakeoverCustomerAccount: Information about a user's account."""
 
-    user_id: constr(max_length=200) = None
+    user_id: StrMax200 = None
     """
     Unique account identifier provided by the Partner's Identity Provider/System
     assigned to the account owner by the partner.
@@ -2065,7 +2089,7 @@ class AccountTakeoverCustomerAccount(
 
     """
     name: Optional[AccountTakeoverName] = None
-    username: constr(max_length=200) = None
+    username: StrMax200 = None
     """Username of the account."""
     email_address: EmailStr = None
     """Email address for the account owner."""
@@ -2077,7 +2101,7 @@ class AccountTakeoverCustomerAccount(
     """
     active_flag: bool = None
     """Indicator for if this account is an active account or not."""
-    loyalty_member_id: Optional[constr(max_length=200)] = None
+    loyalty_member_id: Optional[StrMax200] = None
     """Unique loyalty identifier for a user."""
 
 
@@ -2089,7 +2113,7 @@ class CurrentUserSession(
 
     """
 
-    session_id: Optional[constr(max_length=200)] = None
+    session_id: Optional[StrMax200] = None
     """Unique identifier for a user's session on their device."""
     start_date_time: Optional[datetime] = None
     """The local date and time a user's session started, in ISO-8601 date and time
@@ -2194,9 +2218,9 @@ class Traveler(
     """Date of birth for traveler, in ISO-8601 date and time format `yyyy-MM-
     ddTHH:mm:ss.SSSZ`.
     """
-    citizenship_country_code: Optional[constr(min_length=3, max_length=3, pattern=r"^[A-Z]{3}$")] = None
+    citizenship_country_code: Optional[StrMin3Max3Pattern1] = None
     """The alpha-3 ISO country code of the traveler's nationality."""
-    traveler_id: Optional[constr(max_length=100)] = None
+    traveler_id: Optional[StrMax100] = None
     """A unique identifier for travelers in the transaction."""
 
 
@@ -2224,7 +2248,7 @@ class Activity(
 ):
     r"""Pydantic model Activity."""
 
-    category_name: constr(max_length=200) = Field(..., example="Tours & Sightseeing")
+    category_name: StrMax200 = Field(..., example="Tours & Sightseeing")
     """
     This field categorizes various types of activities available within the product. It
     allows API consumers to assign descriptive labels or keywords representing the
@@ -2237,7 +2261,7 @@ class Activity(
     * `Nightlife`: This category encompasses activities like clubbing, pub crawls, live music events, and cultural performances. These activities predominantly occur during the evening or nighttime.
 
     """
-    activity_description: constr(max_length=200) = Field(..., example="06:40 AM, Tour from Marbella in English, includes Food Only")
+    activity_description: StrMax200 = Field(..., example="06:40 AM, Tour from Marbella in English, includes Food Only")
     """This field provides additional details or a brief explanation of the specific
     activity.
     """
@@ -2270,7 +2294,7 @@ class PaymentOperation(
 ):
     r"""Pydantic model PaymentOperation."""
 
-    id: Optional[constr(max_length=200)] = None
+    id: Optional[StrMax200] = None
     amount: Optional[Amount] = None
     outcome: Optional[PaymentOutcome] = None
 
@@ -2299,7 +2323,7 @@ class AccountTakeoverTransactionDetailsGeneric(
     """The local date and time the transaction occured in the Partner's system, in
     ISO-8601 date and time format `yyyy-MM-ddTHH:mm:ss.SSSZ`.
     """
-    transaction_id: constr(max_length=200) = None
+    transaction_id: StrMax200 = None
     """Unique identifier to identify a transaction attempt in the Partner's system."""
     current_user_session: Optional[CurrentUserSession] = None
 
@@ -2558,17 +2582,7 @@ class CreditCard(
 ):
     r"""Pydantic model CreditCard."""
 
-    @field_validator("card_number")
-    def __card_number_validator(cls, card_number):
-        return SecretStr(str(card_number))
-
-    @field_validator("card_cvv_response")
-    def __card_cvv_response_validator(cls, card_cvv_response):
-        return SecretStr(str(card_cvv_response))
-
-    @field_validator("card_avs_response")
-    def __card_avs_response_validator(cls, card_avs_response):
-        return SecretStr(str(card_avs_response))
+    __omitted_log_fields__: ClassVar[frozenset[str]] = frozenset(["card_number", "card_cvv_response", "card_avs_response"])
 
     card_type: CardType = None
     """
@@ -2609,7 +2623,7 @@ class CreditCard(
     * `VISA`                     : `POSTEPAY_VISA_ELECTRON`
 
     """
-    card_number: constr(max_length=200) = None
+    card_number: StrMax200 = None
     """All the digits (unencrypted) of the credit card number associated with the
     payment.
     """
@@ -2617,7 +2631,7 @@ class CreditCard(
     """Expiration date of the credit card used for payment, in ISO-8601 date and time
     format `yyyy-MM-ddTHH:mm:ss.SSSZ`.
     """
-    electronic_commerce_indicator: Optional[constr(max_length=200)] = None
+    electronic_commerce_indicator: Optional[StrMax200] = None
     """Electronic Commerce Indicator, a two or three digit number usually returned by a
     3rd party payment processor in regards to the authentication used when gathering the
     cardholder's payment credentials.
@@ -2626,7 +2640,7 @@ class CreditCard(
     """A flag to indicate that the bank card being used for the charge is a virtual
     credit card.
     """
-    wallet_type: Optional[constr(max_length=200)] = None
+    wallet_type: Optional[StrMax200] = None
     """
     If a virtual/digital form of payment was used, the type of digital wallet should be
     specified here.
@@ -2634,17 +2648,17 @@ class CreditCard(
     Possible `wallet_type`'s include: `Google` or `ApplePay`.
 
     """
-    card_avs_response: Optional[constr(max_length=50)] = None
+    card_avs_response: Optional[StrMax50] = None
     """A field used to confirm if the address provided at the time of purchase matches
     what the bank has on file for the Credit Card.
     """
-    card_cvv_response: Optional[constr(max_length=20)] = None
+    card_cvv_response: Optional[StrMax20] = None
     """A field used to confirm the Card Verification Value on the Credit Card matches
     the Credit Card used at the time of purchase.
     """
     telephones: list[Telephone] = Field(..., maxItems=20, minItems=1)
     """Telephone(s) associated with card holder and credit card."""
-    merchant_order_code: Optional[constr(max_length=200)] = None
+    merchant_order_code: Optional[StrMax200] = None
     """
     Reference code passed to acquiring bank at the time of payment.
 
@@ -2661,11 +2675,11 @@ class PayPal(
 ):
     r"""Pydantic model PayPal."""
 
-    payer_id: constr(max_length=200) = None
+    payer_id: StrMax200 = None
     """Unique PayPal Customer Account identification number."""
-    transaction_id: constr(max_length=200) = None
+    transaction_id: StrMax200 = None
     """Unique transaction number to identify Auth calls at PayPal."""
-    merchant_order_code: Optional[constr(max_length=200)] = None
+    merchant_order_code: Optional[StrMax200] = None
     """
     Reference code passed to acquiring bank at the time of payment.
 
@@ -2680,7 +2694,7 @@ class Points(
 ):
     r"""Pydantic model Points."""
 
-    account_id: constr(max_length=200) = None
+    account_id: StrMax200 = None
     """Points account id."""
     method: Literal["POINTS"] = "POINTS"
 
@@ -2690,15 +2704,13 @@ class GiftCard(
 ):
     r"""Pydantic model GiftCard."""
 
-    @field_validator("pin")
-    def __pin_validator(cls, pin):
-        return SecretStr(str(pin))
+    __omitted_log_fields__: ClassVar[frozenset[str]] = frozenset(["pin"])
 
-    card_number: constr(max_length=16, pattern=r"^[0-9A-Za-z]{4,16}$") = Field(..., example="123456ABCDabcd")
+    card_number: StrMax16Pattern4 = Field(..., example="123456ABCDabcd")
     """Gift card number."""
-    card_holder_name: constr(max_length=200) = None
+    card_holder_name: StrMax200 = None
     """The name of gift card holder."""
-    pin: constr(max_length=8, pattern=r"^[0-9]{4,8}$") = Field(..., example="123456")
+    pin: StrMax8Pattern5 = Field(..., example="123456")
     """The PIN of gift card."""
     method: Literal["GIFT_CARD"] = "GIFT_CARD"
 
@@ -2708,11 +2720,11 @@ class InternetBankPayment(
 ):
     r"""Pydantic model InternetBankPayment."""
 
-    bank_id: constr(max_length=15) = None
+    bank_id: StrMax15 = None
     """The bank_id provided by the internet bank payment(IBP) provider (DRWP aka
     NetGiro) for the bank used for processing the payment.
     """
-    bank_branch_code: constr(max_length=15) = None
+    bank_branch_code: StrMax15 = None
     """A code that identifies the bank branch for internet bank payment(IBP)."""
     telephones: list[Telephone] = Field(..., maxItems=20, minItems=1)
     """Telephone(s) associated with internet bank payment(IBP) provider."""
@@ -2724,18 +2736,16 @@ class DirectDebit(
 ):
     r"""Pydantic model DirectDebit."""
 
-    @field_validator("account_number")
-    def __account_number_validator(cls, account_number):
-        return SecretStr(str(account_number))
+    __omitted_log_fields__: ClassVar[frozenset[str]] = frozenset(["account_number"])
 
-    routing_number: Optional[constr(max_length=15)] = Field(None, example="100000000")
+    routing_number: Optional[StrMax15] = Field(None, example="100000000")
     """
     A code that identifies the financial institution for a specific bank account.
 
     `routing_number` is required if given `INTER_COMPANY` or `ELV` as `brand`.
 
     """
-    account_number: constr(max_length=100) = None
+    account_number: StrMax100 = None
     """Cleartext (unencrypted) DirectDebit bank account number associated with the
     payment instrument.
     """
@@ -2760,7 +2770,7 @@ class TransactionDetails(
 ):
     r"""Pydantic model TransactionDetails."""
 
-    order_id: constr(max_length=50) = Field(..., example="1000000234")
+    order_id: StrMax50 = Field(..., example="1000000234")
     """
     Unique identifier assigned to the order by the partner.
 
@@ -3106,23 +3116,28 @@ OrderPurchaseTransaction.model_rebuild()
 OrderPurchaseScreenRequest.model_rebuild()
 
 
-class ExpediaGroupUnauthorizedErrorException(ExpediaGroupApiException):
-    r"""Exception wrapping a UnauthorizedError object."""
+class ExpediaGroupAccountTakeoverBadRequestErrorException(ExpediaGroupApiException):
+    r"""Exception wrapping a AccountTakeoverBadRequestError object."""
     pass
 
 
-class ExpediaGroupGatewayTimeoutErrorException(ExpediaGroupApiException):
-    r"""Exception wrapping a GatewayTimeoutError object."""
+class ExpediaGroupAccountTakeoverUnauthorizedErrorException(ExpediaGroupApiException):
+    r"""Exception wrapping a AccountTakeoverUnauthorizedError object."""
     pass
 
 
-class ExpediaGroupInternalServerErrorException(ExpediaGroupApiException):
-    r"""Exception wrapping a InternalServerError object."""
+class ExpediaGroupAccountUpdateNotFoundErrorException(ExpediaGroupApiException):
+    r"""Exception wrapping a AccountUpdateNotFoundError object."""
     pass
 
 
-class ExpediaGroupTooManyRequestsErrorException(ExpediaGroupApiException):
-    r"""Exception wrapping a TooManyRequestsError object."""
+class ExpediaGroupBadGatewayErrorException(ExpediaGroupApiException):
+    r"""Exception wrapping a BadGatewayError object."""
+    pass
+
+
+class ExpediaGroupBadRequestErrorException(ExpediaGroupApiException):
+    r"""Exception wrapping a BadRequestError object."""
     pass
 
 
@@ -3131,13 +3146,18 @@ class ExpediaGroupForbiddenErrorException(ExpediaGroupApiException):
     pass
 
 
-class ExpediaGroupNotFoundErrorException(ExpediaGroupApiException):
-    r"""Exception wrapping a NotFoundError object."""
+class ExpediaGroupGatewayTimeoutErrorException(ExpediaGroupApiException):
+    r"""Exception wrapping a GatewayTimeoutError object."""
     pass
 
 
-class ExpediaGroupRetryableOrderPurchaseUpdateFailureException(ExpediaGroupApiException):
-    r"""Exception wrapping a RetryableOrderPurchaseUpdateFailure object."""
+class ExpediaGroupInternalServerErrorException(ExpediaGroupApiException):
+    r"""Exception wrapping a InternalServerError object."""
+    pass
+
+
+class ExpediaGroupNotFoundErrorException(ExpediaGroupApiException):
+    r"""Exception wrapping a NotFoundError object."""
     pass
 
 
@@ -3146,13 +3166,13 @@ class ExpediaGroupOrderPurchaseUpdateNotFoundErrorException(ExpediaGroupApiExcep
     pass
 
 
-class ExpediaGroupBadRequestErrorException(ExpediaGroupApiException):
-    r"""Exception wrapping a BadRequestError object."""
+class ExpediaGroupRetryableOrderPurchaseScreenFailureException(ExpediaGroupApiException):
+    r"""Exception wrapping a RetryableOrderPurchaseScreenFailure object."""
     pass
 
 
-class ExpediaGroupBadGatewayErrorException(ExpediaGroupApiException):
-    r"""Exception wrapping a BadGatewayError object."""
+class ExpediaGroupRetryableOrderPurchaseUpdateFailureException(ExpediaGroupApiException):
+    r"""Exception wrapping a RetryableOrderPurchaseUpdateFailure object."""
     pass
 
 
@@ -3161,48 +3181,44 @@ class ExpediaGroupServiceUnavailableErrorException(ExpediaGroupApiException):
     pass
 
 
-class ExpediaGroupAccountTakeoverUnauthorizedErrorException(ExpediaGroupApiException):
-    r"""Exception wrapping a AccountTakeoverUnauthorizedError object."""
-    pass
-
-
-class ExpediaGroupAccountTakeoverBadRequestErrorException(ExpediaGroupApiException):
-    r"""Exception wrapping a AccountTakeoverBadRequestError object."""
+class ExpediaGroupTooManyRequestsErrorException(ExpediaGroupApiException):
+    r"""Exception wrapping a TooManyRequestsError object."""
     pass
 
 
-class ExpediaGroupRetryableOrderPurchaseScreenFailureException(ExpediaGroupApiException):
-    r"""Exception wrapping a RetryableOrderPurchaseScreenFailure object."""
+class ExpediaGroupUnauthorizedErrorException(ExpediaGroupApiException):
+    r"""Exception wrapping a UnauthorizedError object."""
     pass
 
 
-class ExpediaGroupAccountUpdateNotFoundErrorException(ExpediaGroupApiException):
-    r"""Exception wrapping a AccountUpdateNotFoundError object."""
-    pass
+@dataclass
+class AccountTakeoverBadRequestErrorDeserializationContract:
+    exception: type = ExpediaGroupAccountTakeoverBadRequestErrorException
+    model: type = AccountTakeoverBadRequestError
 
 
 @dataclass
-class UnauthorizedErrorDeserializationContract:
-    exception: type = ExpediaGroupUnauthorizedErrorException
-    model: type = UnauthorizedError
+class AccountTakeoverUnauthorizedErrorDeserializationContract:
+    exception: type = ExpediaGroupAccountTakeoverUnauthorizedErrorException
+    model: type = AccountTakeoverUnauthorizedError
 
 
 @dataclass
-class GatewayTimeoutErrorDeserializationContract:
-    exception: type = ExpediaGroupGatewayTimeoutErrorException
-    model: type = GatewayTimeoutError
+class AccountUpdateNotFoundErrorDeserializationContract:
+    exception: type = ExpediaGroupAccountUpdateNotFoundErrorException
+    model: type = AccountUpdateNotFoundError
 
 
 @dataclass
-class InternalServerErrorDeserializationContract:
-    exception: type = ExpediaGroupInternalServerErrorException
-    model: type = InternalServerError
+class BadGatewayErrorDeserializationContract:
+    exception: type = ExpediaGroupBadGatewayErrorException
+    model: type = BadGatewayError
 
 
 @dataclass
-class TooManyRequestsErrorDeserializationContract:
-    exception: type = ExpediaGroupTooManyRequestsErrorException
-    model: type = TooManyRequestsError
+class BadRequestErrorDeserializationContract:
+    exception: type = ExpediaGroupBadRequestErrorException
+    model: type = BadRequestError
 
 
 @dataclass
@@ -3212,15 +3228,21 @@ class ForbiddenErrorDeserializationContract:
 
 
 @dataclass
-class NotFoundErrorDeserializationContract:
-    exception: type = ExpediaGroupNotFoundErrorException
-    model: type = NotFoundError
+class GatewayTimeoutErrorDeserializationContract:
+    exception: type = ExpediaGroupGatewayTimeoutErrorException
+    model: type = GatewayTimeoutError
 
 
 @dataclass
-class RetryableOrderPurchaseUpdateFailureDeserializationContract:
-    exception: type = ExpediaGroupRetryableOrderPurchaseUpdateFailureException
-    model: type = RetryableOrderPurchaseUpdateFailure
+class InternalServerErrorDeserializationContract:
+    exception: type = ExpediaGroupInternalServerErrorException
+    model: type = InternalServerError
+
+
+@dataclass
+class NotFoundErrorDeserializationContract:
+    exception: type = ExpediaGroupNotFoundErrorException
+    model: type = NotFoundError
 
 
 @dataclass
@@ -3230,15 +3252,15 @@ class OrderPurchaseUpdateNotFoundErrorDeserializationContract:
 
 
 @dataclass
-class BadRequestErrorDeserializationContract:
-    exception: type = ExpediaGroupBadRequestErrorException
-    model: type = BadRequestError
+class RetryableOrderPurchaseScreenFailureDeserializationContract:
+    exception: type = ExpediaGroupRetryableOrderPurchaseScreenFailureException
+    model: type = RetryableOrderPurchaseScreenFailure
 
 
 @dataclass
-class BadGatewayErrorDeserializationContract:
-    exception: type = ExpediaGroupBadGatewayErrorException
-    model: type = BadGatewayError
+class RetryableOrderPurchaseUpdateFailureDeserializationContract:
+    exception: type = ExpediaGroupRetryableOrderPurchaseUpdateFailureException
+    model: type = RetryableOrderPurchaseUpdateFailure
 
 
 @dataclass
@@ -3248,24 +3270,12 @@ class ServiceUnavailableErrorDeserializationContract:
 
 
 @dataclass
-class AccountTakeoverUnauthorizedErrorDeserializationContract:
-    exception: type = ExpediaGroupAccountTakeoverUnauthorizedErrorException
-    model: type = AccountTakeoverUnauthorizedError
-
-
-@dataclass
-class AccountTakeoverBadRequestErrorDeserializationContract:
-    exception: type = ExpediaGroupAccountTakeoverBadRequestErrorException
-    model: type = AccountTakeoverBadRequestError
-
-
-@dataclass
-class RetryableOrderPurchaseScreenFailureDeserializationContract:
-    exception: type = ExpediaGroupRetryableOrderPurchaseScreenFailureException
-    model: type = RetryableOrderPurchaseScreenFailure
+class TooManyRequestsErrorDeserializationContract:
+    exception: type = ExpediaGroupTooManyRequestsErrorException
+    model: type = TooManyRequestsError
 
 
 @dataclass
-class AccountUpdateNotFoundErrorDeserializationContract:
-    exception: type = ExpediaGroupAccountUpdateNotFoundErrorException
-    model: type = AccountUpdateNotFoundError
+class UnauthorizedErrorDeserializationContract:
+    exception: type = ExpediaGroupUnauthorizedErrorException
+    model: type = UnauthorizedError
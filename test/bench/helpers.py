@@ -0,0 +1,20 @@
+# Copyright 2022 Expedia, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from expediagroup.sdk.bench.stand_in import StandInServer
+from expediagroup.sdk.core.configuration.client_config import ClientConfig
+from release.fraudPreventionV2.src.client import FraudPreventionV2Client
+
+
+def client(server: StandInServer) -> FraudPreventionV2Client:
+    return FraudPreventionV2Client(ClientConfig(key="key", secret="secret", endpoint=server.endpoint, auth_endpoint=server.auth_endpoint))
@@ -0,0 +1,85 @@
+# Copyright 2022 Expedia, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import logging
+import time
+import unittest
+from test.bench.helpers import client
+
+from expediagroup.sdk.bench.load import (
+    MODES,
+    OPERATIONS,
+    LoadGenerator,
+    LoadResult,
+    report,
+    request_body,
+)
+from expediagroup.sdk.bench.stand_in import StandInServer
+
+
+def failing_call():
+    raise ConnectionError()
+
+
+class LoadGeneratorTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        logging.getLogger("expediagroup").setLevel(logging.WARNING)
+
+    def test_modes(self):
+        for mode in MODES:
+            result: LoadResult = LoadGenerator(lambda: time.sleep(0.001), concurrency=4, sample_interval=0.1).run(mode, 0.3)
+
+            self.assertEqual(result.mode, mode)
+            self.assertEqual(result.concurrency, 1 if mode == "sync" else 4)
+            self.assertGreater(result.requests, 0)
+            self.assertEqual(result.errors, dict())
+            self.assertGreaterEqual(result.p50_ms, 1.0)
+            self.assertLessEqual(result.p50_ms, result.p99_ms)
+            self.assertGreaterEqual(len(result.samples), 1)
+
+    def test_rate(self):
+        result: LoadResult = LoadGenerator(lambda: None, concurrency=2, rate=100).run("threads", 0.5)
+
+        self.assertEqual(result.requests, 50)
+        self.assertAlmostEqual(result.requests_per_second, 100, delta=10)
+
+    def test_errors(self):
+        result: LoadResult = LoadGenerator(failing_call, rate=100).run("asyncio", 0.1)
+
+        self.assertEqual(result.errors, {"ConnectionError": 10})
+        self.assertEqual(result.error_rate, 1.0)
+        self.assertIn("ConnectionError 10", report(result))
+
+    def test_processes_for(self):
+        result: LoadResult = LoadGenerator(lambda: None).run("sync", 0.01)
+        result.cpu_ms_per_request = 1.4
+
+        self.assertEqual(result.processes_for(1_000), 2)
+        self.assertEqual(result.processes_for(1_000, utilization=1.0), 2)
+        self.assertEqual(result.processes_for(500, utilization=1.0), 1)
+
+    def test_client_operations(self):
+        with StandInServer() as server:
+            fraud_client = client(server)
+            for operation in OPERATIONS.keys():
+                for raw in (False, True):
+                    body = request_body(operation, "small", raw)
+                    result: LoadResult = LoadGenerator(lambda: getattr(fraud_client, operation)(body), rate=50).run("threads", 0.1)  # noqa: B023
+
+                    self.assertEqual(result.requests, 5)
+                    self.assertEqual(result.errors, dict())
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=True, failfast=True)
@@ -0,0 +1,173 @@
+# Copyright 2022 Expedia, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import logging
+import random
+import tempfile
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from pathlib import Path
+from urllib.parse import urlsplit
+from test.bench.helpers import client
+
+import requests
+import yaml
+
+from expediagroup.sdk.bench.stand_in import (
+    AUTH_PATH,
+    SPEC_PATH,
+    Latency,
+    Mode,
+    StandInServer,
+    load_operations,
+)
+from release.fraudPreventionV2.src import model
+
+SCREEN_ORDER_PATH: str = "/fraud-prevention/v2/order/purchase/screen"
+
+
+class HeadersRecordingServer(StandInServer):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.headers: dict[str, dict[str, str]] = dict()
+
+    def respond(self, method, path, body=b"", headers=None):
+        self.headers[path] = dict(headers)
+        return super().respond(method, path, body, headers)
+
+
+class LatencyTest(unittest.TestCase):
+    def test_parse(self):
+        self.assertEqual(Latency.parse("lognormal:20:0.5"), Latency("lognormal", (20.0, 0.5)))
+        self.assertEqual(Latency.parse("fixed:5").sample(random.Random()), 0.005)
+
+        with self.assertRaises(ValueError):
+            Latency.parse("gamma:1:2")
+        with self.assertRaises(ValueError):
+            Latency.parse("uniform:1")
+
+    def test_samples_are_not_negative(self):
+        generator = random.Random(0)
+        for latency in (Latency("normal", (1.0, 10.0)), Latency("uniform", (-5.0, 5.0)), Latency("exponential", (0.0,))):
+            self.assertTrue(all(latency.sample(generator) >= 0 for _ in range(1_000)))
+
+
+class StandInServerTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        logging.getLogger("expediagroup").setLevel(logging.WARNING)
+
+    def test_responses_follow_spec(self):
+        spec = yaml.safe_load(SPEC_PATH.read_text(encoding="utf8"))
+
+        operations = load_operations()
+
+        self.assertEqual(
+            {operation.operation_id for operation in operations.values()}, {"screenOrder", "notifyWithOrderUpdate", "screenAccount", "notifyWithAccountUpdate"}
+        )
+        for path, operation in operations.items():
+            for status, response in spec["paths"][path]["post"]["responses"].items():
+                schema_name: str = response["content"]["application/json"]["schema"]["$ref"].rsplit("/", 1)[-1]
+                getattr(model, schema_name).model_validate_json(operation.responses[int(status)])
+
+    def test_client_calls(self):
+        with StandInServer() as server:
+            response = client(server).screen_order(b'{"transaction": {}}')
+
+            self.assertEqual(response.risk_id, "1234567")
+            self.assertEqual(response.decision, model.FraudDecision.ACCEPT)
+            self.assertEqual(server.requests, {AUTH_PATH: 1, SCREEN_ORDER_PATH: 1})
+
+            not_found = requests.post(server.endpoint + "unknown", data=b"{}")
+            self.assertEqual(not_found.status_code, HTTPStatus.NOT_FOUND)
+
+    def test_error_injection(self):
+        with StandInServer(error_rates={HTTPStatus.TOO_MANY_REQUESTS: 1.0}) as server:
+            response = requests.post(server.endpoint.rstrip("/") + SCREEN_ORDER_PATH, data=b"{}")
+
+            self.assertEqual(response.status_code, HTTPStatus.TOO_MANY_REQUESTS)
+            self.assertEqual(response.json()["code"], "TOO_MANY_REQUESTS")
+
+            with self.assertRaises(model.ExpediaGroupTooManyRequestsErrorException):
+                client(server).screen_order(b'{"transaction": {}}')
+
+    def test_latency(self):
+        with StandInServer(operation_latencies={"screenOrder": Latency("fixed", (50.0,))}) as server:
+            url: str = server.endpoint.rstrip("/") + SCREEN_ORDER_PATH
+            start: float = time.perf_counter()
+
+            with requests.Session() as session:
+                for _ in range(2):
+                    self.assertEqual(session.post(url, data=b"{}").status_code, HTTPStatus.OK)
+
+            self.assertGreaterEqual(time.perf_counter() - start, 0.1)
+
+    def test_record_and_replay(self):
+        with tempfile.TemporaryDirectory() as directory:
+            recording = Path(directory) / "recording.jsonl"
+
+            with StandInServer() as upstream, StandInServer(mode=Mode.RECORD, recording=recording, upstream=upstream.endpoint) as recorder:
+                response = client(recorder).screen_order(b'{"transaction": {}}')
+
+                self.assertEqual(response.decision, model.FraudDecision.ACCEPT)
+                self.assertEqual(upstream.requests, {AUTH_PATH: 1, SCREEN_ORDER_PATH: 1})
+
+            exchanges = [json.loads(line) for line in recording.read_text(encoding="utf8").splitlines()]
+            self.assertEqual([(exchange["path"], exchange["status"]) for exchange in exchanges], [(SCREEN_ORDER_PATH, HTTPStatus.OK)])
+
+            exchanges[0]["body"] = json.dumps({"risk_id": "replayed", "decision": "REJECT"})
+            recording.write_text(json.dumps(exchanges[0]) + "\n", encoding="utf8")
+
+            with StandInServer(mode=Mode.REPLAY, recording=recording) as replayer:
+                response = client(replayer).screen_order(b'{"transaction": {}}')
+
+            self.assertEqual(response.risk_id, "replayed")
+            self.assertEqual(response.decision, model.FraudDecision.REJECT)
+
+    def test_concurrent_records_are_counted(self):
+        with tempfile.TemporaryDirectory() as directory:
+            recording = Path(directory) / "recording.jsonl"
+
+            with StandInServer() as upstream, StandInServer(mode=Mode.RECORD, recording=recording, upstream=upstream.endpoint) as recorder:
+                with ThreadPoolExecutor(max_workers=16) as executor:
+                    responses = list(executor.map(lambda _: recorder.respond("POST", SCREEN_ORDER_PATH, b"{}"), range(200)))
+
+            self.assertTrue(all(status == HTTPStatus.OK for status, _ in responses))
+            self.assertEqual(recorder.requests, {SCREEN_ORDER_PATH: 200})
+            self.assertEqual(upstream.requests, {SCREEN_ORDER_PATH: 200})
+            self.assertEqual(len(recording.read_text(encoding="utf8").splitlines()), 200)
+
+    def test_record_forwards_headers(self):
+        with tempfile.TemporaryDirectory() as directory:
+            recording = Path(directory) / "recording.jsonl"
+
+            with HeadersRecordingServer() as upstream, StandInServer(mode=Mode.RECORD, recording=recording, upstream=upstream.endpoint) as recorder:
+                client(recorder).screen_order(b'{"transaction": {}}')
+                upstream_host: str = urlsplit(upstream.endpoint).netloc
+
+            self.assertTrue(upstream.headers[AUTH_PATH]["authorization"].startswith("Basic "))
+            self.assertEqual(upstream.headers[AUTH_PATH]["content-type"], "application/x-www-form-urlencoded")
+            self.assertEqual(upstream.headers[SCREEN_ORDER_PATH]["authorization"], "Bearer token")
+            self.assertEqual(upstream.headers[SCREEN_ORDER_PATH]["content-type"], "application/json")
+            self.assertEqual({headers["host"] for headers in upstream.headers.values()}, {upstream_host})
+
+    def test_record_needs_upstream(self):
+        with self.assertRaises(ValueError):
+            StandInServer(mode=Mode.RECORD, recording=Path("recording.jsonl"))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=True, failfast=True)
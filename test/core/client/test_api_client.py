@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import logging
 import unittest
 from test.core.constant import api as api_constant
 from test.core.constant import authentication as auth_constant
@@ -21,10 +22,13 @@ from expediagroup.sdk.core.client.api import ApiClient
 from expediagroup.sdk.core.client.expediagroup_auth_client import (
     _ExpediaGroupAuthClient,
 )
+from expediagroup.sdk.core.client.middleware import Middleware
 from expediagroup.sdk.core.configuration.client_config import ClientConfig
 from expediagroup.sdk.core.constant import header as header_constant
-from expediagroup.sdk.core.model.api import RequestHeaders
+from expediagroup.sdk.core.constant import log as log_constant
+from expediagroup.sdk.core.model.api import PreparedBody, RawResponse, RequestHeaders
 from expediagroup.sdk.core.model.exception import service as service_exception
+from expediagroup.sdk.core.util import log as log_util
 
 
 class Mocks:
@@ -45,6 +49,24 @@ class Configs:
     )
 
 
+class RecordingMiddleware(Middleware):
+    def __init__(self, name: str, records: list):
+        self.name = name
+        self.records = records
+
+    def __call__(self, request, call_next):
+        self.records.append(f"{self.name}:before")
+        request.headers[self.name] = self.name
+        response = call_next(request)
+        self.records.append(f"{self.name}:after")
+        return response
+
+
+class ShortCircuitMiddleware(Middleware):
+    def __call__(self, request, call_next):
+        return api_constant.MockResponse.hello_world_response()
+
+
 class ApiClientTest(unittest.TestCase):
     def test_fill_header_request(self):
         headers = ApiClient._ApiClient__fill_request_headers(dict())
@@ -163,6 +185,166 @@ class ApiClientTest(unittest.TestCase):
         self.assertEqual(response_obj.time, api_constant.DATETIME_NOW)
         self.assertEqual(response_obj.enum_value, api_constant.HelloWorldEnum.HELLO_WORLD)
 
+    @mock.patch.object(_ExpediaGroupAuthClient, "_ExpediaGroupAuthClient__retrieve_token", Mocks.authorized_retrieve_token_mock)
+    @mock.patch("expediagroup.sdk.core.client.api.requests.request")
+    def test_api_client_call_middlewares_order(self, request_mock):
+        request_mock.return_value = api_constant.MockResponse.hello_world_response()
+        records: list[str] = []
+        client_config = ClientConfig(
+            key=auth_constant.VALID_KEY,
+            secret=auth_constant.VALID_SECRET,
+            endpoint=api_constant.ENDPOINT,
+            auth_endpoint=auth_constant.AUTH_ENDPOINT,
+            middlewares=[RecordingMiddleware("outer", records), RecordingMiddleware("inner", records)],
+        )
+        api_client = ApiClient(client_config, _ExpediaGroupAuthClient)
+
+        response_obj: api_constant.HelloWorld = api_client.call(
+            method=api_constant.METHOD, body=api_constant.HELLO_WORLD_OBJECT, response_models=[api_constant.HelloWorld], url=api_constant.ENDPOINT
+        )
+
+        self.assertEqual(response_obj.message, api_constant.HELLO_WORLD_MESSAGE)
+        self.assertEqual(records, ["outer:before", "inner:before", "inner:after", "outer:after"])
+
+        sent_headers: dict = request_mock.call_args.kwargs["headers"]
+        self.assertEqual(sent_headers["outer"], "outer")
+        self.assertEqual(sent_headers["inner"], "inner")
+        self.assertNotIn("outer", header_constant.API_REQUEST)
+
+    @mock.patch.object(_ExpediaGroupAuthClient, "_ExpediaGroupAuthClient__retrieve_token", Mocks.authorized_retrieve_token_mock)
+    @mock.patch("expediagroup.sdk.core.client.api.requests.request")
+    def test_api_client_call_middleware_short_circuit(self, request_mock):
+        client_config = ClientConfig(
+            key=auth_constant.VALID_KEY,
+            secret=auth_constant.VALID_SECRET,
+            endpoint=api_constant.ENDPOINT,
+            auth_endpoint=auth_constant.AUTH_ENDPOINT,
+            middlewares=[ShortCircuitMiddleware()],
+        )
+        api_client = ApiClient(client_config, _ExpediaGroupAuthClient)
+
+        response_obj: api_constant.HelloWorld = api_client.call(
+            method=api_constant.METHOD, body=api_constant.HELLO_WORLD_OBJECT, response_models=[api_constant.HelloWorld], url=api_constant.ENDPOINT
+        )
+
+        self.assertEqual(response_obj.message, api_constant.HELLO_WORLD_MESSAGE)
+        request_mock.assert_not_called()
+
+    @mock.patch.object(_ExpediaGroupAuthClient, "_ExpediaGroupAuthClient__retrieve_token", Mocks.authorized_retrieve_token_mock)
+    @mock.patch("expediagroup.sdk.core.client.api.requests.request")
+    def test_api_client_call_streamed_response(self, request_mock):
+        request_mock.return_value = api_constant.MockResponse.hello_world_streamed_response()
+        api_client = ApiClient(Configs.client_config, _ExpediaGroupAuthClient)
+
+        with self.assertLogs("expediagroup.sdk.core.client.api", level=logging.INFO):
+            response_obj: api_constant.HelloWorld = api_client.call(
+                method=api_constant.METHOD, body=api_constant.HELLO_WORLD_OBJECT, response_models=[api_constant.HelloWorld], url=api_constant.ENDPOINT
+            )
+
+        self.assertTrue(request_mock.call_args.kwargs["stream"])
+        self.assertEqual(response_obj.message, api_constant.HELLO_WORLD_MESSAGE)
+        self.assertEqual(response_obj.time, api_constant.DATETIME_NOW)
+
+    @mock.patch.object(_ExpediaGroupAuthClient, "_ExpediaGroupAuthClient__retrieve_token", Mocks.authorized_retrieve_token_mock)
+    @mock.patch("expediagroup.sdk.core.client.api.requests.request", Mocks.hello_world_request_response_mock)
+    def test_api_client_call_compact_response_model(self):
+        api_client = ApiClient(Configs.client_config, _ExpediaGroupAuthClient)
+
+        response_obj: api_constant.CompactHelloWorld = api_client.call(
+            method=api_constant.METHOD,
+            body=api_constant.HELLO_WORLD_OBJECT,
+            response_models=[api_constant.CompactHelloWorld],
+            url=api_constant.ENDPOINT,
+            headers=RequestHeaders(),
+        )
+
+        self.assertIsInstance(response_obj, api_constant.CompactHelloWorld)
+        self.assertFalse(hasattr(response_obj, "__dict__"))
+        self.assertEqual(response_obj.message, api_constant.HELLO_WORLD_MESSAGE)
+        self.assertEqual(response_obj.enum_value, api_constant.HelloWorldEnum.HELLO_WORLD)
+
+    @mock.patch.object(_ExpediaGroupAuthClient, "_ExpediaGroupAuthClient__retrieve_token", Mocks.authorized_retrieve_token_mock)
+    @mock.patch("expediagroup.sdk.core.client.api.requests.request")
+    def test_api_client_call_prepared_body(self, request_mock):
+        request_mock.return_value = api_constant.MockResponse.hello_world_response()
+        api_client = ApiClient(Configs.client_config, _ExpediaGroupAuthClient)
+        body = PreparedBody.of(api_constant.HelloWorld, {"message": api_constant.HELLO_WORLD_MESSAGE, "time": None})
+
+        with self.assertLogs("expediagroup.sdk.core.client.api", level=logging.INFO) as logs:
+            response_obj: api_constant.HelloWorld = api_client.call(
+                method=api_constant.METHOD, body=body, response_models=[api_constant.HelloWorld], url=api_constant.ENDPOINT
+            )
+
+        self.assertEqual(response_obj.message, api_constant.HELLO_WORLD_MESSAGE)
+        self.assertEqual(request_mock.call_args.kwargs["data"], body.content)
+        self.assertIn(api_constant.HELLO_WORLD_MESSAGE, "".join(logs.output))
+
+    @mock.patch.object(_ExpediaGroupAuthClient, "_ExpediaGroupAuthClient__retrieve_token", Mocks.authorized_retrieve_token_mock)
+    @mock.patch("expediagroup.sdk.core.client.api.requests.request")
+    def test_api_client_call_raw_body(self, request_mock):
+        request_mock.return_value = api_constant.MockResponse.hello_world_response()
+        api_client = ApiClient(Configs.client_config, _ExpediaGroupAuthClient)
+        content: bytes = b'{"message":"Hello"}'
+
+        for body in (content, {"message": "Hello", "time": None}):
+            api_client.call(
+                method=api_constant.METHOD,
+                body=body,
+                body_model=api_constant.HelloWorld,
+                response_models=[api_constant.HelloWorld],
+                url=api_constant.ENDPOINT,
+            )
+
+            self.assertEqual(request_mock.call_args.kwargs["data"], content)
+
+    @mock.patch.object(_ExpediaGroupAuthClient, "_ExpediaGroupAuthClient__retrieve_token", Mocks.authorized_retrieve_token_mock)
+    @mock.patch("expediagroup.sdk.core.client.api.requests.request")
+    def test_api_client_call_raw_body_not_json_object(self, request_mock):
+        request_mock.return_value = api_constant.MockResponse.hello_world_response()
+        api_client = ApiClient(Configs.client_config, _ExpediaGroupAuthClient)
+
+        for content in (b"not json", b'[{"message": "Hello"}]'):
+            with self.assertLogs("expediagroup.sdk.core.client.api", level=logging.INFO) as logs:
+                response_obj: api_constant.HelloWorld = api_client.call(
+                    method=api_constant.METHOD,
+                    body=content,
+                    body_model=api_constant.HelloWorld,
+                    response_models=[api_constant.HelloWorld],
+                    url=api_constant.ENDPOINT,
+                )
+
+            self.assertEqual(response_obj.message, api_constant.HELLO_WORLD_MESSAGE)
+            self.assertEqual(request_mock.call_args.kwargs["data"], content)
+            self.assertIn(content.decode(), "".join(logs.output))
+
+    @mock.patch.object(_ExpediaGroupAuthClient, "_ExpediaGroupAuthClient__retrieve_token", Mocks.authorized_retrieve_token_mock)
+    @mock.patch("expediagroup.sdk.core.client.api.requests.request", Mocks.hello_world_request_response_mock)
+    def test_api_client_call_raw_response(self):
+        api_client = ApiClient(Configs.client_config, _ExpediaGroupAuthClient)
+
+        response: RawResponse = api_client.call(
+            method=api_constant.METHOD,
+            body=api_constant.HELLO_WORLD_OBJECT,
+            response_models=[api_constant.HelloWorld],
+            url=api_constant.ENDPOINT,
+            raw_response=True,
+        )
+
+        self.assertIsInstance(response, RawResponse)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["message"], api_constant.HELLO_WORLD_MESSAGE)
+        self.assertEqual(response.decode().message, api_constant.HELLO_WORLD_MESSAGE)
+
+    def test_body_log_truncated(self):
+        content: bytes = b"a" * (log_constant.HTTP_BODY_LOG_MAX_BYTES + 10)
+
+        body_log: str = log_util.body_log(content)
+
+        self.assertTrue(body_log.startswith("a" * log_constant.HTTP_BODY_LOG_MAX_BYTES))
+        self.assertTrue(body_log.endswith(log_constant.HTTP_BODY_TRUNCATED_LOG_MESSAGE_TEMPLATE.format(10)))
+        self.assertEqual(log_util.body_log(b"{}"), "{}")
+        self.assertEqual(log_util.body_log(b""), "")
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=True, failfast=True)
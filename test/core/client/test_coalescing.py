@@ -0,0 +1,132 @@
+# Copyright 2022 Expedia, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from test.core.constant import api as api_constant
+
+from expediagroup.sdk.core.client.coalescing import CoalescingMiddleware
+from expediagroup.sdk.core.model.api import ApiRequest
+
+OPERATION: str = "notify_with_order_update"
+
+
+class CountingHandler:
+    def __init__(self, delay: float = 0.0, status_code: int = HTTPStatus.OK, failure: bool = False):
+        self.delay = delay
+        self.status_code = status_code
+        self.failure = failure
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, request: ApiRequest):
+        with self.lock:
+            self.calls += 1
+
+        time.sleep(self.delay)
+        if self.failure:
+            raise ConnectionError()
+
+        response = api_constant.MockResponse.hello_world_response()
+        response.status_code = self.status_code
+        return response
+
+
+def request(data: str = '{"riskId": "1"}', operation: str = OPERATION) -> ApiRequest:
+    return ApiRequest(method="POST", url=api_constant.ENDPOINT, headers=dict(), data=data, operation=operation)
+
+
+class CoalescingMiddlewareTest(unittest.TestCase):
+    def test_identical_in_flight_requests_share_one_call(self):
+        middleware = CoalescingMiddleware(operations=[OPERATION])
+        handler = CountingHandler(delay=0.1)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            responses = list(executor.map(lambda _: middleware(request(), handler), range(8)))
+
+        self.assertEqual(handler.calls, 1)
+        self.assertTrue(all(response is responses[0] for response in responses))
+        self.assertEqual(middleware.metrics(OPERATION).coalesced, 7)
+        self.assertEqual(middleware.metrics(OPERATION).sent, 1)
+
+    def test_different_bodies_are_not_coalesced(self):
+        middleware = CoalescingMiddleware(operations=[OPERATION])
+        handler = CountingHandler(delay=0.1)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            list(executor.map(lambda data: middleware(request(data=data), handler), ['{"riskId": "1"}', '{"riskId": "2"}']))
+
+        self.assertEqual(handler.calls, 2)
+
+    def test_other_operations_pass_through(self):
+        middleware = CoalescingMiddleware(operations=[OPERATION])
+        handler = CountingHandler()
+
+        middleware(request(operation="screen_order"), handler)
+        middleware(request(operation="screen_order"), handler)
+
+        self.assertEqual(handler.calls, 2)
+        self.assertEqual(middleware.metrics("screen_order").requests, 0)
+
+    def test_failure_is_shared_and_not_cached(self):
+        middleware = CoalescingMiddleware(operations=[OPERATION], ttl_seconds=10)
+        handler = CountingHandler(delay=0.1, failure=True)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(middleware, request(), handler) for _ in range(4)]
+            for future in futures:
+                self.assertIsInstance(future.exception(), ConnectionError)
+
+        self.assertEqual(handler.calls, 1)
+
+        handler.failure = False
+        middleware(request(), handler)
+        self.assertEqual(handler.calls, 2)
+
+    def test_successful_responses_are_cached_for_ttl(self):
+        middleware = CoalescingMiddleware(operations=[OPERATION], ttl_seconds=0.1)
+        handler = CountingHandler()
+
+        middleware(request(), handler)
+        middleware(request(), handler)
+        self.assertEqual(handler.calls, 1)
+        self.assertEqual(middleware.metrics(OPERATION).cache_hits, 1)
+
+        time.sleep(0.15)
+        middleware(request(), handler)
+        self.assertEqual(handler.calls, 2)
+
+    def test_error_responses_are_not_cached(self):
+        middleware = CoalescingMiddleware(operations=[OPERATION], ttl_seconds=10)
+        handler = CountingHandler(status_code=HTTPStatus.SERVICE_UNAVAILABLE)
+
+        middleware(request(), handler)
+        middleware(request(), handler)
+
+        self.assertEqual(handler.calls, 2)
+
+    def test_cache_is_bounded(self):
+        middleware = CoalescingMiddleware(operations=[OPERATION], ttl_seconds=10, max_cached_responses=2)
+        handler = CountingHandler()
+
+        for data in ("1", "2", "3", "1"):
+            middleware(request(data=data), handler)
+
+        self.assertEqual(handler.calls, 4)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=True, failfast=True)
@@ -0,0 +1,250 @@
+# Copyright 2022 Expedia, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import asyncio
+import functools
+import json
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from test.core.constant import api as api_constant
+from test.core.constant import authentication as auth_constant
+
+from expediagroup.sdk.core.client.api import ApiClient
+from expediagroup.sdk.core.client.concurrency import (
+    AdaptiveConcurrencyLimiter,
+    ConcurrencyLimitMiddleware,
+)
+from expediagroup.sdk.core.configuration.client_config import ClientConfig
+from expediagroup.sdk.core.model.exception import client as client_exception
+from expediagroup.sdk.core.model.exception import service as service_exception
+
+
+class DegradingServer(ThreadingHTTPServer):
+    r"""A local API whose latency grows with the number of in-flight requests over its capacity, and which answers
+    HTTP 429 over a hard limit.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, capacity: int, hard_limit: int, base_latency: float):
+        super().__init__(("127.0.0.1", 0), DegradingRequestHandler)
+        self.capacity = capacity
+        self.hard_limit = hard_limit
+        self.base_latency = base_latency
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.rejected = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_port}/"
+
+
+class DegradingRequestHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        server: DegradingServer = self.server
+
+        with server.lock:
+            server.in_flight += 1
+            in_flight = server.in_flight
+            server.max_in_flight = max(server.max_in_flight, in_flight)
+
+        try:
+            if in_flight > server.hard_limit:
+                with server.lock:
+                    server.rejected += 1
+                self.__respond(HTTPStatus.TOO_MANY_REQUESTS, {"type": "TOO_MANY_REQUESTS", "detail": "Slow down"})
+                return
+
+            time.sleep(server.base_latency * max(1, in_flight - server.capacity + 1))
+            self.__respond(HTTPStatus.OK, api_constant.HELLO_WORLD_OBJECT.model_dump(mode="json"))
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    def __respond(self, status: HTTPStatus, body: dict):
+        content = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args):
+        pass
+
+
+class AdaptiveConcurrencyLimiterTest(unittest.TestCase):
+    def test_overload_decreases_limit(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=10, backoff_ratio=0.5)
+
+        limiter.acquire()
+        limiter.release(latency=0.01, overloaded=True)
+
+        self.assertEqual(limiter.limit, 5)
+        self.assertEqual(limiter.in_flight, 0)
+
+    def test_saturated_limit_grows_under_stable_latency(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2)
+
+        for _ in range(5):
+            limiter.acquire()
+            limiter.acquire()
+            limiter.release(latency=0.01)
+            limiter.release(latency=0.01)
+
+        self.assertGreater(limiter.limit, 2)
+
+    def test_idle_limit_does_not_grow(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=10)
+
+        for _ in range(5):
+            limiter.acquire()
+            limiter.release(latency=0.01)
+
+        self.assertEqual(limiter.limit, 10)
+
+    def test_latency_increase_decreases_limit(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=20)
+
+        limiter.acquire()
+        limiter.release(latency=0.01)
+        for _ in range(5):
+            limiter.acquire()
+            limiter.release(latency=0.1)
+
+        self.assertEqual(limiter.limit, 15)
+
+    def test_full_queue_sheds_immediately(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_queue_size=0)
+        limiter.acquire()
+
+        with self.assertRaises(client_exception.ExpediaGroupConcurrencyLimitException):
+            limiter.acquire()
+
+    def test_queue_timeout_sheds(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, queue_timeout_seconds=0.05)
+        limiter.acquire()
+
+        with self.assertRaises(client_exception.ExpediaGroupConcurrencyLimitException):
+            limiter.acquire()
+
+        self.assertEqual(limiter.queued, 0)
+
+    def test_queued_caller_is_granted_released_slot(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, queue_timeout_seconds=5)
+        limiter.acquire()
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            waiting = executor.submit(limiter.acquire)
+            while not limiter.queued:
+                time.sleep(0.001)
+
+            limiter.release()
+            waiting.result(timeout=1)
+
+        self.assertEqual(limiter.in_flight, 1)
+        self.assertEqual(limiter.queued, 0)
+
+    def test_async_queued_caller_is_granted_released_slot(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, queue_timeout_seconds=5)
+
+        async def scenario():
+            await limiter.acquire_async()
+            waiting = asyncio.create_task(limiter.acquire_async())
+            while not limiter.queued:
+                await asyncio.sleep(0.001)
+
+            threading.Thread(target=limiter.release).start()
+            await asyncio.wait_for(waiting, timeout=1)
+
+        asyncio.run(scenario())
+
+        self.assertEqual(limiter.in_flight, 1)
+
+    def test_async_slot_detects_overload_exceptions(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=10, backoff_ratio=0.5)
+
+        async def scenario():
+            async with limiter.async_slot():
+                raise service_exception.ExpediaGroupApiException.of(error=api_constant.ERROR_OBJECT, error_code=HTTPStatus.SERVICE_UNAVAILABLE)
+
+        with self.assertRaises(service_exception.ExpediaGroupApiException):
+            asyncio.run(scenario())
+
+        self.assertEqual(limiter.limit, 5)
+
+
+class ConcurrencyLimitMiddlewareTest(unittest.TestCase):
+    def setUp(self):
+        self.server = DegradingServer(capacity=4, hard_limit=10, base_latency=0.01)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def api_client(self, *middlewares) -> ApiClient:
+        config = ClientConfig(key=auth_constant.VALID_KEY, secret=auth_constant.VALID_SECRET, endpoint=self.server.url, middlewares=middlewares)
+        return ApiClient(config, auth_constant.StubAuthClient)
+
+    def call(self, api_client: ApiClient):
+        try:
+            return api_client.call(method="post", url=self.server.url, body=api_constant.HELLO_WORLD_OBJECT, response_models=[api_constant.HelloWorld])
+        except service_exception.ExpediaGroupApiException as exception:
+            return exception
+
+    def test_sync_client_backs_off_degrading_server(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=16, queue_timeout_seconds=None, max_queue_size=1_000)
+        api_client = self.api_client(ConcurrencyLimitMiddleware(limiter))
+
+        with ThreadPoolExecutor(max_workers=32) as executor:
+            results = list(executor.map(lambda _: self.call(api_client), range(400)))
+
+        self.assertLess(limiter.limit, 16)
+        self.assertEqual(limiter.in_flight, 0)
+        self.assertLess(self.server.rejected, 100)
+        self.assertTrue(all(isinstance(result, api_constant.HelloWorld) for result in results[-32:]))
+
+    def test_async_client_backs_off_degrading_server(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=16, queue_timeout_seconds=None, max_queue_size=1_000)
+        api_client = self.api_client()
+
+        # The default executor can have fewer threads than the limit, which would cap the concurrency the limiter sees.
+        executor = ThreadPoolExecutor(max_workers=32)
+        self.addCleanup(executor.shutdown)
+
+        async def call():
+            async with limiter.async_slot():
+                return await asyncio.get_running_loop().run_in_executor(
+                    executor, functools.partial(api_client.call, method="post", url=self.server.url, body=api_constant.HELLO_WORLD_OBJECT)
+                )
+
+        async def scenario():
+            outcomes = await asyncio.gather(*[call() for _ in range(200)], return_exceptions=True)
+            return [outcome for outcome in outcomes if isinstance(outcome, BaseException)]
+
+        asyncio.run(scenario())
+
+        self.assertLess(limiter.limit, 16)
+        self.assertEqual(limiter.in_flight, 0)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=True, failfast=True)
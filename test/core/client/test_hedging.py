@@ -0,0 +1,153 @@
+# Copyright 2022 Expedia, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import itertools
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from test.core.constant import api as api_constant
+
+from expediagroup.sdk.core.client.hedging import HedgingMiddleware, HedgingPolicy
+from expediagroup.sdk.core.model.api import ApiRequest
+
+OPERATION: str = "screen_account"
+
+POLICY: HedgingPolicy = HedgingPolicy(initial_delay_seconds=0.05)
+
+
+class DelayedHandler:
+    def __init__(self, *delays: float, failures: tuple[int, ...] = ()):
+        self.delays = delays
+        self.failures = failures
+        self.calls = itertools.count()
+        self.lock = threading.Lock()
+
+    def __call__(self, request: ApiRequest):
+        with self.lock:
+            index = next(self.calls)
+
+        time.sleep(self.delays[index])
+        if index in self.failures:
+            raise ConnectionError(index)
+
+        response = api_constant.MockResponse.hello_world_response()
+        response.reason = str(index)
+        return response
+
+    @property
+    def calls_count(self) -> int:
+        return next(self.calls)
+
+
+def request(operation: str = OPERATION, safe_to_duplicate: bool = True) -> ApiRequest:
+    return ApiRequest(method="POST", url=api_constant.ENDPOINT, headers=dict(), operation=operation, safe_to_duplicate=safe_to_duplicate)
+
+
+class HedgingMiddlewareTest(unittest.TestCase):
+    def test_fast_response_is_not_hedged(self):
+        middleware = HedgingMiddleware(operations={OPERATION: POLICY})
+        handler = DelayedHandler(0)
+
+        response = middleware(request(), handler)
+
+        self.assertEqual(response.reason, "0")
+        self.assertEqual(handler.calls_count, 1)
+        self.assertEqual(middleware.metrics(OPERATION).requests, 1)
+        self.assertEqual(middleware.metrics(OPERATION).hedge_rate, 0.0)
+
+    def test_slow_response_is_hedged(self):
+        middleware = HedgingMiddleware(operations={OPERATION: POLICY})
+        handler = DelayedHandler(1, 0)
+
+        start = time.monotonic()
+        response = middleware(request(), handler)
+
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertEqual(response.reason, "1")
+
+        metrics = middleware.metrics(OPERATION)
+        self.assertEqual(metrics.hedged, 1)
+        self.assertEqual(metrics.hedge_wins, 1)
+        self.assertEqual(metrics.hedge_rate, 1.0)
+        self.assertEqual(metrics.win_rate, 1.0)
+
+    def test_failed_attempt_falls_back_to_the_other(self):
+        middleware = HedgingMiddleware(operations={OPERATION: POLICY})
+        handler = DelayedHandler(0.1, 0.2, failures=(1,))
+
+        response = middleware(request(), handler)
+
+        self.assertEqual(response.reason, "0")
+        self.assertEqual(middleware.metrics(OPERATION).hedge_wins, 0)
+
+    def test_all_attempts_failed(self):
+        middleware = HedgingMiddleware(operations={OPERATION: POLICY})
+        handler = DelayedHandler(0.1, 0, failures=(0, 1))
+
+        with self.assertRaises(ConnectionError):
+            middleware(request(), handler)
+
+    def test_not_safe_to_duplicate_is_not_hedged(self):
+        middleware = HedgingMiddleware(operations={OPERATION: POLICY})
+        handler = DelayedHandler(0.2)
+
+        response = middleware(request(safe_to_duplicate=False), handler)
+
+        self.assertEqual(response.reason, "0")
+        self.assertEqual(handler.calls_count, 1)
+        self.assertEqual(middleware.metrics(OPERATION).requests, 0)
+
+    def test_not_safe_to_duplicate_warns_once(self):
+        middleware = HedgingMiddleware(operations={OPERATION: POLICY})
+
+        with self.assertLogs("expediagroup.sdk.core.client.hedging") as logs, ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda _: middleware(request(safe_to_duplicate=False), DelayedHandler(0)), range(32)))
+
+        self.assertEqual(len(logs.records), 1)
+
+    def test_close(self):
+        with HedgingMiddleware(operations={OPERATION: POLICY}) as middleware:
+            handler = DelayedHandler(0.2, 0.2)
+            middleware(request(), handler)
+
+        self.assertEqual(handler.calls_count, 2)
+        with self.assertRaises(RuntimeError):
+            middleware(request(), DelayedHandler(0))
+        # Operations that are not hedged keep working.
+        middleware(request(operation="screen_order"), DelayedHandler(0))
+
+    def test_operation_without_policy_is_not_hedged(self):
+        middleware = HedgingMiddleware(operations={OPERATION: POLICY})
+        handler = DelayedHandler(0.2)
+
+        middleware(request(operation="screen_order"), handler)
+
+        self.assertEqual(handler.calls_count, 1)
+
+    def test_delay_follows_latency_percentile(self):
+        policy = HedgingPolicy(percentile=50.0, initial_delay_seconds=1, min_delay_seconds=0, min_samples=4, window_size=10)
+        middleware = HedgingMiddleware(operations={OPERATION: policy})
+
+        for _ in range(policy.min_samples):
+            middleware(request(), DelayedHandler(0.01))
+
+        handler = DelayedHandler(0.5, 0)
+        response = middleware(request(), handler)
+
+        self.assertEqual(response.reason, "1")
+        self.assertEqual(middleware.metrics(OPERATION).hedged, 1)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=True, failfast=True)
@@ -0,0 +1,216 @@
+# Copyright 2022 Expedia, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import logging
+import threading
+import unittest
+from test.core.client.test_api_client import Mocks
+from test.core.constant import api as api_constant
+from test.core.constant import authentication as auth_constant
+from unittest import mock
+
+from expediagroup.sdk.core.client import profiler
+from expediagroup.sdk.core.client.api import ApiClient
+from expediagroup.sdk.core.client.expediagroup_auth_client import (
+    _ExpediaGroupAuthClient,
+)
+from expediagroup.sdk.core.client.hedging import HedgingMiddleware, HedgingPolicy
+from expediagroup.sdk.core.client.middleware import Middleware
+from expediagroup.sdk.core.client.profiler import CallProfile, CallProfiler, _Histogram
+from expediagroup.sdk.core.configuration.client_config import ClientConfig
+from expediagroup.sdk.core.model.exception import service as service_exception
+
+
+class ProfileRecordingMiddleware(Middleware):
+    def __init__(self):
+        self.profiles: list = []
+
+    def __call__(self, request, call_next):
+        self.profiles.append(request.profile)
+        return call_next(request)
+
+
+class AttemptsDoneMiddleware(Middleware):
+    def __init__(self):
+        self.done = threading.Semaphore(0)
+
+    def __call__(self, request, call_next):
+        try:
+            return call_next(request)
+        finally:
+            self.done.release()
+
+
+def client(profiler_: CallProfiler = None, middlewares: list = None) -> ApiClient:
+    client_config = ClientConfig(
+        key=auth_constant.VALID_KEY,
+        secret=auth_constant.VALID_SECRET,
+        endpoint=api_constant.ENDPOINT,
+        auth_endpoint=auth_constant.AUTH_ENDPOINT,
+        middlewares=middlewares,
+        profiler=profiler_,
+    )
+    return ApiClient(client_config, _ExpediaGroupAuthClient)
+
+
+def call(api_client: ApiClient, operation: str = "hello_world"):
+    return api_client.call(
+        method=api_constant.METHOD,
+        body=api_constant.HELLO_WORLD_OBJECT,
+        response_models=[api_constant.HelloWorld],
+        url=api_constant.ENDPOINT,
+        operation=operation,
+    )
+
+
+class HistogramTest(unittest.TestCase):
+    def test_buckets_cover_durations(self):
+        for duration_ns in [*range(0, 1_000), 123_456, 2**20 - 1, 2**20, 10**9, 3 * 10**12]:
+            bucket = _Histogram.bucket(duration_ns)
+
+            self.assertLessEqual(_Histogram.lower_bound(bucket), duration_ns)
+            self.assertLess(duration_ns, _Histogram.lower_bound(bucket + 1))
+
+    def test_percentiles(self):
+        histogram = _Histogram()
+        for duration_ns in range(1_000, 101_000, 1_000):
+            histogram.record(duration_ns)
+
+        summary = histogram.summary()
+
+        self.assertEqual(summary.count, 100)
+        self.assertAlmostEqual(summary.mean_us, 50.5)
+        self.assertGreaterEqual(summary.p50_us, 50.0)
+        self.assertLessEqual(summary.p50_us, 50.0 * 1.25)
+        self.assertGreaterEqual(summary.p99_us, 99.0)
+        self.assertLessEqual(summary.p99_us, 100.0)
+        self.assertEqual(summary.max_us, 100.0)
+
+
+class CallProfilerTest(unittest.TestCase):
+    def test_ring_buffer_keeps_latest_profiles(self):
+        call_profiler = CallProfiler(capacity=3)
+        for index in range(5):
+            call_profiler.end(CallProfile(str(index)))
+
+        self.assertEqual([profile.operation for profile in call_profiler.recent()], ["2", "3", "4"])
+        self.assertEqual(call_profiler.summary()[profiler.TOTAL].count, 5)
+
+        call_profiler.reset()
+
+        self.assertEqual(call_profiler.recent(), [])
+        self.assertEqual(call_profiler.summary(), dict())
+
+    def test_invalid_capacity(self):
+        with self.assertRaises(ValueError):
+            CallProfiler(capacity=0)
+
+    @mock.patch.object(_ExpediaGroupAuthClient, "_ExpediaGroupAuthClient__retrieve_token", Mocks.authorized_retrieve_token_mock)
+    @mock.patch("expediagroup.sdk.core.client.api.requests.request", Mocks.hello_world_request_response_mock)
+    def test_call_phases(self):
+        call_profiler = CallProfiler()
+        api_client = client(call_profiler)
+
+        response_obj: api_constant.HelloWorld = call(api_client)
+        call(api_client, operation="other")
+
+        self.assertEqual(response_obj.message, api_constant.HELLO_WORLD_MESSAGE)
+
+        profile = call_profiler.recent()[0]
+        self.assertEqual(profile.operation, "hello_world")
+        self.assertEqual(profile.status_code, 200)
+        self.assertIsNone(profile.error)
+        self.assertEqual(set(profile.phases.keys()), set(profiler.PHASES))
+        self.assertLessEqual(sum(profile.phases.values()), profile.total_ns)
+
+        summary = call_profiler.summary("hello_world")
+        self.assertEqual(list(summary.keys()), [*profiler.PHASES, profiler.TOTAL])
+        self.assertEqual(summary[profiler.TOTAL].count, 1)
+        self.assertEqual(call_profiler.summary()[profiler.TOTAL].count, 2)
+
+    @mock.patch.object(_ExpediaGroupAuthClient, "_ExpediaGroupAuthClient__retrieve_token", Mocks.authorized_retrieve_token_mock)
+    @mock.patch("expediagroup.sdk.core.client.api.requests.request", Mocks.invalid_request_response_mock)
+    def test_failed_call(self):
+        call_profiler = CallProfiler()
+
+        with self.assertRaises(service_exception.ExpediaGroupApiException):
+            call(client(call_profiler))
+
+        profile = call_profiler.recent()[0]
+        self.assertEqual(profile.error, "ExpediaGroupApiException")
+        self.assertIn(profiler.NETWORK, profile.phases)
+        self.assertNotIn(profiler.DECODE, profile.phases)
+
+    @mock.patch.object(_ExpediaGroupAuthClient, "_ExpediaGroupAuthClient__retrieve_token", Mocks.authorized_retrieve_token_mock)
+    @mock.patch("expediagroup.sdk.core.client.api.requests.request")
+    def test_hedged_call_keeps_the_winning_attempt(self, request_mock):
+        release_primary = threading.Event()
+
+        def respond(**kwargs):
+            # The primary attempt is held until the call has returned the response of the hedge.
+            if request_mock.call_count == 1:
+                release_primary.wait(timeout=5)
+            return api_constant.MockResponse.hello_world_response()
+
+        request_mock.side_effect = respond
+        call_profiler = CallProfiler()
+        attempts_done = AttemptsDoneMiddleware()
+        hedging = HedgingMiddleware(operations={"hello_world": HedgingPolicy(initial_delay_seconds=0.01)})
+        api_client = client(call_profiler, middlewares=[hedging, attempts_done])
+
+        api_client.call(
+            method=api_constant.METHOD,
+            body=api_constant.HELLO_WORLD_OBJECT,
+            response_models=[api_constant.HelloWorld],
+            url=api_constant.ENDPOINT,
+            operation="hello_world",
+            safe_to_duplicate=True,
+        )
+        profile = call_profiler.recent()[0]
+        phases: dict[str, int] = dict(profile.phases)
+
+        release_primary.set()
+        for _ in range(2):
+            self.assertTrue(attempts_done.done.acquire(timeout=5))
+
+        self.assertEqual(hedging.metrics("hello_world").hedge_wins, 1)
+        self.assertEqual(profile.phases, phases)
+        self.assertEqual(set(phases.keys()), set(profiler.PHASES))
+        # The hedge delay is spent in the middlewares, not in the transport of the winning attempt.
+        self.assertGreaterEqual(phases[profiler.MIDDLEWARES], 10_000_000)
+        self.assertLessEqual(sum(phases.values()), profile.total_ns)
+        self.assertEqual(call_profiler.summary()[profiler.NETWORK].count, 1)
+
+    @mock.patch.object(_ExpediaGroupAuthClient, "_ExpediaGroupAuthClient__retrieve_token", Mocks.authorized_retrieve_token_mock)
+    @mock.patch("expediagroup.sdk.core.client.api.requests.request", Mocks.hello_world_request_response_mock)
+    def test_periodic_summary_log(self):
+        api_client = client(CallProfiler(summary_interval_seconds=0))
+
+        with self.assertLogs("expediagroup.sdk.core.client.profiler", level=logging.INFO) as logs:
+            call(api_client)
+
+        self.assertIn("Call profile over 1 calls", logs.output[0])
+        self.assertIn(profiler.NETWORK, logs.output[0])
+
+    @mock.patch.object(_ExpediaGroupAuthClient, "_ExpediaGroupAuthClient__retrieve_token", Mocks.authorized_retrieve_token_mock)
+    @mock.patch("expediagroup.sdk.core.client.api.requests.request", Mocks.hello_world_request_response_mock)
+    def test_disabled_by_default(self):
+        middleware = ProfileRecordingMiddleware()
+
+        call(client(middlewares=[middleware]))
+
+        self.assertEqual(middleware.profiles, [None])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=True, failfast=True)
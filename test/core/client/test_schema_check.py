@@ -0,0 +1,93 @@
+# Copyright 2022 Expedia, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import logging
+import unittest
+from test.core.constant import api as api_constant
+
+import pydantic
+
+from expediagroup.sdk.core.client.schema_check import SchemaCheckMiddleware
+from expediagroup.sdk.core.model.api import ApiRequest, PreparedBody
+
+OPERATION: str = "screen_order"
+
+VALID_BODY: bytes = b'{"message": "Hello, World!"}'
+
+INVALID_BODY: bytes = b'{"message": "Hello, World!", "enum_value": "Goodbye"}'
+
+
+class RecordingHandler:
+    def __init__(self):
+        self.requests: list[ApiRequest] = []
+
+    def __call__(self, request: ApiRequest):
+        self.requests.append(request)
+        return api_constant.MockResponse.hello_world_response()
+
+
+def request(body) -> ApiRequest:
+    data = body.content if isinstance(body, PreparedBody) else body.model_dump_json()
+    return ApiRequest(method="POST", url=api_constant.ENDPOINT, headers=dict(), body=body, data=data, operation=OPERATION)
+
+
+class SchemaCheckMiddlewareTest(unittest.TestCase):
+    def test_sampled_invalid_body_is_reported_without_its_values(self):
+        middleware = SchemaCheckMiddleware(sample_rate=1.0)
+        handler = RecordingHandler()
+
+        with self.assertLogs("expediagroup.sdk.core.client.schema_check", level=logging.WARNING) as logs:
+            middleware(request(PreparedBody.of(api_constant.HelloWorld, INVALID_BODY)), handler)
+        middleware(request(PreparedBody.of(api_constant.HelloWorld, VALID_BODY)), handler)
+
+        self.assertEqual(len(handler.requests), 2)
+        self.assertIn("enum_value (enum)", logs.output[0])
+        self.assertNotIn("Goodbye", logs.output[0])
+        self.assertEqual(middleware.metrics(OPERATION).checked, 2)
+        self.assertEqual(middleware.metrics(OPERATION).failed, 1)
+        self.assertEqual(middleware.metrics(OPERATION).failure_rate, 0.5)
+
+    def test_failure_raises_when_asked_to(self):
+        middleware = SchemaCheckMiddleware(sample_rate=1.0, raise_on_failure=True)
+        handler = RecordingHandler()
+
+        with self.assertLogs("expediagroup.sdk.core.client.schema_check", level=logging.WARNING):
+            with self.assertRaises(pydantic.ValidationError):
+                middleware(request(PreparedBody.of(api_constant.HelloWorld, INVALID_BODY)), handler)
+
+        self.assertEqual(handler.requests, [])
+
+    def test_only_a_sample_is_checked(self):
+        middleware = SchemaCheckMiddleware(sample_rate=0.25, seed=1)
+        handler = RecordingHandler()
+
+        for _ in range(400):
+            middleware(request(PreparedBody.of(api_constant.HelloWorld, VALID_BODY)), handler)
+
+        metrics = middleware.metrics(OPERATION)
+        self.assertEqual(metrics.checked + metrics.unchecked, 400)
+        self.assertTrue(60 < metrics.checked < 140)
+
+    def test_validated_bodies_are_not_checked(self):
+        middleware = SchemaCheckMiddleware(sample_rate=1.0)
+        handler = RecordingHandler()
+
+        middleware(request(api_constant.HELLO_WORLD_OBJECT), handler)
+        middleware(request(PreparedBody.of(api_constant.HelloWorld, VALID_BODY, validate=True)), handler)
+
+        self.assertEqual(len(handler.requests), 2)
+        self.assertEqual(middleware.metrics(OPERATION).checked, 0)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=True, failfast=True)
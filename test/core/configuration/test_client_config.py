@@ -44,6 +44,7 @@ class ClientConfigTest(unittest.TestCase):
 
         self.assertEqual(client_config.endpoint, api_constant.ENDPOINT)
         self.assertEqual(client_config.request_timeout, request_timeout_millis / 1000)
+        self.assertEqual(client_config.middlewares, tuple())
 
         self.assertEqual(client_config.auth_config.auth_endpoint, auth_constant.AUTH_ENDPOINT)
         self.assertEqual(client_config.auth_config.credentials.key, auth_constant.VALID_KEY)
@@ -14,11 +14,13 @@
 
 import datetime
 import enum
+import io
 import json
 import typing
 from http import HTTPStatus
 from test.core.constant import authentication as auth_constant
 
+import pydantic.dataclasses
 import pydantic.schema
 import requests
 
@@ -45,6 +47,14 @@ class HelloWorld(pydantic.BaseModel):
 
 HELLO_WORLD_OBJECT: HelloWorld = HelloWorld()
 
+
+@pydantic.dataclasses.dataclass(frozen=True, slots=True, kw_only=True, config=pydantic.ConfigDict(extra="forbid"))
+class CompactHelloWorld:
+    time: typing.Optional[datetime.datetime] = None
+    message: typing.Optional[str] = None
+    enum_value: typing.Optional[HelloWorldEnum] = None
+
+
 ERROR_OBJECT = Error(type=ENDPOINT, detail="Test Error")
 
 
@@ -67,3 +77,12 @@ class MockResponse:
         response.code = "Bad Request"
         response._content = ERROR_OBJECT.model_dump_json().encode()
         return response
+
+    @staticmethod
+    def hello_world_streamed_response():
+        response = requests.Response()
+        response.status_code = HTTPStatus.OK
+        response.url = auth_constant.AUTH_ENDPOINT
+        response.headers = dict()
+        response.raw = io.BytesIO(HELLO_WORLD_OBJECT.model_dump_json().encode())
+        return response
@@ -20,6 +20,7 @@ from http import HTTPStatus
 import pydantic.schema
 import requests
 
+from expediagroup.sdk.core.client.auth_client import AuthClient
 from expediagroup.sdk.core.constant import constant
 from expediagroup.sdk.core.model.authentication import Credentials
 from expediagroup.sdk.core.model.rapid_auth import RapidAuthHeader, RapidToken
@@ -104,3 +105,21 @@ class MockResponse:
         response.code = "Unauthorized"
         response._content = "Unauthorized".encode()
         return response
+
+
+class StubAuthClient(AuthClient):
+    r"""An auth client that never calls the auth endpoint, for tests sending requests to local servers."""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def refresh_token(self):
+        pass
+
+    access_token = None
+
+    auth_header = None
+
+    is_token_expired = False
+
+    is_token_about_expired = False
@@ -0,0 +1,102 @@
+# Copyright 2022 Expedia, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import dataclasses
+import datetime
+import json
+import unittest
+from test.core.constant import api as api_constant
+from typing import Optional
+
+import pydantic
+
+from expediagroup.sdk.core.model.api import PreparedBody, RawResponse
+
+
+@dataclasses.dataclass
+class HelloWorldRecord:
+    time: datetime.datetime
+    message: str
+    enum_value: Optional[api_constant.HelloWorldEnum] = None
+
+
+class PreparedBodyTest(unittest.TestCase):
+    def test_mapping_is_serialized_like_the_model(self):
+        data = {"time": api_constant.DATETIME_NOW, "message": api_constant.HELLO_WORLD_MESSAGE, "enum_value": api_constant.HelloWorldEnum.HELLO_WORLD}
+
+        body: PreparedBody = PreparedBody.of(api_constant.HelloWorld, data)
+
+        self.assertIs(body.model, api_constant.HelloWorld)
+        self.assertEqual(json.loads(body.content), json.loads(api_constant.HELLO_WORLD_OBJECT.model_dump_json(exclude_none=True)))
+
+    def test_none_values_are_excluded(self):
+        record = HelloWorldRecord(time=api_constant.DATETIME_NOW, message=api_constant.HELLO_WORLD_MESSAGE)
+
+        body: PreparedBody = PreparedBody.of(api_constant.HelloWorld, {"record": record, "items": [{"a": None, "b": 1}], "missing": None})
+
+        self.assertEqual(
+            json.loads(body.content),
+            {"record": {"time": api_constant.DATETIME_NOW.isoformat(), "message": api_constant.HELLO_WORLD_MESSAGE}, "items": [{"b": 1}]},
+        )
+
+    def test_data_is_not_validated_by_default(self):
+        body: PreparedBody = PreparedBody.of(api_constant.HelloWorld, {"message": 1})
+
+        self.assertEqual(json.loads(body.content), {"message": 1})
+
+    def test_validation_is_opt_in(self):
+        with self.assertRaises(pydantic.ValidationError):
+            PreparedBody.of(api_constant.HelloWorld, {"message": 1}, validate=True)
+
+        body: PreparedBody = PreparedBody.of(api_constant.HelloWorld, {"message": api_constant.HELLO_WORLD_MESSAGE}, validate=True)
+
+        # Validated data is serialized from the model, defaults included.
+        self.assertEqual(json.loads(body.content), json.loads(api_constant.HELLO_WORLD_OBJECT.model_dump_json(exclude_none=True)))
+
+    def test_bytes_are_sent_unchanged(self):
+        content: bytes = b'{"message" : 1}'
+
+        self.assertEqual(PreparedBody.of(api_constant.HelloWorld, content).content, content)
+        self.assertEqual(PreparedBody.of(api_constant.HelloWorld, bytearray(content)).content, content)
+        with self.assertRaises(pydantic.ValidationError):
+            PreparedBody.of(api_constant.HelloWorld, content, validate=True)
+
+        body: PreparedBody = PreparedBody.of(api_constant.HelloWorld, b'{"message": "Hello"}', validate=True)
+
+        self.assertTrue(body.validated)
+        self.assertEqual(body.content, b'{"message": "Hello"}')
+
+
+class RawResponseTest(unittest.TestCase):
+    def test_body_is_decoded_on_demand_once(self):
+        content: bytes = api_constant.HELLO_WORLD_OBJECT.model_dump_json().encode()
+        response = RawResponse(status_code=200, headers=dict(), content=content, response_models=[api_constant.HelloWorld])
+
+        self.assertEqual(response.json()["message"], api_constant.HELLO_WORLD_MESSAGE)
+
+        decoded = response.decode()
+
+        self.assertIsInstance(decoded, api_constant.HelloWorld)
+        self.assertEqual(decoded.enum_value, api_constant.HelloWorldEnum.HELLO_WORLD)
+        self.assertIs(response.decode(), decoded)
+
+    def test_invalid_body_decodes_to_none(self):
+        response = RawResponse(status_code=200, headers=dict(), content=b'{"message": 1}', response_models=[None, api_constant.HelloWorld])
+
+        self.assertIsNone(response.decode())
+        self.assertIsNone(response.decode())
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=True, failfast=True)
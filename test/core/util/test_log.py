@@ -0,0 +1,109 @@
+# Copyright 2022 Expedia, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import unittest
+from typing import ClassVar, Optional, Union
+
+from pydantic import BaseModel
+
+from expediagroup.sdk.core.constant import log as log_constant
+from expediagroup.sdk.core.util import log as log_util
+
+
+class Card(BaseModel):
+    __omitted_log_fields__: ClassVar[frozenset[str]] = frozenset(["number", "pin"])
+
+    number: str
+    pin: Optional[str] = None
+    holder: str
+
+
+class Cash(BaseModel):
+    amount: float
+
+
+class Order(BaseModel):
+    id: str
+    payments: list[Union[Card, Cash]]
+    cards_by_name: dict[str, Card] = dict()
+    next: Optional["Order"] = None
+
+
+class RedactedDumpTest(unittest.TestCase):
+    def test_omitted_fields_are_masked(self):
+        order = Order(
+            id="1",
+            payments=[Card(number="4111", holder="John"), Cash(amount=10)],
+            cards_by_name={"john": Card(number="4222", pin="1234", holder="John")},
+            next=Order(id="2", payments=[Card(number="4333", holder="Jane")]),
+        )
+
+        dump = log_util.redacted_dump(order)
+
+        self.assertEqual(dump["payments"][0], {"number": log_constant.OMITTED_LOG_VALUE, "pin": None, "holder": "John"})
+        self.assertEqual(dump["payments"][1], {"amount": 10})
+        self.assertEqual(dump["cards_by_name"]["john"]["number"], log_constant.OMITTED_LOG_VALUE)
+        self.assertEqual(dump["cards_by_name"]["john"]["pin"], log_constant.OMITTED_LOG_VALUE)
+        self.assertEqual(dump["next"]["payments"][0]["number"], log_constant.OMITTED_LOG_VALUE)
+        self.assertNotIn("4111", str(dump))
+
+    def test_wire_serialization_is_untouched(self):
+        card = Card(number="4111", holder="John")
+
+        log_util.redacted_dump(card)
+
+        self.assertEqual(card.number, "4111")
+        self.assertIn("4111", card.model_dump_json())
+
+    def test_models_without_omitted_fields_are_not_walked(self):
+        self.assertEqual(log_util.redacted_dump(Cash(amount=1)), {"amount": 1})
+        self.assertEqual(log_util._log_mask_plans[Cash].nested, tuple())
+
+
+class RedactedDataTest(unittest.TestCase):
+    def test_omitted_fields_are_masked(self):
+        data = {
+            "id": "1",
+            "payments": [{"number": "4111", "holder": "John"}, {"amount": 10}],
+            "cards_by_name": {"john": {"number": "4222", "pin": "1234", "holder": "John"}},
+            "next": {"id": "2", "payments": [{"number": "4333", "holder": "Jane"}]},
+        }
+
+        logged = log_util.redacted_data(Order, json.dumps(data).encode())
+
+        self.assertEqual(logged["payments"][0], {"number": log_constant.OMITTED_LOG_VALUE, "holder": "John"})
+        self.assertEqual(logged["payments"][1], {"amount": 10})
+        self.assertEqual(logged["cards_by_name"]["john"]["pin"], log_constant.OMITTED_LOG_VALUE)
+        self.assertEqual(logged["next"]["payments"][0]["number"], log_constant.OMITTED_LOG_VALUE)
+        self.assertNotIn("4111", str(logged))
+        self.assertNotIn("4333", str(logged))
+
+    def test_union_of_models(self):
+        logged = log_util.redacted_data(Union[Cash, Card], b'{"number": "4111", "holder": "John"}')
+
+        self.assertEqual(logged, {"number": log_constant.OMITTED_LOG_VALUE, "holder": "John"})
+
+    def test_values_not_matching_the_model_are_skipped(self):
+        logged = log_util.redacted_data(Order, b'{"id": "1", "payments": ["4111", 2], "cards_by_name": [], "next": 3}')
+
+        self.assertEqual(logged, {"id": "1", "payments": ["4111", 2], "cards_by_name": [], "next": 3})
+
+    def test_bodies_not_json_objects_are_rejected(self):
+        for content in (b"not json", b'[{"number": "4111"}]', b"1"):
+            with self.assertRaises(ValueError):
+                log_util.redacted_data(Order, content)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=True, failfast=True)
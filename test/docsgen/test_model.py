@@ -0,0 +1,47 @@
+# Copyright 2022 Expedia, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import importlib.util
+import unittest
+from test.docsgen.test_resolver import load_docsgen_module, module
+
+
+@unittest.skipUnless(importlib.util.find_spec("docspec"), "requires the documentation generator dependencies")
+class ModuleTreeTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        load_docsgen_module("util")
+        cls.model = load_docsgen_module("model")
+
+    def setUp(self):
+        self.modules = [module("sdk", []), module("sdk.model", ["Error"]), module("sdk.client", ["Client"]), module("sdk.model.nested", ["Name"])]
+        self.tree = self.model.ModuleTree(self.modules)
+
+    def test_modules_are_indexed_by_name(self):
+        self.assertIs(self.tree.module("sdk.model"), self.modules[1])
+        self.assertIsNone(self.tree.module("sdk.other"))
+
+    def test_submodules(self):
+        self.assertEqual([submodule.name for submodule in self.tree.submodules("sdk")], ["sdk.model", "sdk.client"])
+        self.assertEqual([submodule.name for submodule in self.tree.submodules("sdk.model")], ["sdk.model.nested"])
+        self.assertEqual(self.tree.submodules("sdk.client"), [])
+
+    def test_master_shares_the_modules(self):
+        master = self.model.Master.from_modules(self.modules[1:])
+
+        self.assertEqual([master_module.name for master_module in master.modules], ["sdk.model.nested"])
+        self.assertIs(master.modules[0], self.modules[3])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=True, failfast=True)
@@ -0,0 +1,100 @@
+# Copyright 2022 Expedia, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import importlib.util
+import tempfile
+import unittest
+import warnings
+from pathlib import Path
+from test.docsgen.test_resolver import load_docsgen_module
+from unittest import mock
+
+SOURCE: str = '''
+class Name:
+    r"""A name.
+
+    Attributes:
+        first (str): The first name.
+    """
+
+    first: str
+'''
+
+
+@unittest.skipUnless(importlib.util.find_spec("docspec"), "requires the documentation generator dependencies")
+class ModuleCacheTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        load_docsgen_module("util")
+        cls.model = load_docsgen_module("model")
+        cls.module_cache = load_docsgen_module("module_cache")
+
+        from pydoc_markdown.contrib.loaders.python import PythonLoader
+        from pydoc_markdown.interfaces import Context
+
+        cls.PythonLoader = PythonLoader
+        cls.Context = Context
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+        self.package = Path(self.directory.name) / "source" / "names"
+        self.package.mkdir(parents=True)
+        (self.package / "__init__.py").write_text("")
+        (self.package / "model.py").write_text(SOURCE)
+        self.cache_dir = Path(self.directory.name) / "cache"
+
+    def loader(self):
+        loader = self.PythonLoader(search_path=[str(self.package.parent)])
+        loader.init(self.Context(directory=str(self.package.parent)))
+        return loader
+
+    def load(self):
+        cache = self.module_cache.ModuleCache(self.cache_dir)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            return cache, cache.load(self.loader())
+
+    def test_modules_are_loaded_as_the_loader_loads_them(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            expected = [self.model.Module.from_(module) for module in self.loader().load()]
+
+        cache, modules = self.load()
+
+        self.assertEqual(modules, expected)
+        self.assertEqual((cache.hits, cache.misses), (0, 2))
+
+    def test_unchanged_files_are_not_parsed_again(self):
+        _, modules = self.load()
+
+        with mock.patch.object(self.module_cache.docspec_python, "parse_python_module") as parse_python_module:
+            cache, cached_modules = self.load()
+
+        parse_python_module.assert_not_called()
+        self.assertEqual(cached_modules, modules)
+        self.assertEqual((cache.hits, cache.misses), (2, 0))
+
+    def test_changed_files_are_parsed_again(self):
+        self.load()
+        (self.package / "model.py").write_text(SOURCE.replace("Name", "FullName"))
+
+        cache, modules = self.load()
+
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual([class_.name for module in modules for class_ in module.classes], ["FullName"])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=True, failfast=True)
@@ -0,0 +1,68 @@
+# Copyright 2022 Expedia, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import importlib.util
+import tempfile
+import unittest
+from pathlib import Path
+from test.docsgen.test_resolver import DOCSGEN_DIR, load_docsgen_module, module
+
+
+@unittest.skipUnless(importlib.util.find_spec("docspec"), "requires the documentation generator dependencies")
+class MarkdownRendererTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        load_docsgen_module("util")
+        cls.model = load_docsgen_module("model")
+        cls.resolver = load_docsgen_module("resolver")
+        cls.helper = load_docsgen_module("helper")
+        cls.render = load_docsgen_module("render")
+
+    def renderer(self, workers: int):
+        modules = [module("sdk.model", ["Error", "Name"]), module("sdk.client", ["Client"])]
+        return self.render.MarkdownRenderer(
+            modules=modules,
+            master=self.model.Master.from_modules(modules),
+            package_name="sdk",
+            master_filename="index",
+            templates_path=DOCSGEN_DIR / "templates",
+            helpers=self.helper.helpers,
+            resolvers={"cross_reference_resolver": self.resolver.CrossReferenceResolver(modules)},
+            workers=workers,
+        )
+
+    def test_unchanged_pages_are_not_written(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output_path = Path(directory)
+            renderer = self.renderer(workers=1)
+
+            written = renderer.render(output_path)
+            self.assertEqual(set(written.keys()), {"sdk.model", "sdk.client", "Error", "Name", "Client", "index"})
+            self.assertTrue(all(written.values()))
+
+            (output_path / "Name.md").write_text("outdated")
+            written = renderer.render(output_path)
+            self.assertEqual([name for name, changed in written.items() if changed], ["Name"])
+            self.assertEqual((output_path / "Name.md").read_text(), renderer.render_page((0, 1))[1])
+
+    def test_worker_processes_render_the_same_pages(self):
+        with tempfile.TemporaryDirectory() as sequential, tempfile.TemporaryDirectory() as parallel:
+            self.renderer(workers=1).render(Path(sequential))
+            self.renderer(workers=2).render(Path(parallel))
+
+            for file in Path(sequential).iterdir():
+                self.assertEqual((Path(parallel) / file.name).read_bytes(), file.read_bytes())
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=True, failfast=True)
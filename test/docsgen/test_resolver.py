@@ -0,0 +1,128 @@
+# Copyright 2022 Expedia, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import importlib.util
+import sys
+import unittest
+from pathlib import Path
+
+DOCSGEN_DIR: Path = Path(__file__).parents[2] / "expediagroup" / "sdk" / "docsgen"
+
+
+def load_docsgen_module(name: str):
+    # The documentation generator runs as a script with flat imports, its directory is searched for the modules its
+    # modules import.
+    if str(DOCSGEN_DIR) not in sys.path:
+        sys.path.append(str(DOCSGEN_DIR))
+
+    spec = importlib.util.spec_from_file_location(name, DOCSGEN_DIR / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def module(name: str, classes: list[str], variables: dict[str, str] = dict()):  # noqa: B006
+    model = sys.modules["model"]
+    return model.Module(
+        name=name,
+        description="",
+        classes=[
+            model.Class(
+                name=class_name,
+                description="",
+                constructor=model.Method(name=class_name, description="", return_type=None, arguments=[]),
+                bases=[],
+                attributes=[],
+                methods=[],
+                breadcrumbs=None,
+            )
+            for class_name in classes
+        ],
+        variables=[model.Variable(name=variable, description="", value=value) for variable, value in variables.items()],
+        submodules=[],
+        breadcrumbs=None,
+    )
+
+
+@unittest.skipUnless(importlib.util.find_spec("docspec"), "requires the documentation generator dependencies")
+class CrossReferenceResolverTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.util = load_docsgen_module("util")
+        load_docsgen_module("model")
+        cls.resolver = load_docsgen_module("resolver")
+
+    def test_class_names_are_linked(self):
+        resolver = self.resolver.CrossReferenceResolver([module("model", ["Error", "BadRequestError", "Name"])])
+
+        self.assertEqual(resolver.resolve("Error"), "[Error](Error.md)")
+        self.assertEqual(
+            resolver.resolve("Optional[list[BadRequestError]] \\| Error"),
+            "Optional[list[[BadRequestError](BadRequestError.md)]] \\| [Error](Error.md)",
+        )
+        self.assertEqual(resolver.resolve("Errors or FullName or Name2"), "Errors or FullName or Name2")
+        self.assertEqual(resolver.resolve("model.Name > Name_"), "model.[Name](Name.md) > [Name](Name.md)_")
+
+    def test_class_names_are_linked_once(self):
+        # A class name shared by several modules is linked once, not once per module.
+        resolver = self.resolver.CrossReferenceResolver([module("model", ["Name"]), module("other", ["Name"])])
+
+        self.assertEqual(resolver.resolve("list[Name]"), "list[[Name](Name.md)]")
+
+    def test_type_aliases_are_resolved_first(self):
+        resolver = self.resolver.CrossReferenceResolver([module("model", ["Name"], {"Names": "list[Name]"})])
+
+        self.assertEqual(resolver.resolve("Optional[Names]"), "Optional[list[[Name](Name.md)]]")
+        self.assertEqual(resolver.resolve("Optional[Names]"), "Optional[list[[Name](Name.md)]]")
+
+    def test_word_matcher_prefers_longest_words(self):
+        matcher = self.util.WordMatcher(["Err", "Error", "ErrorCode", ""])
+
+        self.assertEqual(matcher.sub(str.upper, "Err, Error, ErrorCode, ErrorCodes"), "ERR, ERROR, ERRORCODE, ErrorCodes")
+        self.assertEqual(self.util.WordMatcher([]).sub(str.upper, "Error"), "Error")
+
+
+@unittest.skipUnless(importlib.util.find_spec("docspec"), "requires the documentation generator dependencies")
+class TypeAliasResolverTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        load_docsgen_module("util")
+        load_docsgen_module("model")
+        cls.resolver = load_docsgen_module("resolver")
+
+    def test_nested_aliases_are_expanded(self):
+        resolver = self.resolver.TypeAliasResolver(
+            [
+                module("model", [], {"Update": "Union[Refund, Payment]", "Refund": "RefundUpdate", "Payment": "Union[Card, Refund]"}),
+                module("other", [], {"Refund": "Ignored", "Empty": ""}),
+            ]
+        )
+
+        self.assertEqual(resolver.expansions["Update"], "Union[RefundUpdate, Union[Card, RefundUpdate]]")
+        self.assertEqual(resolver.resolve("Update"), "Union[RefundUpdate, Union[Card, RefundUpdate]]")
+        self.assertEqual(resolver.resolve("Optional[Payment] or Refunds or Empty"), "Optional[Union[Card, RefundUpdate]] or Refunds or Empty")
+        self.assertEqual(resolver.cyclic_aliases, frozenset())
+
+    def test_cycles_are_detected(self):
+        resolver = self.resolver.TypeAliasResolver(
+            [module("model", [], {"Json": "Union[dict[str, Json], list[Json], str]", "Tree": "list[Node]", "Node": "Union[Leaf, Tree]", "Leaf": "str"})]
+        )
+
+        self.assertEqual(resolver.cyclic_aliases, frozenset(["Json", "Tree", "Node"]))
+        self.assertEqual(resolver.resolve("Json"), "Union[dict[str, Json], list[Json], str]")
+        self.assertEqual(resolver.resolve("Tree"), "list[Union[str, Tree]]")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=True, failfast=True)
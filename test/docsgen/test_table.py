@@ -0,0 +1,54 @@
+# Copyright 2022 Expedia, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+import warnings
+from test.docsgen.test_resolver import load_docsgen_module
+
+
+class RenderTableTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.table = load_docsgen_module("table")
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", SyntaxWarning)
+            cls.markdown_prettytable = load_docsgen_module("markdown_prettytable")
+
+    def assert_renders_like_prettytable(self, field_names: list[str], rows: list[list]):
+        pretty_table = self.markdown_prettytable.PrettyTable(field_names=field_names)
+        for row in rows:
+            pretty_table.add_row(row)
+
+        self.assertEqual(self.table.render_table(field_names, rows), str(pretty_table))
+
+    def test_table(self):
+        self.assertEqual(
+            self.table.render_table(["Name", "Required"], [["id", True], ["description", False]]),
+            "\n|     Name    | Required |\n|-------------|----------|\n|      id     |   True   |\n| description |  False   |\n\n",
+        )
+
+    def test_tables_are_laid_out_like_prettytable(self):
+        self.assert_renders_like_prettytable(["Module"], [])
+        self.assert_renders_like_prettytable(["Name", "Type", "Required", "Description"], [["a", "Optional[str]", False, "An \\| escaped<br/>value."]])
+        self.assert_renders_like_prettytable(["Class", "Description"], [["[Error](Error.md)", "Two\nlines"], ["[Name](Name.md)", "One"]])
+        self.assert_renders_like_prettytable(
+            ["Name", "Description"], [["名前", "Ｆｕｌｌ width"], ["cafe\u0301", "combining accent"], ["odd", "\033[1mbold\033[0m"]]
+        )
+
+    def test_rows_must_have_a_value_for_each_column(self):
+        with self.assertRaises(ValueError):
+            self.table.render_table(["Name", "Type"], [["id"]])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=True, failfast=True)
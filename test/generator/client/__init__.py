@@ -0,0 +1,42 @@
+# Copyright 2022 Expedia, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import importlib.util
+import sys
+import unittest
+import warnings
+from pathlib import Path
+
+import pydantic
+
+ROOT: Path = Path(__file__).parents[3]
+
+GENERATOR_DIR: Path = ROOT / "expediagroup" / "sdk" / "generator" / "client"
+
+# The generator is written against pydantic v1, which its dependencies pin.
+requires_generator_dependencies = unittest.skipUnless(
+    importlib.util.find_spec("datamodel_code_generator") and pydantic.VERSION.startswith("1."), "requires the generator dependencies"
+)
+
+
+def load_generator_module(name: str, path: Path):
+    # The generator runs as a script with flat imports, its modules are loaded from their files. Modules are registered
+    # under their flat name, so that the modules importing them find them, and worker processes can unpickle the
+    # functions they send them.
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        spec.loader.exec_module(module)
+    return module
@@ -0,0 +1,104 @@
+# Copyright 2022 Expedia, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from test.generator.client import (
+    GENERATOR_DIR,
+    load_generator_module,
+    requires_generator_dependencies,
+)
+
+
+def generate(input_name: str, input_text: str, output_dir: Path, model_path: Path, sdk_config: dict[str, str]) -> str:
+    if sdk_config["namespace"] == "broken":
+        raise RuntimeError(f"cannot generate {input_name}")
+    return f"{sdk_config['namespace']} {sdk_config['version']} {model_path} in {os.getpid()}"
+
+
+@requires_generator_dependencies
+class BatchTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.batch = load_generator_module("batch", GENERATOR_DIR / "batch.py")
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+        (self.directory / "spec.yaml").write_text("openapi: 3.0.1\n", encoding="utf8")
+
+    def manifest(self, content: str) -> Path:
+        manifest_path = self.directory / "manifest.yaml"
+        manifest_path.write_text(content, encoding="utf8")
+        return manifest_path
+
+    def entry(self, namespace: str):
+        return self.batch.BatchEntry(input=self.directory / "spec.yaml", output=self.directory / namespace, namespace=namespace, version="1.0.0")
+
+    def test_load_manifest(self):
+        manifest_path = self.manifest(
+            "specs:\n"
+            "  - {input: spec.yaml, output: out/a, namespace: a, version: 1.0}\n"
+            "  - {input: spec.yaml, output: out/b, namespace: b, version: 2.0.0, model_file: models}\n"
+        )
+
+        entries = self.batch.load_manifest(manifest_path)
+
+        self.assertEqual([entry.namespace for entry in entries], ["a", "b"])
+        self.assertEqual(entries[0].input, self.directory / "spec.yaml")
+        self.assertEqual(entries[0].output, self.directory / "out" / "a")
+        self.assertEqual(entries[0].version, "1.0")
+        self.assertEqual(entries[0].model_file, "model.py")
+        self.assertEqual(entries[1].model_file, "models")
+
+    def test_malformed_manifest(self):
+        for content in (
+            "",
+            "- spec.yaml\n",
+            "specs: spec.yaml\n",
+            "specs:\n  - spec.yaml\n",
+            "specs:\n  - {input: spec.yaml, output: out, version: 1.0.0}\n",
+        ):
+            with self.subTest(content=content), self.assertRaises(ValueError):
+                self.batch.load_manifest(self.manifest(content))
+
+    def test_duplicate_namespaces(self):
+        manifest_path = self.manifest(
+            "specs:\n"
+            "  - {input: spec.yaml, output: out/a, namespace: a, version: 1.0.0}\n"
+            "  - {input: spec.yaml, output: out/b, namespace: a, version: 2.0.0}\n"
+        )
+
+        with self.assertRaisesRegex(ValueError, "repeats the namespace a"):
+            self.batch.load_manifest(manifest_path)
+
+    def test_worker_errors_are_reported(self):
+        entries = [self.entry("a"), self.entry("broken"), self.entry("b")]
+
+        results = self.batch.generate_batch(entries, generate, jobs=2)
+
+        self.assertEqual([result.entry for result in results], entries)
+        self.assertTrue(results[0].report.startswith("a 1.0.0 model.py"))
+        self.assertIsNone(results[0].error)
+        self.assertIsNone(results[1].report)
+        self.assertIn("RuntimeError: cannot generate", results[1].error)
+        self.assertIsNone(results[2].error)
+        # Entries were generated in worker processes.
+        self.assertNotIn(f" in {os.getpid()}", results[0].report)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=True, failfast=True)
@@ -0,0 +1,102 @@
+# Copyright 2022 Expedia, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from test.generator.client import (
+    GENERATOR_DIR,
+    load_generator_module,
+    requires_generator_dependencies,
+)
+
+SPEC: str = """\
+openapi: 3.0.1
+info: {title: Ping, version: 1.0.0}
+paths:
+  /ping:
+    get:
+      operationId: ping
+      responses:
+        "200":
+          description: OK
+          content:
+            application/json:
+              schema: {$ref: "#/components/schemas/Pong"}
+components:
+  schemas:
+    Pong:
+      type: object
+      properties:
+        message: {type: string}
+"""
+
+
+@requires_generator_dependencies
+class FormatterSettingsTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.formatting = load_generator_module("formatting", GENERATOR_DIR / "formatting.py")
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.project = Path(directory.name).resolve()
+        # A .git directory marks the project root for black, as in a checkout.
+        (self.project / ".git").mkdir()
+        self.working_dir = self.project / "generator"
+        self.working_dir.mkdir()
+
+    def test_settings_are_resolved_from_the_project_root(self):
+        (self.project / "pyproject.toml").write_text('[tool.black]\nline-length = 160\n\n[tool.isort]\nprofile = "black"\n', encoding="utf8")
+
+        self.assertEqual(self.formatting.formatter_settings_files(self.working_dir), [self.project / "pyproject.toml"])
+
+    def test_missing_settings(self):
+        self.assertEqual(self.formatting.formatter_settings_files(self.working_dir), [])
+
+    def test_changed_settings_miss_the_cache(self):
+        (self.project / "pyproject.toml").write_text("[tool.black]\nline-length = 160\n", encoding="utf8")
+        (self.project / "spec.yaml").write_text(SPEC, encoding="utf8")
+
+        first = self.generate()
+        second = self.generate()
+        (self.project / "pyproject.toml").write_text("[tool.black]\nline-length = 100\n", encoding="utf8")
+        third = self.generate()
+
+        self.assertNotIn("(cached)", first)
+        self.assertIn("(cached)", second)
+        self.assertNotIn("(cached)", third)
+
+    def generate(self) -> str:
+        result = subprocess.run(
+            [
+                sys.executable,
+                str(GENERATOR_DIR / "__main__.py"),
+                *("--input", str(self.project / "spec.yaml")),
+                *("--output", str(self.project / "sdk")),
+                *("--template-dir", str(GENERATOR_DIR / "templates")),
+                *("--cache-dir", str(self.project / "cache")),
+            ],
+            cwd=self.working_dir,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return result.stderr
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=True, failfast=True)
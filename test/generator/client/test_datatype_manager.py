@@ -0,0 +1,65 @@
+# Copyright 2022 Expedia, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+from test.generator.client import (
+    GENERATOR_DIR,
+    load_generator_module,
+    requires_generator_dependencies,
+)
+
+
+@requires_generator_dependencies
+class PydanticV2DataTypeManagerTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.datatype_manager = load_generator_module("datatype_manager", GENERATOR_DIR / "datatype_manager.py")
+
+    def setUp(self):
+        from datamodel_code_generator.types import Types
+
+        self.manager = self.datatype_manager.PydanticV2DataTypeManager()
+        self.string = Types.string
+
+    def test_identical_constraints_share_a_type(self):
+        first = self.manager.get_data_type(self.string, maxLength=200)
+        second = self.manager.get_data_type(self.string, maxLength=200)
+        patterned = self.manager.get_data_type(self.string, maxLength=3, pattern="^[A-Z]{3}$")
+        same_pattern = self.manager.get_data_type(self.string, pattern="^[A-Z]{3}$")
+
+        self.assertEqual(first.type_hint, "StrMax200")
+        self.assertEqual(second.type_hint, "StrMax200")
+        self.assertEqual(patterned.type_hint, "StrMax3Pattern1")
+        self.assertEqual(same_pattern.type_hint, "StrPattern1")
+        self.assertEqual(
+            self.manager.constrained_str_types,
+            {
+                "StrMax200": "Annotated[str, StringConstraints(max_length=200)]",
+                "StrMax3Pattern1": "Annotated[str, StringConstraints(max_length=3, pattern=r'^[A-Z]{3}$')]",
+                "StrPattern1": "Annotated[str, StringConstraints(pattern=r'^[A-Z]{3}$')]",
+            },
+        )
+        self.assertFalse(self.manager.python_regex_required)
+
+    def test_unconstrained_string(self):
+        self.assertEqual(self.manager.get_data_type(self.string).type_hint, "str")
+        self.assertEqual(self.manager.constrained_str_types, dict())
+
+    def test_python_only_pattern(self):
+        self.manager.get_data_type(self.string, pattern="^(?!0+$)[0-9]+$")
+
+        self.assertTrue(self.manager.python_regex_required)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=True, failfast=True)
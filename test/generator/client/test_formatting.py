@@ -0,0 +1,76 @@
+# Copyright 2022 Expedia, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import ast
+import unittest
+from test.generator.client import (
+    GENERATOR_DIR,
+    ROOT,
+    load_generator_module,
+    requires_generator_dependencies,
+)
+from typing import Optional
+
+
+class MemoryCache:
+    def __init__(self):
+        self.entries: dict[tuple[str, str], str] = dict()
+
+    def load_formatted(self, formatter_key: str, code: str) -> Optional[str]:
+        return self.entries.get((formatter_key, code))
+
+    def store_formatted(self, formatter_key: str, code: str, formatted: str) -> None:
+        self.entries[(formatter_key, code)] = formatted
+
+
+@requires_generator_dependencies
+class FormattingTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.formatting = load_generator_module("formatting", GENERATOR_DIR / "formatting.py")
+        # Unparsing the released models gives a large, unformatted module, like a rendered template.
+        model_source: str = (ROOT / "release" / "fraudPreventionV2" / "src" / "model.py").read_text(encoding="utf8")
+        cls.rendered = "# Models.\n" + ast.unparse(ast.parse(model_source)) + "\n\n# Aliases.\nAlias = int\n"
+
+    def test_split_top_level(self):
+        code = "import os\n\nX = 1\n\n# Comment.\n@decorator\nclass A:\n    pass\n\ndef f():\n    pass\n"
+
+        self.assertEqual(
+            self.formatting.split_top_level(code, min_lines=1),
+            ["import os\n\nX = 1\n\n", "# Comment.\n@decorator\nclass A:\n    pass\n\n", "def f():\n    pass\n"],
+        )
+        self.assertEqual(self.formatting.split_top_level(code, min_lines=0), [code])
+        self.assertEqual(self.formatting.split_top_level("class (", min_lines=1), ["class ("])
+
+    def test_chunked_formatting_is_byte_identical(self):
+        expected: str = self.formatting.format_chunk(str(ROOT), self.rendered)
+        self.assertGreater(len(self.formatting.split_top_level(self.rendered, min_lines=100)), 10)
+
+        for workers, chunk_lines in ((1, 100), (2, 100), (1, 1)):
+            formatted = self.formatting.format_sources({"model.py": self.rendered}, ROOT, MemoryCache(), "key", workers=workers, chunk_lines=chunk_lines)
+            self.assertEqual(formatted["model.py"], expected, f"workers={workers}, chunk_lines={chunk_lines}")
+
+    def test_cached_chunks_are_reused(self):
+        cache = MemoryCache()
+        first = self.formatting.format_sources({"model.py": self.rendered}, ROOT, cache, "key", workers=1, chunk_lines=100)
+        entries = len(cache.entries)
+
+        changed = self.rendered + "\n\nclass Added:\n  pass\n"
+        second = self.formatting.format_sources({"model.py": changed}, ROOT, cache, "key", workers=1, chunk_lines=100)
+
+        self.assertEqual(len(cache.entries), entries + 1)
+        self.assertTrue(second["model.py"].startswith(first["model.py"].rstrip("\n")))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=True, failfast=True)
@@ -0,0 +1,66 @@
+# Copyright 2022 Expedia, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+from test.generator.client import (
+    GENERATOR_DIR,
+    load_generator_module,
+    requires_generator_dependencies,
+)
+from types import SimpleNamespace
+
+
+def model(class_name: str, base_class: str = "BaseModel", *fields: str) -> SimpleNamespace:
+    return SimpleNamespace(class_name=class_name, base_class=base_class, fields=[SimpleNamespace(name=name) for name in fields])
+
+
+@requires_generator_dependencies
+class ModelGraphTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.model_graph = load_generator_module("model_graph", GENERATOR_DIR / "model_graph.py")
+
+    def setUp(self):
+        self.models = {
+            "Payment": model("Payment", "BaseModel", "method", "amount"),
+            "CreditCard": model("CreditCard", "Payment", "card_number"),
+            "GiftCard": model("GiftCard", "Payment", "pin"),
+            "Root": model("Root", "BaseModel", ""),
+        }
+        self.graph = self.model_graph.ModelGraph(self.models)
+
+    def test_children_are_listed_in_models_order(self):
+        self.assertEqual(self.graph.children_classnames("Payment"), ["CreditCard", "GiftCard"])
+        self.assertEqual(self.graph.children_classnames("CreditCard"), [])
+
+        self.graph.children_classnames("Payment").clear()
+        self.assertEqual(self.graph.children_classnames("Payment"), ["CreditCard", "GiftCard"])
+
+    def test_fields_by_name(self):
+        self.assertEqual([field.name for field in self.graph.fields("Payment", "method")], ["method"])
+        self.assertEqual(self.graph.fields("Payment", "pin"), [])
+
+        self.graph.add_field("Payment", SimpleNamespace(name="method"))
+        self.assertEqual(len(self.graph.fields("Payment", "method")), 2)
+        self.assertEqual(len(self.models["Payment"].fields), 3)
+
+    def test_remove(self):
+        self.graph.remove(["GiftCard", "Root", "Unknown"])
+
+        self.assertEqual(list(self.models.keys()), ["Payment", "CreditCard"])
+        self.assertEqual(self.graph.children_classnames("Payment"), ["CreditCard"])
+        self.assertIsNone(self.graph.model("GiftCard"))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=True, failfast=True)
@@ -0,0 +1,72 @@
+# Copyright 2022 Expedia, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+from test.generator.client import (
+    GENERATOR_DIR,
+    load_generator_module,
+    requires_generator_dependencies,
+)
+from types import SimpleNamespace
+
+
+def model(class_name: str, *references: str, base_class: str = "BaseModel") -> SimpleNamespace:
+    data_types = [SimpleNamespace(reference=SimpleNamespace(short_name=reference)) for reference in references]
+    return SimpleNamespace(class_name=class_name, base_class=base_class, fields=[SimpleNamespace(data_type=SimpleNamespace(all_data_types=data_types))])
+
+
+@requires_generator_dependencies
+class CompactModelsTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # The visitor imports the model graph by its flat name.
+        load_generator_module("model_graph", GENERATOR_DIR / "model_graph.py")
+        cls.models = load_generator_module("models", GENERATOR_DIR / "visitors" / "models.py")
+
+    def compact_models(self, compact_responses: bool = True) -> set[str]:
+        models = {
+            "ScreenResponse": model("ScreenResponse", "Decision", "Details", "Shared"),
+            "Decision": model("Decision", base_class="Enum"),
+            "Details": model("Details", "Reason"),
+            "Reason": model("Reason"),
+            "Shared": model("Shared", "Amount"),
+            "Amount": model("Amount"),
+            "ScreenRequest": model("ScreenRequest", "Shared"),
+            "UpdateResponse": model("UpdateResponse"),
+            "Payment": model("Payment"),
+            "CreditCard": model("CreditCard", base_class="Payment"),
+            "PaymentResponse": model("PaymentResponse", "Payment"),
+            "Account": model("Account", "Profile"),
+            "Profile": model("Profile"),
+        }
+        operations = {name: SimpleNamespace(response=name, request=None) for name in ("ScreenResponse", "UpdateResponse", "PaymentResponse", "Error")}
+        # A model both sent as a request body and returned as a response.
+        operations["Account"] = SimpleNamespace(response="Account", request=SimpleNamespace(name="body", type_hint="Account"))
+        parser = SimpleNamespace(operations=operations, compact_responses=compact_responses)
+        return self.models.get_compact_models(parser, self.models.ModelGraph(models), ["Error", "UpdateResponse"])
+
+    def test_only_response_models_are_compact(self):
+        self.assertEqual(self.compact_models(), {"ScreenResponse", "Details", "Reason", "PaymentResponse"})
+
+    def test_request_bodies_are_not_compact(self):
+        compact: set[str] = self.compact_models()
+
+        self.assertNotIn("Account", compact)
+        self.assertNotIn("Profile", compact)
+
+    def test_disabled(self):
+        self.assertEqual(self.compact_models(compact_responses=False), set())
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=True, failfast=True)
@@ -0,0 +1,108 @@
+# Copyright 2022 Expedia, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+from test.generator.client import (
+    GENERATOR_DIR,
+    load_generator_module,
+    requires_generator_dependencies,
+)
+from types import SimpleNamespace
+from unittest import mock
+
+
+class Model:
+    r"""Stands for a `DataModel`, which the visitors only read the classname and reference path of."""
+
+    def __init__(self, class_name: str, path: str):
+        self.class_name = class_name
+        self.reference = SimpleNamespace(path=path)
+
+    def __repr__(self):
+        return self.class_name
+
+
+def is_non_schema_model(model) -> bool:
+    if not isinstance(model, Model):
+        return False
+    return model.reference.path.startswith("#/paths/") and not model.class_name.endswith(("Request", "Response"))
+
+
+def parse_non_schema_models(results: list) -> list:
+    # The previous implementation, verbatim but for `DataModel`, which rescanned a list of classnames for every model.
+    models: list = list(set(filter(is_non_schema_model, results)))
+
+    models_classnames = [model.class_name for model in models]
+    for index in range(len(models) - 1, -1, -1):
+        model = models[index]
+        if model.class_name[-1].isdigit() or f"{model.class_name}1" in models_classnames:
+            continue
+        models.pop(index)
+        index += 1
+
+    return models
+
+
+@requires_generator_dependencies
+class ModelUtilsTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.operations = load_generator_module("operations", GENERATOR_DIR / "visitors" / "operations.py")
+
+    def setUp(self):
+        patcher = mock.patch.object(self.operations, "DataModel", Model)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def results(self, count: int) -> list:
+        results: list = [Model("Container", "#/components/schemas/Container"), "not a model"]
+        for index in range(count):
+            results.append(Model("Filter" if not index else f"Filter{index}", f"#/paths/items{index}/get"))
+            results.append(Model(f"GetItems{index}Response", f"#/paths/items{index}/get"))
+        results.append(Model("Sort", "#/paths/items0/get"))
+        return results
+
+    def test_parse_non_schema_models(self):
+        results = self.results(20)
+        models = self.operations.ModelUtils.parse_non_schema_models(SimpleNamespace(results=results + results[:5]))
+
+        # The previous order followed set iteration.
+        self.assertEqual(set(models), set(parse_non_schema_models(results)))
+        self.assertEqual([model.class_name for model in models], ["Filter"] + [f"Filter{index}" for index in range(1, 20)])
+
+    def test_clean_unused_models(self):
+        results = self.results(3)
+        parser = SimpleNamespace(results=results)
+
+        self.operations.ModelUtils.clean_unused_models(parser, ["Filter1", "Sort", "Unknown"])
+
+        self.assertIs(parser.results, results)
+        self.assertEqual(
+            [str(result) for result in results],
+            ["Container", "not a model", "Filter", "GetItems0Response", "GetItems1Response", "Filter2", "GetItems2Response"],
+        )
+
+    def test_thousands_of_inline_models(self):
+        results = self.results(20_000)
+        parser = SimpleNamespace(results=results)
+
+        # Scanning lists of classnames took minutes at this size.
+        models = self.operations.ModelUtils.parse_non_schema_models(parser)
+        self.operations.ModelUtils.clean_unused_models(parser, [model.class_name for model in models[1::2]])
+
+        self.assertEqual(len(models), 20_000)
+        self.assertEqual(len(results), 2 + 20_000 + 10_000 + 1)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=True, failfast=True)